@@ -0,0 +1,268 @@
+import csv
+import math
+from array import array
+
+from Snapshot import salvar_colunas, carregar_colunas
+
+# Nomes de coluna reconhecidos na primeira linha de um CSV de arestas (ver carregar_csv)
+NOMES_ORIGEM = {"origem", "de", "source", "from", "u"}
+NOMES_DESTINO = {"destino", "para", "target", "to", "v"}
+
+
+class GrafoCSR:
+    """
+    Grafo em formato CSR (compressed sparse row): os vértices são inteiros
+    0..n-1 e as arestas que saem de u ficam em vizinhos[inicio[u]:inicio[u + 1]],
+    com o peso correspondente em pesos[...]. São três arrays contíguos, sem um
+    objeto por aresta, o que permite carregar milhões de arestas.
+
+    Os rótulos originais (ex.: nome do bairro) ficam em 'rotulos' (id -> rótulo)
+    e 'ids' (rótulo -> id); grafos lidos já numerados não guardam rótulos, e
+    rotulo_de/id_de devolvem o próprio id. Em grafos não direcionados cada aresta aparece nas
+    listas das duas pontas.
+
+    Os algoritmos dos exercícios rodam sobre ele diretamente:
+      - grafo[u] devolve os vizinhos de u e len(grafo) o número de vértices
+        (bfs_lista_adjacencia, bfs, dfs);
+      - grafo.ponderado()[u] devolve [(vizinho, peso), ...] (dijkstra);
+      - grafo.matriz_distancias() devolve a matriz n x n (floyd_warshall).
+    """
+
+    def __init__(self, inicio, vizinhos, pesos, rotulos: list = None, direcionado: bool = False):
+        """
+        :param inicio: array com n + 1 deslocamentos
+        :param vizinhos: array com o destino de cada aresta
+        :param pesos: array com o peso de cada aresta
+        :param rotulos: Rótulo de cada vértice; None usa os próprios ids
+        :param direcionado: Se False, cada aresta já está nas listas das duas pontas
+        """
+        self.inicio = inicio
+        self.vizinhos = vizinhos
+        self.pesos = pesos
+        self.direcionado = direcionado
+        self.rotulos = rotulos
+        self.ids = {rotulo: vertice for vertice, rotulo in enumerate(rotulos)} if rotulos is not None else None
+
+    @classmethod
+    def from_arestas(cls, arestas, direcionado: bool = False) -> "GrafoCSR":
+        """
+        Cria o grafo a partir de tuplas (origem, destino) ou (origem, destino, peso)
+        com rótulos quaisquer; o peso padrão é 1. Os ids são atribuídos na ordem em
+        que os rótulos aparecem, e os vizinhos de cada vértice ficam na ordem das arestas.
+        """
+        ids = {}
+        rotulos = []
+        origens = array("q")
+        destinos = array("q")
+        pesos = array("d")
+        pesos_inteiros = True
+        for aresta in arestas:
+            extremos = []
+            for rotulo in aresta[:2]:
+                vertice = ids.get(rotulo)
+                if vertice is None:
+                    vertice = ids[rotulo] = len(rotulos)
+                    rotulos.append(rotulo)
+                extremos.append(vertice)
+            peso = aresta[2] if len(aresta) > 2 else 1
+            if pesos_inteiros and not isinstance(peso, int):
+                pesos_inteiros = False
+            origens.append(extremos[0])
+            destinos.append(extremos[1])
+            pesos.append(peso)
+
+        if pesos_inteiros:
+            pesos = array("q", (int(peso) for peso in pesos))
+        return cls.from_ids(origens, destinos, pesos, len(rotulos), direcionado, rotulos)
+
+    @classmethod
+    def from_ids(cls, origens, destinos, pesos, quantidade_vertices: int, direcionado: bool = False,
+                 rotulos: list = None) -> "GrafoCSR":
+        """
+        Monta o CSR a partir de arestas já numeradas (arrays paralelos), com uma
+        ordenação por contagem estável: conta o grau de cada vértice, acumula os
+        deslocamentos e distribui as arestas, tudo em O(n + m).
+        """
+        grau = [0] * (quantidade_vertices + 1)
+        for origem in origens:
+            grau[origem + 1] += 1
+        if not direcionado:
+            for destino in destinos:
+                grau[destino + 1] += 1
+        for vertice in range(quantidade_vertices):
+            grau[vertice + 1] += grau[vertice]
+        inicio = array("q", grau)
+
+        total = inicio[-1]
+        vizinhos = array("q", bytes(8 * total))
+        pesos_csr = array(pesos.typecode, bytes(pesos.itemsize * total))
+        proxima = grau[:-1]
+        for origem, destino, peso in zip(origens, destinos, pesos):
+            posicao = proxima[origem]
+            vizinhos[posicao] = destino
+            pesos_csr[posicao] = peso
+            proxima[origem] = posicao + 1
+            if not direcionado:
+                posicao = proxima[destino]
+                vizinhos[posicao] = origem
+                pesos_csr[posicao] = peso
+                proxima[destino] = posicao + 1
+        return cls(inicio, vizinhos, pesos_csr, rotulos, direcionado)
+
+    @classmethod
+    def carregar_csv(cls, caminho: str, direcionado: bool = False, delimitador: str = ",",
+                     cabecalho: bool = None) -> "GrafoCSR":
+        """
+        Lê uma lista de arestas em CSV, uma por linha: origem, destino[, peso].
+        Pesos inteiros continuam inteiros; os demais viram float.
+
+        :param cabecalho: True se a primeira linha é cabeçalho, False se já é uma
+                          aresta; None detecta pela primeira linha, com 2 ou 3
+                          colunas: é cabeçalho se origem e destino forem nomes
+                          conhecidos de coluna (ex.: "origem,destino",
+                          "source,target") ou se o peso não for numérico
+        """
+        def converter(texto: str):
+            try:
+                return int(texto)
+            except ValueError:
+                return float(texto)
+
+        def eh_cabecalho(linha: list) -> bool:
+            if (linha[0].strip().lower() in NOMES_ORIGEM
+                    and linha[1].strip().lower() in NOMES_DESTINO):
+                return True
+            if len(linha) < 3:
+                return False
+            try:
+                converter(linha[2])
+            except ValueError:
+                return True
+            return False
+
+        def arestas():
+            with open(caminho, newline="", encoding="utf-8") as arquivo:
+                primeira = True
+                for linha in csv.reader(arquivo, delimiter=delimitador):
+                    if not linha:
+                        continue
+                    if primeira:
+                        primeira = False
+                        if cabecalho or (cabecalho is None and eh_cabecalho(linha)):
+                            continue
+                    if len(linha) < 3:
+                        yield linha[0], linha[1]
+                    else:
+                        yield linha[0], linha[1], converter(linha[2])
+
+        return cls.from_arestas(arestas(), direcionado)
+
+    def salvar_binario(self, caminho: str):
+        """
+        Grava os arrays do CSR (e os rótulos) no formato de colunas do Snapshot,
+        que carregar_binario lê sem reconstruir nada.
+        """
+        salvar_colunas(caminho, {"direcionado": self.direcionado, "rotulos": self.rotulos},
+                       {"inicio": self.inicio, "vizinhos": self.vizinhos, "pesos": self.pesos})
+
+    @staticmethod
+    def salvar_lista_arestas(caminho: str, origens, destinos, pesos=None, quantidade_vertices: int = None,
+                             direcionado: bool = False):
+        """
+        Grava uma lista de arestas numeradas em binário (colunas origens/destinos/pesos),
+        para ser lida por carregar_binario.
+        """
+        if pesos is None:
+            pesos = array("q", [1]) * len(origens)
+        elif not isinstance(pesos, array):
+            pesos = array("d", pesos)
+        if quantidade_vertices is None:
+            quantidade_vertices = max(max(origens, default=-1), max(destinos, default=-1)) + 1
+        salvar_colunas(caminho, {"direcionado": direcionado, "quantidade_vertices": quantidade_vertices},
+                       {"origens": array("q", origens), "destinos": array("q", destinos), "pesos": pesos})
+
+    @classmethod
+    def carregar_binario(cls, caminho: str) -> "GrafoCSR":
+        """
+        Lê um arquivo gravado por salvar_binario (o CSR pronto, copiado em blocos)
+        ou por salvar_lista_arestas (arestas numeradas, convertidas para CSR).
+        """
+        metadados, colunas = carregar_colunas(caminho)
+        if "inicio" in colunas:
+            return cls(colunas["inicio"], colunas["vizinhos"], colunas["pesos"],
+                       metadados["rotulos"], metadados["direcionado"])
+        return cls.from_ids(colunas["origens"], colunas["destinos"], colunas["pesos"],
+                            metadados["quantidade_vertices"], metadados["direcionado"])
+
+    def id_de(self, rotulo) -> int:
+        return self.ids[rotulo] if self.ids is not None else rotulo
+
+    def rotulo_de(self, vertice: int):
+        return self.rotulos[vertice] if self.rotulos is not None else vertice
+
+    def grau(self, vertice: int) -> int:
+        return self.inicio[vertice + 1] - self.inicio[vertice]
+
+    def quantidade_arestas(self) -> int:
+        """
+        Número de arestas (em grafos não direcionados, cada uma conta uma vez).
+        """
+        total = len(self.vizinhos)
+        return total if self.direcionado else total // 2
+
+    def existe_aresta(self, origem: int, destino: int) -> bool:
+        return destino in self[origem]
+
+    def __getitem__(self, vertice: int):
+        """
+        Vizinhos do vértice (fatia do array de vizinhos).
+        """
+        return self.vizinhos[self.inicio[vertice]:self.inicio[vertice + 1]]
+
+    def __len__(self) -> int:
+        return len(self.inicio) - 1
+
+    def __iter__(self):
+        return iter(range(len(self)))
+
+    def ponderado(self) -> "ListaPonderada":
+        """
+        Visão em que visao[u] devolve [(vizinho, peso), ...], no formato esperado pelo dijkstra.
+        """
+        return ListaPonderada(self)
+
+    def matriz_distancias(self, sem_aresta=math.inf) -> list:
+        """
+        Matriz n x n com o menor peso de cada aresta, 0 na diagonal e 'sem_aresta'
+        onde não há ligação. Ocupa O(n²): serve para grafos pequenos (floyd_warshall).
+        """
+        n = len(self)
+        matriz = [[sem_aresta] * n for _ in range(n)]
+        for origem in range(n):
+            linha = matriz[origem]
+            linha[origem] = 0
+            for posicao in range(self.inicio[origem], self.inicio[origem + 1]):
+                destino = self.vizinhos[posicao]
+                if self.pesos[posicao] < linha[destino]:
+                    linha[destino] = self.pesos[posicao]
+        return matriz
+
+
+class ListaPonderada:
+    """
+    Visão de um GrafoCSR com a interface {vértice: [(vizinho, peso), ...]}.
+    """
+
+    def __init__(self, grafo: GrafoCSR):
+        self.grafo = grafo
+
+    def __getitem__(self, vertice: int) -> list:
+        inicio = self.grafo.inicio[vertice]
+        fim = self.grafo.inicio[vertice + 1]
+        return list(zip(self.grafo.vizinhos[inicio:fim], self.grafo.pesos[inicio:fim]))
+
+    def __len__(self) -> int:
+        return len(self.grafo)
+
+    def __iter__(self):
+        return iter(self.grafo)
@@ -0,0 +1,187 @@
+class HeapDAria:
+    def __init__(self, aridade: int = 2, chaves=None, ids=None, dados=None, posicoes=None):
+        """
+        Motor de heap mínima d-ária compartilhado pelas filas de processos (Ex1)
+        e de pacotes (Ex2).
+
+        Cada entrada é formada por três colunas paralelas:
+          - chaves: valor usado na ordenação (menor = mais urgente)
+          - ids: identificador único da entrada
+          - dados: carga útil (o próprio objeto ou um campo dele)
+        e um índice 'posicoes' (id -> posição na heap) atualizado a cada
+        movimento, o que permite localizar qualquer entrada em O(1).
+
+        As colunas podem ser listas ou arrays tipados (modo compacto) e o
+        índice pode ser um dict ou uma TabelaPosicoes; o motor só usa
+        indexação, append/pop e fatiamento.
+
+        :param aridade: Número de filhos por nó (2 = heap binária). Aridades
+                        maiores deixam a árvore mais rasa, barateando
+                        inserções e reduções de chave, ao custo de mais
+                        comparações por nível na descida.
+        """
+        if aridade < 2:
+            raise ValueError("A aridade da heap deve ser pelo menos 2.")
+        self.aridade = aridade
+        self.chaves = [] if chaves is None else chaves
+        self.ids = [] if ids is None else ids
+        self.dados = [] if dados is None else dados
+        self.posicoes = {} if posicoes is None else posicoes
+
+    def _subir_no_heap(self, indice: int):
+        """
+        Ajusta o heap de baixo para cima.
+        Em vez de trocar a cada nível, abre um "buraco" e desce os pais
+        até achar o lugar da entrada, gravando-a uma única vez.
+        """
+        chaves, ids, dados, posicoes = self.chaves, self.ids, self.dados, self.posicoes
+        aridade = self.aridade
+        chave, id_entrada, dado = chaves[indice], ids[indice], dados[indice]
+
+        while indice > 0:
+            indice_pai = (indice - 1) // aridade
+            chave_pai = chaves[indice_pai]
+            if chave < chave_pai:
+                id_pai = ids[indice_pai]
+                chaves[indice] = chave_pai
+                ids[indice] = id_pai
+                dados[indice] = dados[indice_pai]
+                posicoes[id_pai] = indice
+                indice = indice_pai
+            else:
+                break
+
+        chaves[indice] = chave
+        ids[indice] = id_entrada
+        dados[indice] = dado
+        posicoes[id_entrada] = indice
+
+    def _descer_no_heap(self, indice: int):
+        """
+        Ajusta o heap de cima para baixo, subindo o menor filho para o
+        "buraco" enquanto ele for menor que a entrada.
+        """
+        chaves, ids, dados, posicoes = self.chaves, self.ids, self.dados, self.posicoes
+        aridade = self.aridade
+        tamanho = len(chaves)
+        chave, id_entrada, dado = chaves[indice], ids[indice], dados[indice]
+        obter_chave = chaves.__getitem__
+
+        while True:
+            primeiro_filho = aridade * indice + 1
+            if primeiro_filho >= tamanho:
+                break
+
+            # Menor entre os (até) d filhos; em empate vence o mais à esquerda
+            indice_menor = min(range(primeiro_filho, min(primeiro_filho + aridade, tamanho)),
+                               key=obter_chave)
+            chave_menor = chaves[indice_menor]
+            if chave_menor < chave:
+                id_menor = ids[indice_menor]
+                chaves[indice] = chave_menor
+                ids[indice] = id_menor
+                dados[indice] = dados[indice_menor]
+                posicoes[id_menor] = indice
+                indice = indice_menor
+            else:
+                break
+
+        chaves[indice] = chave
+        ids[indice] = id_entrada
+        dados[indice] = dado
+        posicoes[id_entrada] = indice
+
+    def construir(self):
+        """
+        Reorganiza todas as colunas em heap de baixo para cima (Floyd), em O(n).
+        """
+        # Folhas já são heaps; descemos cada nó interno, do último ao primeiro
+        for indice in range((len(self.chaves) - 2) // self.aridade, -1, -1):
+            self._descer_no_heap(indice)
+
+    def acrescentar(self, chave, id_entrada, dado):
+        """
+        Acrescenta uma entrada ao final das colunas, sem ajustar a heap.
+        Use 'ajustar_lote' depois de acrescentar um lote.
+        """
+        self.posicoes[id_entrada] = len(self.ids)
+        self.chaves.append(chave)
+        self.ids.append(id_entrada)
+        self.dados.append(dado)
+
+    def ajustar_lote(self, inicio: int):
+        """
+        Restaura a heap após acrescentar as entradas a partir de 'inicio'.
+        Lote pequeno: sobe cada nova entrada (O(k log n)).
+        Lote grande: reconstrói tudo de baixo para cima (O(n + k)).
+        """
+        if len(self.ids) - inicio < inicio:
+            for indice in range(inicio, len(self.ids)):
+                self._subir_no_heap(indice)
+        else:
+            self.construir()
+
+    def desfazer_ate(self, tamanho: int):
+        """
+        Descarta as entradas acrescentadas após 'tamanho' (ainda fora da ordem de heap).
+        """
+        for id_entrada in self.ids[tamanho:]:
+            del self.posicoes[id_entrada]
+        del self.chaves[tamanho:]
+        del self.ids[tamanho:]
+        del self.dados[tamanho:]
+
+    def inserir(self, chave, id_entrada, dado):
+        """
+        Insere uma entrada em O(log_d n). O id não pode estar na heap.
+        """
+        self.acrescentar(chave, id_entrada, dado)
+        self._subir_no_heap(len(self.ids) - 1)
+
+    def remover_na_posicao(self, indice: int) -> tuple:
+        """
+        Remove a entrada que está em 'indice', restaura a heap e retorna
+        a tupla (chave, id, dado) removida.
+        """
+        chaves, ids, dados = self.chaves, self.ids, self.dados
+        removida = (chaves[indice], ids[indice], dados[indice])
+        chave_ultima, id_ultima, dado_ultima = chaves.pop(), ids.pop(), dados.pop()
+        del self.posicoes[removida[1]]
+
+        # A última entrada ocupa o lugar da removida e sobe ou desce conforme a chave
+        if indice < len(ids):
+            chaves[indice] = chave_ultima
+            ids[indice] = id_ultima
+            dados[indice] = dado_ultima
+            self.posicoes[id_ultima] = indice
+            if chave_ultima < removida[0]:
+                self._subir_no_heap(indice)
+            else:
+                self._descer_no_heap(indice)
+
+        return removida
+
+    def atualizar_chave(self, indice: int, nova_chave):
+        """
+        Troca a chave da entrada em 'indice' e a reposiciona em O(log_d n).
+        """
+        chave_antiga = self.chaves[indice]
+        self.chaves[indice] = nova_chave
+
+        # Só é preciso andar em uma direção: sobe se ficou mais urgente, desce caso contrário
+        if nova_chave < chave_antiga:
+            self._subir_no_heap(indice)
+        elif chave_antiga < nova_chave:
+            self._descer_no_heap(indice)
+
+    def posicao(self, id_entrada):
+        """
+        Retorna a posição atual da entrada ou None se ela não estiver na heap.
+        """
+        return self.posicoes.get(id_entrada)
+
+    def __contains__(self, id_entrada) -> bool:
+        return id_entrada in self.posicoes
+
+    def __len__(self):
+        return len(self.ids)
@@ -0,0 +1,72 @@
+import time
+
+
+class MetricasFila:
+    def __init__(self):
+        """
+        Contadores de uma fila de prioridade, lidos sem passar pelo stdout:
+          - quantidade de operações por tipo e vazão (operações/s)
+          - maior profundidade já atingida pela fila (high-water mark)
+          - distribuição da latência das operações na heap
+
+        A latência é guardada num histograma de potências de 2 (em ns): cada
+        registro custa O(1) e a memória é constante, com percentis exatos até
+        um fator 2.
+        """
+        self.reiniciar()
+
+    def reiniciar(self):
+        """
+        Zera todos os contadores e recomeça a contagem de tempo.
+        """
+        self.operacoes = {}
+        self.total_operacoes = 0
+        self.profundidade_maxima = 0
+        self._histograma = [0] * 64
+        self._latencia_total_ns = 0
+        self._latencia_maxima_ns = 0
+        self._inicio = time.perf_counter()
+
+    def registrar(self, operacao: str, duracao_ns: int, profundidade: int):
+        """
+        Contabiliza uma operação que levou 'duracao_ns' e deixou a fila com 'profundidade' itens.
+        """
+        self.operacoes[operacao] = self.operacoes.get(operacao, 0) + 1
+        self.total_operacoes += 1
+        if profundidade > self.profundidade_maxima:
+            self.profundidade_maxima = profundidade
+        self._histograma[min(duracao_ns.bit_length(), 63)] += 1
+        self._latencia_total_ns += duracao_ns
+        if duracao_ns > self._latencia_maxima_ns:
+            self._latencia_maxima_ns = duracao_ns
+
+    def percentil_latencia_ns(self, percentual: float) -> int:
+        """
+        Limite superior (potência de 2, em ns) da latência no percentil pedido.
+        """
+        if not self.total_operacoes:
+            return 0
+        alvo = self.total_operacoes * percentual / 100
+        acumulado = 0
+        for expoente, quantidade in enumerate(self._histograma):
+            acumulado += quantidade
+            if acumulado >= alvo:
+                return min(1 << expoente, self._latencia_maxima_ns)
+        return self._latencia_maxima_ns
+
+    def resumo(self) -> dict:
+        """
+        Retorna um retrato dos contadores.
+        """
+        decorrido = time.perf_counter() - self._inicio
+        return {
+            "operacoes": dict(self.operacoes),
+            "total_operacoes": self.total_operacoes,
+            "operacoes_por_segundo": self.total_operacoes / decorrido if decorrido else 0.0,
+            "profundidade_maxima": self.profundidade_maxima,
+            "latencia_media_ns": (self._latencia_total_ns / self.total_operacoes
+                                  if self.total_operacoes else 0.0),
+            "latencia_p50_ns": self.percentil_latencia_ns(50),
+            "latencia_p99_ns": self.percentil_latencia_ns(99),
+            "latencia_maxima_ns": self._latencia_maxima_ns,
+        }
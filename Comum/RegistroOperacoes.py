@@ -0,0 +1,119 @@
+import os
+import struct
+
+from Snapshot import salvar_colunas, carregar_colunas
+
+# Códigos das operações registradas (MARCO só preserva a sequência após um truncamento).
+# Remoções são gravadas como REMOVER_ID, uma por entrada; REMOVER_TOPO e REMOVER_LOTE
+# dependiam do desempate da heap e só são lidos de logs antigos.
+MARCO = 0
+INSERIR = 1
+REMOVER_TOPO = 2
+REMOVER_ID = 3
+ATUALIZAR = 4
+REMOVER_LOTE = 5
+
+# sequência, operação, id (ou quantidade em REMOVER_LOTE), prioridade, tempo
+REGISTRO = struct.Struct("<QBqqd")
+
+
+class RegistroOperacoes:
+    def __init__(self, caminho: str, sincronizar: bool = False):
+        """
+        Log binário, apenas de acréscimo, das operações que alteram uma fila.
+        Cada registro tem tamanho fixo e um número de sequência crescente;
+        o snapshot guarda a última sequência que já contém, de modo que na
+        recuperação só são reaplicados os registros posteriores a ele.
+
+        :param caminho: Arquivo do log (criado se não existir)
+        :param sincronizar: Se True, faz fsync a cada registro (mais durável, mais lento)
+        """
+        self.caminho = caminho
+        self.sincronizar = sincronizar
+        self._arquivo = open(caminho, "ab")
+        self.sequencia = self._ultima_sequencia()
+
+    def _ultima_sequencia(self) -> int:
+        """
+        Lê apenas o último registro completo do arquivo, em O(1).
+        """
+        registros_completos = os.path.getsize(self.caminho) // REGISTRO.size
+        if not registros_completos:
+            return 0
+        with open(self.caminho, "rb") as arquivo:
+            arquivo.seek((registros_completos - 1) * REGISTRO.size)
+            return REGISTRO.unpack(arquivo.read(REGISTRO.size))[0]
+
+    def registrar(self, operacao: int, id_entrada: int = 0, prioridade: int = 0, tempo: float = 0.0):
+        """
+        Acrescenta uma operação ao log.
+        """
+        self.sequencia += 1
+        self._arquivo.write(REGISTRO.pack(self.sequencia, operacao, id_entrada, prioridade, tempo))
+        self._arquivo.flush()
+        if self.sincronizar:
+            os.fsync(self._arquivo.fileno())
+
+    def truncar(self):
+        """
+        Esvazia o log (após um snapshot), deixando só um registro MARCO com a
+        sequência atual: ao reabrir o arquivo depois de um reinício, a numeração
+        continua de onde parou em vez de voltar a 0, e as operações seguintes
+        não ficam com sequências já cobertas pelo snapshot.
+        """
+        self._arquivo.truncate(0)
+        self._arquivo.write(REGISTRO.pack(self.sequencia, MARCO, 0, 0, 0.0))
+        self._arquivo.flush()
+        if self.sincronizar:
+            os.fsync(self._arquivo.fileno())
+
+    def fechar(self):
+        self._arquivo.close()
+
+    @staticmethod
+    def ler(caminho: str, apos_sequencia: int = 0):
+        """
+        Gera as tuplas (sequencia, operacao, id, prioridade, tempo) com
+        sequência maior que 'apos_sequencia', sem os registros MARCO. Um
+        registro incompleto no final (escrita interrompida por uma queda) é ignorado.
+        """
+        if not os.path.exists(caminho):
+            return
+        with open(caminho, "rb") as arquivo:
+            conteudo = arquivo.read()
+        conteudo = conteudo[:len(conteudo) - len(conteudo) % REGISTRO.size]
+        for registro in REGISTRO.iter_unpack(conteudo):
+            if registro[0] > apos_sequencia and registro[1] != MARCO:
+                yield registro
+
+
+def salvar_snapshot(caminho: str, metadados: dict, colunas: dict, registro: RegistroOperacoes = None):
+    """
+    Grava o snapshot das colunas de uma fila junto com a última sequência do
+    log (0 sem log) e, com log ativo, esvazia o log.
+    """
+    metadados["sequencia"] = registro.sequencia if registro is not None else 0
+    salvar_colunas(caminho, metadados, colunas)
+    if registro is not None:
+        registro.truncar()
+
+
+def carregar_snapshot(caminho: str = None, registro: RegistroOperacoes = None) -> tuple:
+    """
+    Lê o snapshot (se informado) e as operações do log posteriores a ele.
+    A sequência do registro passa a ser pelo menos a do snapshot, para que
+    as próximas operações registradas não sejam descartadas na próxima
+    recuperação (ex.: se o log foi perdido ou recriado).
+
+    :return: (metadados, colunas, operacoes); metadados e colunas são None sem
+             snapshot, e operacoes gera as tuplas de RegistroOperacoes.ler
+    """
+    metadados = colunas = None
+    sequencia = 0
+    if caminho is not None:
+        metadados, colunas = carregar_colunas(caminho)
+        sequencia = metadados["sequencia"]
+    if registro is None:
+        return metadados, colunas, iter(())
+    registro.sequencia = max(registro.sequencia, sequencia)
+    return metadados, colunas, RegistroOperacoes.ler(registro.caminho, sequencia)
@@ -0,0 +1,102 @@
+import json
+import mmap
+import os
+import sys
+from array import array
+
+ASSINATURA = b"SNAPHEAP"
+
+
+def salvar_colunas(caminho: str, metadados: dict, colunas: dict):
+    """
+    Grava colunas (arrays tipados) num arquivo binário compacto:
+      assinatura (8 bytes) | tamanho do cabeçalho (8 bytes) | cabeçalho JSON |
+      bytes de cada coluna, alinhados a 8 bytes
+    O arquivo é escrito num temporário e renomeado no final, então um
+    snapshot interrompido nunca substitui o anterior.
+
+    :param metadados: Dicionário serializável em JSON guardado junto às colunas
+    :param colunas: Dicionário nome -> array
+    """
+    descricao = {}
+    deslocamento = 0
+    for nome, coluna in colunas.items():
+        tamanho = len(coluna) * coluna.itemsize
+        descricao[nome] = {"tipo": coluna.typecode, "inicio": deslocamento, "bytes": tamanho}
+        deslocamento += tamanho + (-tamanho % 8)
+
+    cabecalho = json.dumps({"metadados": metadados, "colunas": descricao,
+                            "ordem_bytes": sys.byteorder}).encode()
+    cabecalho += b" " * (-len(cabecalho) % 8)
+
+    temporario = caminho + ".tmp"
+    with open(temporario, "wb") as arquivo:
+        arquivo.write(ASSINATURA)
+        arquivo.write(len(cabecalho).to_bytes(8, "little"))
+        arquivo.write(cabecalho)
+        for coluna in colunas.values():
+            coluna.tofile(arquivo)
+            arquivo.write(b"\0" * (-(len(coluna) * coluna.itemsize) % 8))
+        arquivo.flush()
+        os.fsync(arquivo.fileno())
+    os.replace(temporario, caminho)
+
+
+def _ler_cabecalho(mapa, caminho: str) -> tuple:
+    """
+    Valida a assinatura e retorna (cabecalho, deslocamento onde começam as colunas).
+    """
+    if mapa[:len(ASSINATURA)] != ASSINATURA:
+        raise ValueError(f"{caminho} não é um snapshot.")
+    tamanho_cabecalho = int.from_bytes(mapa[8:16], "little")
+    cabecalho = json.loads(mapa[16:16 + tamanho_cabecalho])
+    return cabecalho, 16 + tamanho_cabecalho
+
+
+def carregar_colunas(caminho: str) -> tuple:
+    """
+    Lê um arquivo gravado por salvar_colunas e retorna (metadados, colunas).
+    O arquivo é mapeado em memória (mmap) e cada coluna é copiada de uma vez
+    para o seu array, sem processar entrada por entrada.
+    Lança ValueError se o arquivo não for um snapshot.
+    """
+    with open(caminho, "rb") as arquivo, \
+            mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        cabecalho, base = _ler_cabecalho(mapa, caminho)
+
+        colunas = {}
+        with memoryview(mapa) as visao:
+            for nome, descricao in cabecalho["colunas"].items():
+                inicio = base + descricao["inicio"]
+                coluna = array(descricao["tipo"])
+                with visao[inicio:inicio + descricao["bytes"]] as trecho:
+                    coluna.frombytes(trecho)
+                if cabecalho["ordem_bytes"] != sys.byteorder:
+                    coluna.byteswap()
+                colunas[nome] = coluna
+
+    return cabecalho["metadados"], colunas
+
+
+def mapear_colunas(caminho: str) -> tuple:
+    """
+    Como carregar_colunas, mas sem copiar nada: cada coluna é uma memoryview
+    somente leitura sobre o arquivo mapeado em memória. Processos que mapeiam
+    o mesmo arquivo compartilham as páginas pelo cache do sistema operacional,
+    e o mapeamento dura enquanto alguma coluna estiver referenciada.
+    Lança ValueError se o arquivo não for um snapshot ou tiver sido gravado
+    numa máquina com outra ordem de bytes.
+    """
+    with open(caminho, "rb") as arquivo:
+        mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+    cabecalho, base = _ler_cabecalho(mapa, caminho)
+    if cabecalho["ordem_bytes"] != sys.byteorder:
+        mapa.close()
+        raise ValueError(f"{caminho} foi gravado com ordem de bytes {cabecalho['ordem_bytes']}.")
+
+    visao = memoryview(mapa)
+    colunas = {}
+    for nome, descricao in cabecalho["colunas"].items():
+        inicio = base + descricao["inicio"]
+        colunas[nome] = visao[inicio:inicio + descricao["bytes"]].cast(descricao["tipo"])
+    return cabecalho["metadados"], colunas
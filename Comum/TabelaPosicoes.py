@@ -0,0 +1,132 @@
+from array import array
+
+# Marca de posição livre na tabela: não pode ser usada como chave (as heaps
+# compactas recusam este id)
+VAZIO = -(2 ** 63)
+
+# Constante de Fibonacci para espalhar ids sequenciais pela tabela
+_MULTIPLICADOR = 0x9E3779B97F4A7C15
+_MASCARA_64 = 0xFFFFFFFFFFFFFFFF
+
+
+class TabelaPosicoes:
+    def __init__(self, capacidade_inicial: int = 8):
+        """
+        Tabela hash compacta que mapeia id (inteiro) -> posição (inteiro).
+        Usa endereçamento aberto com sondagem linear sobre dois arrays
+        tipados, gastando cerca de 32 bytes por entrada em vez dos ~100
+        de um dicionário (que guarda objetos int para chave e valor).
+        Oferece o subconjunto da interface de dict usado pelas heaps.
+        """
+        bits = 3
+        while (1 << bits) < 2 * capacidade_inicial:
+            bits += 1
+        self._alocar(bits)
+
+    def _alocar(self, bits: int):
+        self._bits = bits
+        self._mascara = (1 << bits) - 1
+        self._deslocamento = 64 - bits
+        self._chaves = array('q', [VAZIO]) * (1 << bits)
+        self._valores = array('q', [0]) * (1 << bits)
+        self._quantidade = 0
+
+    @classmethod
+    def importar(cls, chaves: array, valores: array, quantidade: int) -> "TabelaPosicoes":
+        """
+        Recria a tabela a partir dos arrays retornados por 'exportar' e do
+        número de chaves guardadas, sem reinserir as chaves.
+        """
+        tabela = cls.__new__(cls)
+        tabela._bits = len(chaves).bit_length() - 1
+        tabela._mascara = len(chaves) - 1
+        tabela._deslocamento = 64 - tabela._bits
+        tabela._chaves = chaves
+        tabela._valores = valores
+        tabela._quantidade = quantidade
+        return tabela
+
+    def exportar(self) -> tuple:
+        """
+        Retorna os arrays internos (chaves, valores), por exemplo para gravação em snapshot.
+        """
+        return self._chaves, self._valores
+
+    def _posicao_ideal(self, chave: int) -> int:
+        return ((chave * _MULTIPLICADOR) & _MASCARA_64) >> self._deslocamento
+
+    def _localizar(self, chave: int) -> int:
+        """
+        Retorna o slot onde a chave está ou o slot livre onde ela entraria.
+        """
+        chaves = self._chaves
+        mascara = self._mascara
+        slot = self._posicao_ideal(chave)
+        while True:
+            atual = chaves[slot]
+            if atual == chave or atual == VAZIO:
+                return slot
+            slot = (slot + 1) & mascara
+
+    def _redimensionar(self):
+        chaves_antigas, valores_antigos = self._chaves, self._valores
+        self._alocar(self._bits + 1)
+        for chave, valor in zip(chaves_antigas, valores_antigos):
+            if chave != VAZIO:
+                slot = self._localizar(chave)
+                self._chaves[slot] = chave
+                self._valores[slot] = valor
+                self._quantidade += 1
+
+    def get(self, chave: int, padrao=None):
+        slot = self._localizar(chave)
+        if self._chaves[slot] == VAZIO:
+            return padrao
+        return self._valores[slot]
+
+    def __getitem__(self, chave: int) -> int:
+        slot = self._localizar(chave)
+        if self._chaves[slot] == VAZIO:
+            raise KeyError(chave)
+        return self._valores[slot]
+
+    def __setitem__(self, chave: int, valor: int):
+        slot = self._localizar(chave)
+        if self._chaves[slot] == VAZIO:
+            # Mantém a ocupação abaixo de 50% para sondagens curtas
+            if 2 * (self._quantidade + 1) > len(self._chaves):
+                self._redimensionar()
+                slot = self._localizar(chave)
+            self._chaves[slot] = chave
+            self._quantidade += 1
+        self._valores[slot] = valor
+
+    def __delitem__(self, chave: int):
+        chaves, valores, mascara = self._chaves, self._valores, self._mascara
+        livre = self._localizar(chave)
+        if chaves[livre] == VAZIO:
+            raise KeyError(chave)
+
+        # Remoção com deslocamento para trás: puxa para o buraco as chaves
+        # seguintes da mesma sequência de sondagem, dispensando lápides
+        slot = livre
+        while True:
+            slot = (slot + 1) & mascara
+            atual = chaves[slot]
+            if atual == VAZIO:
+                break
+            ideal = self._posicao_ideal(atual)
+            # A chave só pode ocupar o buraco se o seu slot ideal não estiver
+            # (circularmente) entre o buraco e a posição atual
+            if (slot - ideal) & mascara >= (slot - livre) & mascara:
+                chaves[livre] = atual
+                valores[livre] = valores[slot]
+                livre = slot
+        chaves[livre] = VAZIO
+        self._quantidade -= 1
+
+    def __contains__(self, chave: int) -> bool:
+        return self._chaves[self._localizar(chave)] != VAZIO
+
+    def __len__(self):
+        return self._quantidade
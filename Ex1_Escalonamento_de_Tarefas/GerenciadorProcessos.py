@@ -1,37 +1,243 @@
+import os
+import sys
+from itertools import chain
+from time import perf_counter_ns
+
 from Processo import Processo
 from HeapProcessos import HeapProcessos
+from HeapProcessosCompacta import HeapProcessosCompacta
+from SimuladorEscalonamento import simular_escalonamento
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Comum"))
+from MetricasFila import MetricasFila
+from RegistroOperacoes import (RegistroOperacoes, INSERIR, REMOVER_TOPO, REMOVER_ID,
+                               ATUALIZAR, REMOVER_LOTE, salvar_snapshot, carregar_snapshot)
+
+# Mensagens exibidas para cada evento quando não há observador
+MENSAGENS = {
+    "processo_adicionado": "Processo {id_processo} adicionado com prioridade {prioridade}.",
+    "lote_adicionado": "{quantidade} processos adicionados em lote.",
+    "processo_executado": "Executando processo {id_processo} (Prioridade {prioridade}).",
+    "fila_vazia": "Nenhum processo para executar.",
+    "lote_executado": "{quantidade} processos executados em lote.",
+    "prioridade_alterada": "Prioridade do processo {id_processo} foi alterada para {prioridade}.",
+    "processo_removido": "Processo {id_processo} removido da fila.",
+    "processo_nao_encontrado": "Processo {id_processo} não encontrado.",
+    "simulacao_concluida": ("Simulação concluída: {processos_concluidos} processos em "
+                            "{duracao} unidades de tempo."),
+    "snapshot_salvo": "Snapshot com {quantidade} processos salvo em {caminho}.",
+    "estado_restaurado": ("Fila restaurada com {quantidade} processos "
+                          "({reaplicadas} operações reaplicadas do log)."),
+}
 
 
 class GerenciadorProcessos:
-    def __init__(self):
-        self.heap_processos = HeapProcessos()
+    def __init__(self, compacta: bool = False, aridade: int = 2, observador=None,
+                 silencioso: bool = False, coletar_metricas: bool = False,
+                 registro: str = None, sincronizar_registro: bool = False):
+        """
+        :param compacta: Se True, usa a heap em colunas de arrays (HeapProcessosCompacta),
+                         que gasta bem menos memória por processo na fila
+        :param aridade: Número de filhos por nó da heap (2 = binária)
+        :param observador: Função chamada como observador(evento, dados) a cada operação,
+                           no lugar do print (ex.: para enviar a um logger)
+        :param silencioso: Se True e sem observador, nenhuma mensagem é exibida
+        :param coletar_metricas: Se True, 'metricas' acumula contagem de operações,
+                                 profundidade máxima e latência das operações na heap
+        :param registro: Caminho de um log de operações (apenas acréscimo) usado para
+                         recuperar a fila entre snapshots (ver 'restaurar')
+        :param sincronizar_registro: Se True, faz fsync do log a cada operação
+        """
+        classe_heap = HeapProcessosCompacta if compacta else HeapProcessos
+        self.aridade = aridade
+        self.heap_processos = classe_heap(aridade)
+        self.observador = observador
+        self.silencioso = silencioso
+        self.metricas = MetricasFila() if coletar_metricas else None
+        self.registro = RegistroOperacoes(registro, sincronizar_registro) if registro else None
+
+    def _notificar(self, evento: str, **dados):
+        """
+        Entrega o evento ao observador ou, na falta dele, imprime a mensagem
+        correspondente (exceto no modo silencioso).
+        """
+        if self.observador is not None:
+            self.observador(evento, dados)
+        elif not self.silencioso:
+            print(MENSAGENS[evento].format(**dados))
+
+    def _operar(self, operacao: str, funcao, *argumentos):
+        """
+        Executa a operação na heap, medindo-a apenas se as métricas estiverem ativas.
+        """
+        if self.metricas is None:
+            return funcao(*argumentos)
+        inicio = perf_counter_ns()
+        try:
+            return funcao(*argumentos)
+        finally:
+            self.metricas.registrar(operacao, perf_counter_ns() - inicio, len(self.heap_processos))
+
+    def _registrar(self, operacao: int, id_entrada: int = 0, prioridade: int = 0, tempo: float = 0):
+        """
+        Acrescenta a operação ao log, se houver um.
+        """
+        if self.registro is not None:
+            self.registro.registrar(operacao, id_entrada, prioridade, tempo)
+
+    def _registrar_remocoes(self, processos):
+        """
+        Registra um REMOVER_ID para cada processo retirado da fila. As remoções
+        vão ao log pelo id, e não como "remover o topo": a heap reconstruída na
+        recuperação pode desempatar prioridades iguais de outro jeito, e
+        reaplicar um pop retiraria outro processo.
+        """
+        if self.registro is not None:
+            for processo in processos:
+                self.registro.registrar(REMOVER_ID, processo.id_processo)
+
+    def _reaplicar(self, operacao: int, id_entrada: int, prioridade: int, tempo: float):
+        """
+        Refaz na heap uma operação lida do log (sem registrá-la de novo).
+        REMOVER_TOPO e REMOVER_LOTE não são mais gravados; continuam aceitos
+        para logs escritos por versões anteriores.
+        """
+        if operacao == INSERIR:
+            self.heap_processos.inserir_processo(Processo(id_entrada, int(tempo), prioridade))
+        elif operacao == REMOVER_TOPO:
+            self.heap_processos.remover_melhor_prioridade()
+        elif operacao == REMOVER_ID:
+            self.heap_processos.remover_processo(id_entrada)
+        elif operacao == ATUALIZAR:
+            self.heap_processos.modificar_prioridade(id_entrada, prioridade)
+        elif operacao == REMOVER_LOTE:
+            self.heap_processos.remover_lote(id_entrada)
 
     def adicionar_processo(self, id_processo: int, tempo_execucao: int, prioridade: int):
         """
         Adiciona um novo processo ao gerenciador (heap).
         """
         novo_processo = Processo(id_processo, tempo_execucao, prioridade)
-        self.heap_processos.inserir_processo(novo_processo)
-        print(f"Processo {id_processo} adicionado com prioridade {prioridade}.")
+        self._operar("adicionar", self.heap_processos.inserir_processo, novo_processo)
+        self._registrar(INSERIR, id_processo, prioridade, tempo_execucao)
+        self._notificar("processo_adicionado", id_processo=id_processo, prioridade=prioridade)
+
+    def adicionar_lote(self, processos):
+        """
+        Adiciona vários processos de uma vez, construindo a heap em O(n).
+        'processos' é um iterável de tuplas (id_processo, tempo_execucao, prioridade).
+        Exibe apenas uma mensagem para o lote inteiro.
+        """
+        novos = [Processo(id_processo, tempo_execucao, prioridade)
+                 for id_processo, tempo_execucao, prioridade in processos]
+        self._operar("adicionar_lote", self.heap_processos.inserir_lote, novos)
+        if self.registro is not None:
+            for processo in novos:
+                self._registrar(INSERIR, processo.id_processo, processo.prioridade, processo.tempo_execucao)
+        self._notificar("lote_adicionado", quantidade=len(novos))
 
     def executar_proximo_processo(self):
         """
         Executa (remove da fila) o processo de maior prioridade e retorna seu objeto.
         Se não houver processo, retorna None.
         """
-        processo = self.heap_processos.remover_melhor_prioridade()
+        processo = self._operar("executar", self.heap_processos.remover_melhor_prioridade)
         if processo:
-            print(f"Executando processo {processo.id_processo} (Prioridade {processo.prioridade}).")
+            self._registrar(REMOVER_ID, processo.id_processo)
+            self._notificar("processo_executado", id_processo=processo.id_processo,
+                            prioridade=processo.prioridade)
         else:
-            print("Nenhum processo para executar.")
+            self._notificar("fila_vazia")
         return processo
 
+    def executar_lote(self, quantidade: int) -> list:
+        """
+        Executa (remove da fila) até 'quantidade' processos de maior prioridade
+        e retorna a lista, na ordem de execução.
+        Exibe apenas uma mensagem para o lote inteiro.
+        """
+        processos = self._operar("executar_lote", self.heap_processos.remover_lote, quantidade)
+        self._registrar_remocoes(processos)
+        self._notificar("lote_executado", quantidade=len(processos))
+        return processos
+
     def alterar_prioridade(self, id_processo: int, nova_prioridade: int):
         """
-        Modifica a prioridade de um processo existente.
+        Modifica a prioridade de um processo existente em O(log n).
+        """
+        if self._operar("alterar_prioridade", self.heap_processos.modificar_prioridade,
+                        id_processo, nova_prioridade):
+            self._registrar(ATUALIZAR, id_processo, nova_prioridade)
+            self._notificar("prioridade_alterada", id_processo=id_processo, prioridade=nova_prioridade)
+        else:
+            self._notificar("processo_nao_encontrado", id_processo=id_processo)
+
+    def remover_processo(self, id_processo: int):
+        """
+        Remove da fila o processo com o id informado, sem executá-lo.
+        Retorna o processo removido ou None se ele não existir.
+        """
+        processo = self._operar("remover", self.heap_processos.remover_processo, id_processo)
+        if processo:
+            self._registrar(REMOVER_ID, id_processo)
+            self._notificar("processo_removido", id_processo=id_processo)
+        else:
+            self._notificar("processo_nao_encontrado", id_processo=id_processo)
+        return processo
+
+    def contem_processo(self, id_processo: int) -> bool:
         """
-        self.heap_processos.modificar_prioridade(id_processo, nova_prioridade)
-        print(f"Prioridade do processo {id_processo} foi alterada para {nova_prioridade}.")
+        Indica, em O(1), se o processo está aguardando na fila.
+        """
+        return id_processo in self.heap_processos
+
+    def simular(self, chegadas=(), quantum: float = 4, taxa_envelhecimento: float = 0.0) -> dict:
+        """
+        Executa uma simulação de eventos discretos com fatias de tempo,
+        preempção e envelhecimento, usando tempo_execucao de cada processo.
+        Os processos que já estão na fila entram como chegadas no instante 0,
+        seguidos de 'chegadas' (tuplas (instante, id_processo, tempo_execucao, prioridade)
+        em ordem de instante). A fila do gerenciador fica vazia ao final.
+        Retorna as métricas: vazão, espera média/p99 e retorno médio/p99.
+        """
+        removidos = self.heap_processos.remover_lote(len(self.heap_processos))
+        self._registrar_remocoes(removidos)
+        fila_atual = [(0, processo.id_processo, processo.tempo_execucao, processo.prioridade)
+                      for processo in removidos]
+        metricas = simular_escalonamento(chain(fila_atual, chegadas), quantum, taxa_envelhecimento)
+        self._notificar("simulacao_concluida", processos_concluidos=metricas["processos_concluidos"],
+                        duracao=metricas["duracao"])
+        return metricas
+
+    def salvar_snapshot(self, caminho: str):
+        """
+        Grava a heap num snapshot binário, no layout atual. Com log de
+        operações ativo, o snapshot guarda a última sequência do log e o
+        log é esvaziado.
+        """
+        metadados, colunas = self.heap_processos.exportar_colunas()
+        salvar_snapshot(caminho, metadados, colunas, self.registro)
+        self._notificar("snapshot_salvo", quantidade=len(self.heap_processos), caminho=caminho)
+
+    def restaurar(self, caminho_snapshot: str = None):
+        """
+        Recupera a fila após um reinício: carrega o snapshot (se informado)
+        via mmap, sem reordenar a heap, e reaplica as operações do log
+        posteriores a ele. No modo compacto o snapshot traz também o índice
+        de posições, e a carga é apenas cópia de blocos de memória.
+        A heap mantém a aridade do construtor: um snapshot gravado com outra
+        aridade é reorganizado em O(n) antes de reaplicar o log.
+        """
+        metadados, colunas, operacoes = carregar_snapshot(caminho_snapshot, self.registro)
+        if metadados is not None:
+            self.heap_processos = type(self.heap_processos).importar_colunas(metadados, colunas,
+                                                                             self.aridade)
+
+        reaplicadas = 0
+        for _, operacao, id_entrada, prioridade, tempo in operacoes:
+            self._reaplicar(operacao, id_entrada, prioridade, tempo)
+            reaplicadas += 1
+        self._notificar("estado_restaurado", quantidade=len(self.heap_processos), reaplicadas=reaplicadas)
 
     def visualizar_heap(self):
         """
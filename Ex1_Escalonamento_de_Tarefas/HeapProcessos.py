@@ -1,116 +1,178 @@
+import os
+import sys
+from array import array
+
 from Processo import Processo
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Comum"))
+from HeapDAria import HeapDAria
+
 
 class HeapProcessos:
-    def __init__(self):
-        """
-        Heap binária para gerenciar processos.
-        Internamente armazenamos tuplas do tipo (prioridade, id, tempo_execucao, objeto_processo).
-        """
-        self._heap = []
-
-    def _subir_no_heap(self, indice_filho: int):
-        """
-        Ajusta o heap de baixo para cima.
-        """
-        # Enquanto não chegamos na raiz (índice 0)
-        # e a prioridade do filho for menor que a do pai, trocamos.
-        while indice_filho > 0:
-            indice_pai = (indice_filho - 1) // 2
-            
-            if self._heap[indice_filho][0] < self._heap[indice_pai][0]:
-                self._heap[indice_filho], self._heap[indice_pai] = (
-                    self._heap[indice_pai], 
-                    self._heap[indice_filho]
-                )
-                indice_filho = indice_pai
-            else:
-                break
-
-    def _descer_no_heap(self, indice_pai: int):
-        """
-        Ajusta o heap de cima para baixo após a remoção do elemento de topo (raiz).
-        """
-        tamanho = len(self._heap)
-        while True:
-            indice_esquerda = 2 * indice_pai + 1
-            indice_direita = 2 * indice_pai + 2
-            indice_menor = indice_pai
-
-            # Verifica se filho esquerdo existe e se é menor
-            if (indice_esquerda < tamanho and 
-                self._heap[indice_esquerda][0] < self._heap[indice_menor][0]):
-                indice_menor = indice_esquerda
-
-            # Verifica se filho direito existe e se é menor
-            if (indice_direita < tamanho and 
-                self._heap[indice_direita][0] < self._heap[indice_menor][0]):
-                indice_menor = indice_direita
-
-            # Se o menor elemento não for o pai, trocamos
-            if indice_menor != indice_pai:
-                self._heap[indice_pai], self._heap[indice_menor] = (
-                    self._heap[indice_menor], 
-                    self._heap[indice_pai]
-                )
-                indice_pai = indice_menor
-            else:
-                break
+    def __init__(self, aridade: int = 2):
+        """
+        Heap d-ária (binária por padrão) para gerenciar processos.
+        A ordenação fica a cargo do motor compartilhado HeapDAria, que guarda
+        a prioridade como chave, o id_processo como identificador e o próprio
+        objeto Processo como dado, além do índice id -> posição que permite
+        localizar qualquer processo em O(1).
+
+        :param aridade: Número de filhos por nó da heap (2, 4, 8, ...)
+        """
+        self._heap = self._criar_motor(aridade)
+
+    def _criar_motor(self, aridade: int) -> HeapDAria:
+        return HeapDAria(aridade)
+
+    def _dado(self, processo: Processo):
+        """
+        Valor guardado na coluna de dados do motor para este processo.
+        """
+        return processo
+
+    def _processo(self, prioridade: int, id_processo: int, dado) -> Processo:
+        """
+        Reconstrói o Processo a partir de uma entrada do motor.
+        """
+        return dado
+
+    def _registrar_prioridade(self, indice: int, nova_prioridade: int):
+        """
+        Mantém o objeto guardado na heap com a prioridade atual.
+        """
+        self._heap.dados[indice].prioridade = nova_prioridade
+
+    def _remover_na_posicao(self, indice: int) -> Processo:
+        return self._processo(*self._heap.remover_na_posicao(indice))
+
+    def _validar_id(self, id_processo: int):
+        """
+        Lança ValueError se o processo não puder entrar na heap (id repetido).
+        """
+        if id_processo in self._heap:
+            raise ValueError(f"Processo {id_processo} já está na heap.")
 
     def inserir_processo(self, processo: Processo):
         """
         Insere um novo processo na heap, respeitando a prioridade.
+        Lança ValueError se já existir um processo com o mesmo id.
+        """
+        self._validar_id(processo.id_processo)
+        self._heap.inserir(processo.prioridade, processo.id_processo, self._dado(processo))
+
+    def inserir_lote(self, processos):
+        """
+        Insere vários processos de uma vez.
+        Quando o lote é pelo menos do tamanho da heap atual, a heap é
+        reconstruída de baixo para cima em O(n + k), em vez de k inserções
+        de O(log n). Lança ValueError se algum id já estiver na heap ou se
+        repetir no lote (nesse caso nada é inserido).
+        """
+        inicio = len(self._heap)
+        for processo in processos:
+            try:
+                self._validar_id(processo.id_processo)
+            except ValueError:
+                self._heap.desfazer_ate(inicio)
+                raise
+            self._heap.acrescentar(processo.prioridade, processo.id_processo, self._dado(processo))
+
+        self._heap.ajustar_lote(inicio)
+
+    @classmethod
+    def from_iterable(cls, processos, aridade: int = 2) -> "HeapProcessos":
+        """
+        Cria uma heap já preenchida com os processos, em O(n).
+        """
+        heap = cls(aridade)
+        heap.inserir_lote(processos)
+        return heap
+
+    def exportar_colunas(self) -> tuple:
+        """
+        Retorna (metadados, colunas) com a heap no layout atual, em arrays
+        tipados (prioridades, ids e tempos), para gravação em snapshot.
         """
-        # Inserimos uma tupla com a prioridade na frente para ordenar corretamente
-        registro = (processo.prioridade, processo.id_processo, processo.tempo_execucao, processo)
-        self._heap.append(registro)
-        self._subir_no_heap(len(self._heap) - 1)
+        heap = self._heap
+        colunas = {
+            "prioridades": array('q', heap.chaves),
+            "ids": array('q', heap.ids),
+            "tempos": array('q', [processo.tempo_execucao for processo in heap.dados]),
+        }
+        return {"aridade": heap.aridade}, colunas
+
+    @classmethod
+    def importar_colunas(cls, metadados: dict, colunas: dict, aridade: int = None) -> "HeapProcessos":
+        """
+        Recria a heap a partir das colunas de um snapshot, mantendo o layout
+        gravado: nenhuma entrada é reposicionada.
+
+        :param aridade: Aridade desejada; None usa a do snapshot. Se for
+                        diferente da gravada, as colunas são reorganizadas
+                        em heap com a nova aridade (Floyd, O(n))
+        """
+        heap = cls(metadados["aridade"])
+        heap._restaurar(colunas)
+        if aridade is not None and aridade != metadados["aridade"]:
+            heap._heap.aridade = aridade
+            heap._heap.construir()
+        return heap
+
+    def _restaurar(self, colunas: dict):
+        prioridades, ids, tempos = colunas["prioridades"], colunas["ids"], colunas["tempos"]
+        self._heap = HeapDAria(self._heap.aridade, list(prioridades), list(ids),
+                               list(map(Processo, ids, tempos, prioridades)),
+                               dict(zip(ids, range(len(ids)))))
 
     def remover_melhor_prioridade(self) -> Processo:
         """
         Remove e retorna o processo de maior prioridade (menor número).
         Retorna None se a heap estiver vazia.
         """
-        if not self._heap:
+        if not len(self._heap):
             return None
         
-        # Troca o primeiro (maior prioridade) com o último
-        self._heap[0], self._heap[-1] = self._heap[-1], self._heap[0]
-        _, _, _, processo_removido = self._heap.pop()
-        
-        # Restaura a propriedade de heap
-        if self._heap:
-            self._descer_no_heap(0)
+        return self._remover_na_posicao(0)
 
-        return processo_removido
+    def remover_lote(self, quantidade: int) -> list:
+        """
+        Remove e retorna, em ordem de prioridade, até 'quantidade' processos.
+        """
+        quantidade = min(quantidade, len(self._heap))
+        return [self._remover_na_posicao(0) for _ in range(quantidade)]
 
-    def modificar_prioridade(self, id_processo: int, nova_prioridade: int):
+    def remover_processo(self, id_processo: int) -> Processo:
+        """
+        Remove da heap o processo com o id informado, em O(log n).
+        Retorna None se o processo não estiver na heap.
+        """
+        indice = self._heap.posicao(id_processo)
+        if indice is None:
+            return None
+
+        return self._remover_na_posicao(indice)
+
+    def modificar_prioridade(self, id_processo: int, nova_prioridade: int) -> bool:
         """
         Modifica a prioridade de um processo existente na heap.
-        Na prática, precisamos encontrar o processo, mudar sua prioridade
-        e reordenar a heap.
-        
-        Observação: Numa implementação mais robusta, teríamos um dicionário
-        auxiliar de ID -> índice da heap para acessar em O(1). 
-        Aqui, faremos de forma simplificada (O(n)).
-        """
-        for indice, (prioridade, pid, tempo, processo) in enumerate(self._heap):
-            if pid == id_processo:
-                # Atualiza a prioridade do objeto
-                processo.prioridade = nova_prioridade
-                
-                # Atualiza a tupla armazenada na heap
-                self._heap[indice] = (nova_prioridade, pid, tempo, processo)
-                
-                # Precisamos reordenar o heap. Vamos:
-                # 1) Subir o nó se necessário
-                self._subir_no_heap(indice)
-                # 2) Descer o nó se necessário
-                self._descer_no_heap(indice)
-                return  # Sai após atualizar a primeira ocorrência
+        O índice de posições localiza o processo em O(1) e o reajuste
+        da heap custa O(log n).
+        Retorna False se o processo não estiver na heap.
+        """
+        indice = self._heap.posicao(id_processo)
+        if indice is None:
+            return False
+
+        self._registrar_prioridade(indice, nova_prioridade)
+        self._heap.atualizar_chave(indice, nova_prioridade)
+        return True
+
+    def __contains__(self, id_processo: int) -> bool:
+        return id_processo in self._heap
 
     def __len__(self):
         return len(self._heap)
 
     def __str__(self):
-        return str(self._heap)
+        return str([self._processo(*entrada)
+                    for entrada in zip(self._heap.chaves, self._heap.ids, self._heap.dados)])
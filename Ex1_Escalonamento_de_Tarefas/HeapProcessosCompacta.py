@@ -0,0 +1,67 @@
+import os
+import sys
+from array import array
+
+from Processo import Processo
+from HeapProcessos import HeapProcessos
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Comum"))
+from HeapDAria import HeapDAria
+from TabelaPosicoes import TabelaPosicoes, VAZIO
+
+
+class HeapProcessosCompacta(HeapProcessos):
+    """
+    Heap de processos em modo compacto (estrutura de arrays).
+    Em vez de guardar objetos Processo, o motor mantém três colunas
+    paralelas de inteiros de 64 bits (prioridade, id e tempo de execução)
+    e uma TabelaPosicoes (id -> índice). O objeto Processo só é criado
+    quando sai da heap.
+    Mesma interface de HeapProcessos.
+    """
+
+    def _criar_motor(self, aridade: int) -> HeapDAria:
+        return HeapDAria(aridade, array('q'), array('q'), array('q'), TabelaPosicoes())
+
+    def _dado(self, processo: Processo):
+        return processo.tempo_execucao
+
+    def _processo(self, prioridade: int, id_processo: int, dado) -> Processo:
+        return Processo(id_processo, dado, prioridade)
+
+    def _validar_id(self, id_processo: int):
+        # VAZIO marca as posições livres da TabelaPosicoes e não pode ser usado como id
+        if id_processo == VAZIO:
+            raise ValueError(f"Processo {id_processo}: id reservado no modo compacto.")
+        super()._validar_id(id_processo)
+
+    def exportar_colunas(self) -> tuple:
+        # As colunas já são arrays; a tabela de posições vai junto para não ser reconstruída
+        heap = self._heap
+        chaves_posicoes, valores_posicoes = heap.posicoes.exportar()
+        colunas = {
+            "prioridades": heap.chaves,
+            "ids": heap.ids,
+            "tempos": heap.dados,
+            "posicoes_chaves": chaves_posicoes,
+            "posicoes_valores": valores_posicoes,
+        }
+        return {"aridade": heap.aridade}, colunas
+
+    def _restaurar(self, colunas: dict):
+        ids = colunas["ids"]
+        if "posicoes_chaves" in colunas:
+            posicoes = TabelaPosicoes.importar(colunas["posicoes_chaves"], colunas["posicoes_valores"],
+                                              len(ids))
+        else:
+            # Snapshot de uma heap não compacta: o índice é montado em O(n)
+            posicoes = TabelaPosicoes(len(ids))
+            for indice, id_processo in enumerate(ids):
+                if id_processo == VAZIO:
+                    raise ValueError(f"Processo {id_processo}: id reservado no modo compacto.")
+                posicoes[id_processo] = indice
+        self._heap = HeapDAria(self._heap.aridade, colunas["prioridades"], ids, colunas["tempos"], posicoes)
+
+    def _registrar_prioridade(self, indice: int, nova_prioridade: int):
+        # A prioridade só existe na coluna de chaves, atualizada pelo motor
+        pass
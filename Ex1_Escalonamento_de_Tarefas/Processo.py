@@ -1,4 +1,7 @@
 class Processo:
+    # Sem __dict__ por instância: cada processo ocupa bem menos memória
+    __slots__ = ("id_processo", "tempo_execucao", "prioridade")
+
     def __init__(self, id_processo: int, tempo_execucao: int, prioridade: int):
         """
         Representa um processo do sistema operacional.
@@ -0,0 +1,109 @@
+from array import array
+from heapq import heappush, heappop
+from itertools import count
+
+
+def _percentil(valores_ordenados, percentual: float) -> float:
+    """
+    Percentil pelo método do posto mais próximo sobre valores já ordenados.
+    """
+    if not valores_ordenados:
+        return 0.0
+    posicao = max(0, -(-len(valores_ordenados) * percentual // 100) - 1)
+    return valores_ordenados[int(posicao)]
+
+
+def simular_escalonamento(chegadas, quantum: float = 4, taxa_envelhecimento: float = 0.0) -> dict:
+    """
+    Simulação de eventos discretos de uma CPU com fatias de tempo (round-robin),
+    preempção por prioridade e envelhecimento.
+
+    :param chegadas: Iterável de tuplas (instante_chegada, id_processo, tempo_execucao, prioridade),
+                     em ordem não decrescente de instante_chegada
+    :param quantum: Fatia máxima de CPU por despacho; ao esgotá-la o processo volta para a fila
+    :param taxa_envelhecimento: Quanto a prioridade efetiva melhora por unidade de tempo de espera
+    :return: Dicionário com as métricas da simulação
+
+    Envelhecimento sem varreduras: a prioridade efetiva de quem espera desde o
+    instante r é 'prioridade - taxa * (t - r)'. Como o termo 'taxa * t' é igual
+    para todos na fila, ordenar por 'prioridade + taxa * r' dá a mesma ordem em
+    qualquer instante t, então a chave é fixada ao entrar na fila e nenhum
+    processo precisa ser reposicionado enquanto espera.
+
+    Empates na chave saem em ordem de chegada à fila, o que produz o
+    round-robin entre processos de mesma prioridade. Uma chegada com chave
+    menor que a do processo em execução o preempta imediatamente.
+
+    A fila de prontos usa heapq (tuplas em C), como o Dijkstra do Ex6: a
+    simulação só insere e remove o topo, sem alterar prioridades.
+    """
+    prontos = []
+    sequencia = count()
+    esperas = array('d')
+    retornos = array('d')
+    despachos = 0
+    preempcoes = 0
+
+    iterador = iter(chegadas)
+    proxima = next(iterador, None)
+    instante = proxima[0] if proxima is not None else 0
+    inicio = instante
+
+    while proxima is not None or prontos:
+        # Admite todas as chegadas até o instante atual
+        while proxima is not None and proxima[0] <= instante:
+            chegada, id_processo, tempo_execucao, prioridade = proxima
+            heappush(prontos, (prioridade + taxa_envelhecimento * chegada, next(sequencia),
+                               id_processo, tempo_execucao, chegada, tempo_execucao, prioridade))
+            proxima = next(iterador, None)
+
+        if not prontos:
+            # CPU ociosa até a próxima chegada
+            instante = proxima[0]
+            continue
+
+        chave, _, id_processo, restante, chegada, tempo_execucao, prioridade = heappop(prontos)
+        despachos += 1
+        fatia = min(quantum, restante)
+        fim = instante + fatia
+
+        # Chegadas durante a fatia: entram na fila ou preemptam o processo atual
+        while proxima is not None and proxima[0] < fim:
+            chegada_nova, id_novo, tempo_novo, prioridade_nova = proxima
+            chave_nova = prioridade_nova + taxa_envelhecimento * chegada_nova
+            heappush(prontos, (chave_nova, next(sequencia),
+                               id_novo, tempo_novo, chegada_nova, tempo_novo, prioridade_nova))
+            proxima = next(iterador, None)
+            if chave_nova < chave:
+                fim = chegada_nova
+                fatia = fim - instante
+                preempcoes += 1
+                break
+
+        # Desconta a fatia em si (e não 'fim - instante') para que o restante
+        # chegue exatamente a zero mesmo com instantes em ponto flutuante
+        restante -= fatia
+        instante = fim
+        if restante > 0:
+            heappush(prontos, (prioridade + taxa_envelhecimento * instante, next(sequencia),
+                               id_processo, restante, chegada, tempo_execucao, prioridade))
+        else:
+            retorno = instante - chegada
+            retornos.append(retorno)
+            esperas.append(retorno - tempo_execucao)
+
+    duracao = instante - inicio
+    concluidos = len(retornos)
+    esperas_ordenadas = sorted(esperas)
+    retornos_ordenados = sorted(retornos)
+    return {
+        "processos_concluidos": concluidos,
+        "duracao": duracao,
+        "vazao": concluidos / duracao if duracao else 0.0,
+        "espera_media": sum(esperas) / concluidos if concluidos else 0.0,
+        "espera_p99": _percentil(esperas_ordenadas, 99),
+        "retorno_medio": sum(retornos) / concluidos if concluidos else 0.0,
+        "retorno_p99": _percentil(retornos_ordenados, 99),
+        "despachos": despachos,
+        "preempcoes": preempcoes,
+    }
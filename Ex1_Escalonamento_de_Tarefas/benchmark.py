@@ -0,0 +1,217 @@
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from Processo import Processo
+from HeapProcessos import HeapProcessos
+from HeapProcessosCompacta import HeapProcessosCompacta
+from SimuladorEscalonamento import simular_escalonamento
+from GerenciadorProcessos import GerenciadorProcessos
+
+
+def gerar_processos(quantidade: int):
+    """
+    Gera processos com ids únicos e prioridades/tempos aleatórios.
+    """
+    for id_processo in range(1000, 1000 + quantidade):
+        yield Processo(id_processo, random.randint(1, 500), random.randint(0, 1_000_000))
+
+
+def medir_memoria_por_entrada(classe_heap, quantidade: int) -> float:
+    """
+    Constrói uma heap com 'quantidade' processos e retorna quantos bytes
+    (medidos com tracemalloc, incluindo todos os objetos alcançáveis)
+    ela mantém alocados por entrada.
+    """
+    random.seed(0)
+    tracemalloc.start()
+    heap = classe_heap.from_iterable(gerar_processos(quantidade))
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(heap) == quantidade
+    return memoria / quantidade
+
+
+def benchmark_memoria(quantidade: int = 200_000):
+    """
+    Compara o uso de memória por processo enfileirado entre a heap padrão
+    e a heap compacta.
+    """
+    print(f"\n=== Memória por entrada com {quantidade} processos ===")
+    resultados = {}
+    for classe_heap in (HeapProcessos, HeapProcessosCompacta):
+        t0 = time.time()
+        resultados[classe_heap.__name__] = medir_memoria_por_entrada(classe_heap, quantidade)
+        t1 = time.time()
+        print(f"{classe_heap.__name__:<24} {resultados[classe_heap.__name__]:8.1f} bytes/entrada "
+              f"(construção em {t1 - t0:.2f}s)")
+
+    razao = resultados["HeapProcessos"] / resultados["HeapProcessosCompacta"]
+    print(f"Redução: {razao:.1f}x")
+
+
+def gerar_traco(quantidade_operacoes: int, semente: int = 0) -> list:
+    """
+    Gera um traço misto de operações sobre a fila de processos:
+    ~50% inserções, ~30% alterações de prioridade e ~20% execuções (remoção do topo).
+    Cada item é uma tupla (operacao, id_processo, prioridade).
+    """
+    gerador = random.Random(semente)
+    traco = []
+    ativos = []
+    proximo_id = 0
+    for _ in range(quantidade_operacoes):
+        sorteio = gerador.random()
+        if sorteio < 0.5 or not ativos:
+            traco.append(("inserir", proximo_id, gerador.randint(0, 1_000_000)))
+            ativos.append(proximo_id)
+            proximo_id += 1
+        elif sorteio < 0.8:
+            # Ids já executados são ignorados por modificar_prioridade
+            traco.append(("alterar", gerador.choice(ativos), gerador.randint(0, 1_000_000)))
+        else:
+            traco.append(("executar", None, None))
+    return traco
+
+
+def executar_traco(heap, traco: list):
+    """
+    Aplica o traço de operações sobre a heap.
+    """
+    for operacao, id_processo, prioridade in traco:
+        if operacao == "inserir":
+            heap.inserir_processo(Processo(id_processo, 1, prioridade))
+        elif operacao == "alterar":
+            heap.modificar_prioridade(id_processo, prioridade)
+        else:
+            heap.remover_melhor_prioridade()
+
+
+def benchmark_aridade(quantidade_operacoes: int = 500_000, aridades=(2, 4, 8)):
+    """
+    Mede a vazão (operações/s) da heap padrão e da compacta para cada aridade
+    no mesmo traço misto de inserções, alterações de prioridade e execuções.
+    """
+    traco = gerar_traco(quantidade_operacoes)
+    print(f"\n=== Vazão por aridade ({quantidade_operacoes} operações mistas) ===")
+    for classe_heap in (HeapProcessos, HeapProcessosCompacta):
+        for aridade in aridades:
+            heap = classe_heap(aridade)
+            t0 = time.perf_counter()
+            executar_traco(heap, traco)
+            t1 = time.perf_counter()
+            print(f"{classe_heap.__name__:<24} d={aridade}: "
+                  f"{quantidade_operacoes / (t1 - t0):>10,.0f} ops/s (fila final: {len(heap)})")
+
+
+def gerar_chegadas(quantidade: int, utilizacao: float = 0.9, semente: int = 0):
+    """
+    Gera chegadas (instante, id_processo, tempo_execucao, prioridade) com intervalos
+    exponenciais, tempos de execução entre 1 e 20 e prioridades entre 0 e 9.
+    'utilizacao' é a fração média da CPU demandada pelos processos.
+    """
+    gerador = random.Random(semente)
+    taxa_chegada = utilizacao / 10.5  # 10.5 = tempo de execução médio
+    instante = 0.0
+    for id_processo in range(quantidade):
+        instante += gerador.expovariate(taxa_chegada)
+        yield (instante, id_processo, gerador.randint(1, 20), gerador.randint(0, 9))
+
+
+def benchmark_simulacao(quantidade: int = 1_000_000, quantum: float = 4):
+    """
+    Roda a simulação com e sem envelhecimento e mostra as métricas de cada uma.
+    """
+    print(f"\n=== Simulação de escalonamento ({quantidade} processos, quantum={quantum}) ===")
+    for taxa in (0.0, 0.05):
+        t0 = time.perf_counter()
+        metricas = simular_escalonamento(gerar_chegadas(quantidade), quantum, taxa)
+        t1 = time.perf_counter()
+        print(f"envelhecimento={taxa}: {t1 - t0:.2f}s de simulação | "
+              f"vazão={metricas['vazao']:.4f} proc/u.t. | "
+              f"espera média={metricas['espera_media']:.1f} p99={metricas['espera_p99']:.1f} | "
+              f"retorno médio={metricas['retorno_medio']:.1f} p99={metricas['retorno_p99']:.1f} | "
+              f"preempções={metricas['preempcoes']}")
+
+
+def verificar_recuperacao():
+    """
+    Reinicia o gerenciador entre snapshot, novas inserções e recuperação, para
+    conferir que nenhuma operação registrada depois do snapshot se perde:
+    snapshot com 5 processos, reinício, 2 inserções, reinício e restaurar().
+    O último reinício usa outra aridade, e a fila restaurada deve continuar
+    saindo em ordem de prioridade.
+    """
+    print("\n=== Recuperação após reinícios ===")
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho_snapshot = os.path.join(diretorio, "fila.snap")
+        caminho_registro = os.path.join(diretorio, "fila.log")
+        for compacta in (True, False):
+            for arquivo in (caminho_snapshot, caminho_registro):
+                if os.path.exists(arquivo):
+                    os.remove(arquivo)
+            gerenciador = GerenciadorProcessos(compacta=compacta, silencioso=True, registro=caminho_registro)
+            for id_processo in range(5):
+                gerenciador.adicionar_processo(id_processo, 10, id_processo)
+            gerenciador.salvar_snapshot(caminho_snapshot)
+            gerenciador.registro.fechar()
+
+            gerenciador = GerenciadorProcessos(compacta=compacta, silencioso=True, registro=caminho_registro)
+            gerenciador.restaurar(caminho_snapshot)
+            gerenciador.adicionar_processo(5, 10, 5)
+            gerenciador.adicionar_processo(6, 10, 6)
+            gerenciador.registro.fechar()
+
+            gerenciador = GerenciadorProcessos(compacta=compacta, aridade=4, silencioso=True,
+                                               registro=caminho_registro)
+            gerenciador.restaurar(caminho_snapshot)
+            gerenciador.registro.fechar()
+            assert len(gerenciador.heap_processos) == 7, len(gerenciador.heap_processos)
+            assert all(gerenciador.contem_processo(id_processo) for id_processo in range(7))
+            ordem = [processo.id_processo for processo in gerenciador.heap_processos.remover_lote(7)]
+            assert ordem == list(range(7)), ordem
+            print(f"{'compacta' if compacta else 'padrão':<9} 7 processos recuperados")
+
+
+def verificar_recuperacao_empates(sementes: int = 200):
+    """
+    Recupera a fila só pelo log depois de um lote com muitas prioridades
+    iguais e de várias execuções: a heap refeita desempata de outro jeito,
+    então a recuperação só acerta se as remoções forem reaplicadas pelo id.
+    """
+    print("\n=== Recuperação pelo log com prioridades empatadas ===")
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho_registro = os.path.join(diretorio, "fila.log")
+        for compacta in (True, False):
+            for semente in range(sementes):
+                gerador = random.Random(semente)
+                if os.path.exists(caminho_registro):
+                    os.remove(caminho_registro)
+                gerenciador = GerenciadorProcessos(compacta=compacta, silencioso=True, registro=caminho_registro)
+                gerenciador.adicionar_lote([(id_processo, 10, gerador.randint(1, 3)) for id_processo in range(19)])
+                for _ in range(5):
+                    gerenciador.executar_proximo_processo()
+                gerenciador.executar_lote(3)
+                esperados = [id_processo for id_processo in range(19) if gerenciador.contem_processo(id_processo)]
+                gerenciador.registro.fechar()
+
+                gerenciador = GerenciadorProcessos(compacta=compacta, silencioso=True, registro=caminho_registro)
+                gerenciador.restaurar()
+                gerenciador.registro.fechar()
+                recuperados = [id_processo for id_processo in range(19) if gerenciador.contem_processo(id_processo)]
+                assert recuperados == esperados, (semente, esperados, recuperados)
+            print(f"{'compacta' if compacta else 'padrão':<9} {sementes} sementes recuperadas")
+
+
+def main():
+    benchmark_memoria()
+    benchmark_aridade()
+    benchmark_simulacao()
+    verificar_recuperacao()
+    verificar_recuperacao_empates()
+
+
+if __name__ == "__main__":
+    main()
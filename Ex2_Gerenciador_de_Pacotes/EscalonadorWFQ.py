@@ -0,0 +1,126 @@
+import os
+import sys
+
+from Pacotes import Pacote
+from HeapMin import HeapMinima
+from HeapMinCompacta import HeapMinimaCompacta
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Comum"))
+from HeapDAria import HeapDAria
+
+
+class EscalonadorWFQ:
+    def __init__(self, pesos: dict, compacta: bool = False, aridade: int = 2):
+        """
+        Escalonador multi-classe por Weighted Fair Queueing (variante
+        self-clocked, SCFQ), usando tempo_transmissao como tamanho do pacote.
+
+        Cada classe de tráfego tem sua própria HeapMinima (dentro da classe,
+        sai primeiro o pacote de menor prioridade). Entre classes, o próximo
+        pacote é o da classe cujo pacote da frente tem o menor tempo virtual
+        de término:
+            inicio = max(tempo_virtual, termino_anterior_da_classe)
+            termino = inicio + tempo_transmissao / peso
+        As classes com pacotes ficam numa HeapDAria indexada por classe, de
+        modo que cada decisão custa O(log classes). Com todas as classes
+        ocupadas, cada uma recebe uma fatia do enlace proporcional ao seu peso.
+
+        :param pesos: Dicionário classe -> peso (> 0)
+        :param compacta: Se True, as filas das classes usam HeapMinimaCompacta
+        :param aridade: Número de filhos por nó das heaps
+        """
+        for classe, peso in pesos.items():
+            if peso <= 0:
+                raise ValueError(f"O peso da classe {classe!r} deve ser positivo.")
+
+        classe_heap = HeapMinimaCompacta if compacta else HeapMinima
+        self._pesos = dict(pesos)
+        self._filas = {classe: classe_heap(aridade) for classe in pesos}
+        self._inicio = {classe: 0.0 for classe in pesos}
+        self._ultimo_termino = {classe: 0.0 for classe in pesos}
+        self._classes_ativas = HeapDAria(aridade)
+        self._tempo_virtual = 0.0
+
+        # Estatísticas de serviço por classe
+        self._pacotes_servidos = {classe: 0 for classe in pesos}
+        self._volume_servido = {classe: 0.0 for classe in pesos}
+
+    def _fila_da_classe(self, classe) -> HeapMinima:
+        try:
+            return self._filas[classe]
+        except KeyError:
+            raise KeyError(f"Classe de tráfego {classe!r} não configurada.") from None
+
+    def _termino(self, classe, pacote: Pacote) -> float:
+        return self._inicio[classe] + pacote.tempo_transmissao / self._pesos[classe]
+
+    def inserir(self, classe, pacote: Pacote):
+        """
+        Enfileira o pacote na sua classe, em O(log n + log classes).
+        Lança KeyError se a classe não estiver configurada.
+        """
+        fila = self._fila_da_classe(classe)
+        fila.inserir(pacote)
+
+        if len(fila) == 1:
+            # Classe volta a ter pacotes: começa no tempo virtual atual
+            self._inicio[classe] = max(self._tempo_virtual, self._ultimo_termino[classe])
+            self._classes_ativas.inserir(self._termino(classe, pacote), classe, None)
+        elif fila.consultar_minimo().id_pacote == pacote.id_pacote:
+            # O novo pacote passou à frente: o término da classe muda
+            indice = self._classes_ativas.posicao(classe)
+            self._classes_ativas.atualizar_chave(indice, self._termino(classe, pacote))
+
+    def remover(self):
+        """
+        Retorna a tupla (classe, pacote) do próximo pacote a transmitir,
+        ou None se todas as filas estiverem vazias.
+        """
+        if not len(self._classes_ativas):
+            return None
+
+        termino, classe, _ = self._classes_ativas.remover_na_posicao(0)
+        fila = self._filas[classe]
+        pacote = fila.remover_minimo()
+
+        # SCFQ: o tempo virtual passa a ser o término do pacote em serviço
+        self._tempo_virtual = termino
+        self._ultimo_termino[classe] = termino
+        self._pacotes_servidos[classe] += 1
+        self._volume_servido[classe] += pacote.tempo_transmissao
+
+        if len(fila):
+            self._inicio[classe] = termino
+            self._classes_ativas.inserir(self._termino(classe, fila.consultar_minimo()), classe, None)
+
+        return classe, pacote
+
+    def metricas(self) -> dict:
+        """
+        Retorna as estatísticas de serviço:
+          - 'classes': para cada classe, pacotes e volume servidos, fatia obtida
+            do volume total e fatia esperada pelo peso
+          - 'indice_jain': índice de justiça de Jain sobre volume/peso das classes
+            que receberam serviço (1.0 = divisão perfeitamente proporcional)
+        """
+        volume_total = sum(self._volume_servido.values())
+        servidas = [classe for classe in self._pesos if self._pacotes_servidos[classe]]
+        peso_servidas = sum(self._pesos[classe] for classe in servidas)
+
+        classes = {}
+        for classe, peso in self._pesos.items():
+            classes[classe] = {
+                "pacotes": self._pacotes_servidos[classe],
+                "volume": self._volume_servido[classe],
+                "fatia": self._volume_servido[classe] / volume_total if volume_total else 0.0,
+                "fatia_esperada": peso / peso_servidas if classe in servidas else 0.0,
+            }
+
+        normalizados = [self._volume_servido[classe] / self._pesos[classe] for classe in servidas]
+        soma_quadrados = sum(valor * valor for valor in normalizados)
+        indice_jain = (sum(normalizados) ** 2 / (len(normalizados) * soma_quadrados)
+                       if soma_quadrados else 1.0)
+        return {"classes": classes, "indice_jain": indice_jain}
+
+    def __len__(self):
+        return sum(len(fila) for fila in self._filas.values())
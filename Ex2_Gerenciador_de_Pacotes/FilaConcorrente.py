@@ -0,0 +1,147 @@
+import asyncio
+import queue
+
+from Pacotes import Pacote
+from HeapMin import HeapMinima
+from HeapMinCompacta import HeapMinimaCompacta
+
+
+class FilaRoteadorConcorrente(queue.Queue):
+    """
+    Fila de pacotes segura para várias threads (ex.: leitores de NIC
+    produzindo e um transmissor consumindo), com a mesma ordenação da
+    HeapMinima usada pelo GerenciadorRoteador.
+
+    Segue a interface de queue.Queue:
+      - put(pacote, block=True, timeout=None): com 'capacidade' > 0, bloqueia
+        enquanto a fila estiver cheia (contrapressão) ou lança queue.Full
+      - put_nowait(pacote): nunca bloqueia; lança queue.Full se estiver cheia
+      - get(block=True, timeout=None): entrega o pacote mais urgente, esperando
+        até 'timeout' segundos; lança queue.Empty se nada chegar
+      - get_nowait(), qsize(), task_done(), join()
+
+    O lock só é mantido durante as operações da heap (O(log n)).
+    """
+
+    def __init__(self, capacidade: int = 0, compacta: bool = False, aridade: int = 2):
+        """
+        :param capacidade: Máximo de pacotes na fila (0 = ilimitada)
+        :param compacta: Se True, usa a HeapMinimaCompacta
+        :param aridade: Número de filhos por nó da heap
+        """
+        self._classe_heap = HeapMinimaCompacta if compacta else HeapMinima
+        self._aridade = aridade
+        super().__init__(capacidade)
+
+    # Ganchos de queue.Queue, sempre chamados com o lock adquirido
+    def _init(self, maxsize: int):
+        self.queue = self._classe_heap(self._aridade)
+
+    def _qsize(self) -> int:
+        return len(self.queue)
+
+    def _put(self, pacote: Pacote):
+        self.queue.inserir(pacote)
+
+    def _get(self) -> Pacote:
+        return self.queue.remover_minimo()
+
+    def atualizar_prioridade(self, id_pacote: int, nova_prioridade: int):
+        """
+        Atualiza a prioridade de um pacote enfileirado.
+        Lança KeyError se o pacote não estiver na fila.
+        """
+        with self.mutex:
+            self.queue.atualizar_prioridade(id_pacote, nova_prioridade)
+
+    def cancelar(self, id_pacote: int) -> Pacote:
+        """
+        Descarta um pacote enfileirado, liberando espaço para os produtores.
+        Lança KeyError se o pacote não estiver na fila.
+        """
+        with self.not_full:
+            pacote = self.queue.remover(id_pacote)
+            # O pacote descartado não terá task_done(); contabilizamos aqui
+            self.unfinished_tasks -= 1
+            if self.unfinished_tasks == 0:
+                self.all_tasks_done.notify_all()
+            self.not_full.notify()
+        return pacote
+
+    def __contains__(self, id_pacote: int) -> bool:
+        with self.mutex:
+            return id_pacote in self.queue
+
+
+class FilaRoteadorAssincrona(asyncio.Queue):
+    """
+    Versão asyncio da fila do roteador, com a mesma ordenação da HeapMinima.
+
+    Segue a interface de asyncio.Queue:
+      - await put(pacote): espera por espaço quando a fila está cheia (contrapressão)
+      - put_nowait(pacote): lança asyncio.QueueFull se estiver cheia
+      - await get(): entrega o pacote mais urgente, esperando se necessário
+        (use asyncio.wait_for para impor um timeout)
+      - get_nowait(), qsize(), task_done(), join()
+
+    Assim como asyncio.Queue, não é segura para uso entre threads.
+    """
+
+    def __init__(self, capacidade: int = 0, compacta: bool = False, aridade: int = 2):
+        """
+        :param capacidade: Máximo de pacotes na fila (0 = ilimitada)
+        :param compacta: Se True, usa a HeapMinimaCompacta
+        :param aridade: Número de filhos por nó da heap
+        """
+        self._classe_heap = HeapMinimaCompacta if compacta else HeapMinima
+        self._aridade = aridade
+        super().__init__(capacidade)
+
+    # Ganchos de asyncio.Queue
+    def _init(self, maxsize: int):
+        self._queue = self._classe_heap(self._aridade)
+        # id do pacote que cancelar() está retirando via get_nowait(), ou None
+        self._id_cancelado = None
+
+    def _put(self, pacote: Pacote):
+        self._queue.inserir(pacote)
+
+    def _get(self) -> Pacote:
+        if self._id_cancelado is not None:
+            return self._queue.remover(self._id_cancelado)
+        return self._queue.remover_minimo()
+
+    def atualizar_prioridade(self, id_pacote: int, nova_prioridade: int):
+        """
+        Atualiza a prioridade de um pacote enfileirado.
+        Lança KeyError se o pacote não estiver na fila.
+        """
+        self._queue.atualizar_prioridade(id_pacote, nova_prioridade)
+
+    def cancelar(self, id_pacote: int) -> Pacote:
+        """
+        Descarta um pacote enfileirado, liberando espaço para os produtores.
+        Lança KeyError se o pacote não estiver na fila.
+        """
+        if id_pacote not in self._queue:
+            # Deixa a heap lançar o KeyError, sem passar por get_nowait()
+            return self._queue.remover(id_pacote)
+        # A retirada passa por get_nowait(), que chama o gancho _get (aqui, para
+        # remover este pacote em vez do mínimo) e acorda um produtor à espera
+        # de espaço pela interface pública, sem depender de internos da asyncio.Queue
+        self._id_cancelado = id_pacote
+        try:
+            pacote = self.get_nowait()
+        finally:
+            self._id_cancelado = None
+        # O pacote descartado não terá task_done() de um consumidor; contabilizamos aqui.
+        # Como ele foi contado no put(), só há ValueError se algum consumidor chamou
+        # task_done() a mais; nesse caso a contagem já está zerada e não há o que ajustar
+        try:
+            self.task_done()
+        except ValueError:
+            pass
+        return pacote
+
+    def __contains__(self, id_pacote: int) -> bool:
+        return id_pacote in self._queue
@@ -1,27 +1,158 @@
+import os
+import sys
+from time import perf_counter_ns
+
 from Pacotes import Pacote
 from HeapMin import HeapMinima
+from HeapMinCompacta import HeapMinimaCompacta
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Comum"))
+from MetricasFila import MetricasFila
+from RegistroOperacoes import (RegistroOperacoes, INSERIR, REMOVER_TOPO, REMOVER_ID,
+                               ATUALIZAR, REMOVER_LOTE, salvar_snapshot, carregar_snapshot)
+
+# Mensagens exibidas para cada evento quando não há observador
+MENSAGENS = {
+    "pacote_inserido": "Pacote {id_pacote} inserido (prioridade={prioridade}).",
+    "lote_inserido": "{quantidade} pacotes inseridos em lote.",
+    "pacote_removido": "Removendo Pacote {id_pacote} (prioridade={prioridade}).",
+    "fila_vazia": "Não há pacotes na fila.",
+    "lote_removido": "{quantidade} pacotes removidos em lote.",
+    "prioridade_atualizada": "Prioridade do Pacote {id_pacote} atualizada para {prioridade}.",
+    "pacote_descartado": "Pacote {id_pacote} descartado.",
+    "snapshot_salvo": "Snapshot com {quantidade} pacotes salvo em {caminho}.",
+    "estado_restaurado": ("Fila restaurada com {quantidade} pacotes "
+                          "({reaplicadas} operações reaplicadas do log)."),
+}
 
 
 class GerenciadorRoteador:
-    def __init__(self):
-        self.heap_minima = HeapMinima()
+    def __init__(self, compacta: bool = False, aridade: int = 2, observador=None,
+                 silencioso: bool = False, coletar_metricas: bool = False,
+                 registro: str = None, sincronizar_registro: bool = False):
+        # No modo compacto a fila guarda os pacotes em colunas de arrays (HeapMinimaCompacta);
+        # 'aridade' é o número de filhos por nó da heap (2 = binária)
+        classe_heap = HeapMinimaCompacta if compacta else HeapMinima
+        self.aridade = aridade
+        self.heap_minima = classe_heap(aridade)
+        # observador(evento, dados) substitui o print; 'silencioso' desliga as mensagens
+        self.observador = observador
+        self.silencioso = silencioso
+        # Contagem de operações, profundidade máxima e latência da heap (None = desligado)
+        self.metricas = MetricasFila() if coletar_metricas else None
+        # Log de operações para recuperação entre snapshots (ver 'restaurar')
+        self.registro = RegistroOperacoes(registro, sincronizar_registro) if registro else None
+
+    def _notificar(self, evento: str, **dados):
+        if self.observador is not None:
+            self.observador(evento, dados)
+        elif not self.silencioso:
+            print(MENSAGENS[evento].format(**dados))
+
+    def _operar(self, operacao: str, funcao, *argumentos):
+        # Só mede a operação na heap quando as métricas estão ativas
+        if self.metricas is None:
+            return funcao(*argumentos)
+        inicio = perf_counter_ns()
+        try:
+            return funcao(*argumentos)
+        finally:
+            self.metricas.registrar(operacao, perf_counter_ns() - inicio, len(self.heap_minima))
+
+    def _registrar(self, operacao: int, id_entrada: int = 0, prioridade: int = 0, tempo: float = 0.0):
+        if self.registro is not None:
+            self.registro.registrar(operacao, id_entrada, prioridade, tempo)
+
+    def _registrar_remocoes(self, pacotes):
+        # Remoções vão ao log pelo id, e não como "remover o topo": a heap reconstruída
+        # na recuperação pode desempatar prioridades iguais de outro jeito
+        if self.registro is not None:
+            for pacote in pacotes:
+                self.registro.registrar(REMOVER_ID, pacote.id_pacote)
+
+    def _reaplicar(self, operacao: int, id_entrada: int, prioridade: int, tempo: float):
+        # Refaz na heap uma operação lida do log, sem registrá-la de novo
+        # (REMOVER_TOPO e REMOVER_LOTE só aparecem em logs de versões anteriores)
+        if operacao == INSERIR:
+            self.heap_minima.inserir(Pacote(id_entrada, prioridade, tempo))
+        elif operacao == REMOVER_TOPO:
+            self.heap_minima.remover_minimo()
+        elif operacao == REMOVER_ID:
+            self.heap_minima.remover(id_entrada)
+        elif operacao == ATUALIZAR:
+            self.heap_minima.atualizar_prioridade(id_entrada, prioridade)
+        elif operacao == REMOVER_LOTE:
+            self.heap_minima.remover_lote(id_entrada)
 
     def inserir_pacote(self, id_pacote: int, prioridade: int, tempo_transmissao: float):
         novo_pacote = Pacote(id_pacote, prioridade, tempo_transmissao)
-        self.heap_minima.inserir(novo_pacote)
-        print(f"Pacote {id_pacote} inserido (prioridade={prioridade}).")
+        self._operar("inserir", self.heap_minima.inserir, novo_pacote)
+        self._registrar(INSERIR, id_pacote, prioridade, tempo_transmissao)
+        self._notificar("pacote_inserido", id_pacote=id_pacote, prioridade=prioridade)
+
+    def inserir_lote(self, pacotes):
+        # 'pacotes' é um iterável de tuplas (id_pacote, prioridade, tempo_transmissao);
+        # a heap é construída em O(n) e só uma mensagem é exibida para o lote
+        novos = [Pacote(id_pacote, prioridade, tempo_transmissao)
+                 for id_pacote, prioridade, tempo_transmissao in pacotes]
+        self._operar("inserir_lote", self.heap_minima.inserir_lote, novos)
+        if self.registro is not None:
+            for pacote in novos:
+                self._registrar(INSERIR, pacote.id_pacote, pacote.prioridade, pacote.tempo_transmissao)
+        self._notificar("lote_inserido", quantidade=len(novos))
 
     def remover_pacote_prioritario(self):
-        pacote = self.heap_minima.remover_minimo()
+        pacote = self._operar("remover", self.heap_minima.remover_minimo)
         if pacote:
-            print(f"Removendo Pacote {pacote.id_pacote} (prioridade={pacote.prioridade}).")
+            self._registrar(REMOVER_ID, pacote.id_pacote)
+            self._notificar("pacote_removido", id_pacote=pacote.id_pacote, prioridade=pacote.prioridade)
         else:
-            print("Não há pacotes na fila.")
+            self._notificar("fila_vazia")
         return pacote
 
+    def remover_lote(self, quantidade: int) -> list:
+        # Drena até 'quantidade' pacotes mais urgentes, com uma única mensagem
+        pacotes = self._operar("remover_lote", self.heap_minima.remover_lote, quantidade)
+        self._registrar_remocoes(pacotes)
+        self._notificar("lote_removido", quantidade=len(pacotes))
+        return pacotes
+
     def atualizar_prioridade_pacote(self, id_pacote: int, nova_prioridade: int):
-        self.heap_minima.atualizar_prioridade(id_pacote, nova_prioridade)
-        print(f"Prioridade do Pacote {id_pacote} atualizada para {nova_prioridade}.")
+        # Lança KeyError se o pacote não estiver na fila
+        self._operar("atualizar_prioridade", self.heap_minima.atualizar_prioridade,
+                     id_pacote, nova_prioridade)
+        self._registrar(ATUALIZAR, id_pacote, nova_prioridade)
+        self._notificar("prioridade_atualizada", id_pacote=id_pacote, prioridade=nova_prioridade)
+
+    def cancelar_pacote(self, id_pacote: int):
+        # Descarta o pacote sem transmiti-lo; lança KeyError se ele não estiver na fila
+        pacote = self._operar("cancelar", self.heap_minima.remover, id_pacote)
+        self._registrar(REMOVER_ID, id_pacote)
+        self._notificar("pacote_descartado", id_pacote=id_pacote)
+        return pacote
+
+    def contem_pacote(self, id_pacote: int) -> bool:
+        return id_pacote in self.heap_minima
+
+    def salvar_snapshot(self, caminho: str):
+        # Grava a heap no layout atual; com log ativo, guarda a última sequência e esvazia o log
+        metadados, colunas = self.heap_minima.exportar_colunas()
+        salvar_snapshot(caminho, metadados, colunas, self.registro)
+        self._notificar("snapshot_salvo", quantidade=len(self.heap_minima), caminho=caminho)
+
+    def restaurar(self, caminho_snapshot: str = None):
+        # Carrega o snapshot (via mmap, sem reordenar a heap) e reaplica o log posterior a ele.
+        # A heap mantém a aridade do construtor: um snapshot gravado com outra
+        # aridade é reorganizado em O(n) antes de reaplicar o log
+        metadados, colunas, operacoes = carregar_snapshot(caminho_snapshot, self.registro)
+        if metadados is not None:
+            self.heap_minima = type(self.heap_minima).importar_colunas(metadados, colunas, self.aridade)
+
+        reaplicadas = 0
+        for _, operacao, id_entrada, prioridade, tempo in operacoes:
+            self._reaplicar(operacao, id_entrada, prioridade, tempo)
+            reaplicadas += 1
+        self._notificar("estado_restaurado", quantidade=len(self.heap_minima), reaplicadas=reaplicadas)
 
     def visualizar_heap(self):
         print("Estado atual da Heap (min-heap):")
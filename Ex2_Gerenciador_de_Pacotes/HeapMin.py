@@ -1,100 +1,195 @@
+import os
+import sys
+from array import array
+
 from Pacotes import Pacote
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Comum"))
+from HeapDAria import HeapDAria
+
+
 class HeapMinima:
-    def __init__(self):
+    def __init__(self, aridade: int = 2):
         """
-        Heap Mínima usando um array (lista Python).
-        Cada elemento será um objeto Pacote,
+        Heap Mínima d-ária (binária por padrão) de pacotes,
         onde menor prioridade = maior urgência.
+        A ordenação fica a cargo do motor compartilhado HeapDAria, cujo
+        índice id_pacote -> posição acompanha cada movimento e permite
+        localizar um pacote em O(1).
+
+        :param aridade: Número de filhos por nó da heap (2, 4, 8, ...)
         """
-        self._elementos = []
-
-    def _subir_no_heap(self, indice_filho: int):
-        """
-        Ajusta o heap de baixo para cima.
-        """
-        while indice_filho > 0:
-            indice_pai = (indice_filho - 1) // 2
-            
-            # Se o pacote do filho tiver prioridade menor que a do pai, trocar
-            if self._elementos[indice_filho].prioridade < self._elementos[indice_pai].prioridade:
-                self._elementos[indice_filho], self._elementos[indice_pai] = (
-                    self._elementos[indice_pai],
-                    self._elementos[indice_filho]
-                )
-                indice_filho = indice_pai
-            else:
-                break
-
-    def _descer_no_heap(self, indice_pai: int):
-        """
-        Ajusta o heap de cima para baixo, após remoção do topo.
-        """
-        tamanho = len(self._elementos)
-        while True:
-            indice_esquerda = 2 * indice_pai + 1
-            indice_direita = 2 * indice_pai + 2
-            indice_menor = indice_pai
-
-            # Verifica se o filho esquerdo existe e se tem prioridade menor
-            if (indice_esquerda < tamanho and
-                self._elementos[indice_esquerda].prioridade < self._elementos[indice_menor].prioridade):
-                indice_menor = indice_esquerda
-
-            # Verifica o direito
-            if (indice_direita < tamanho and
-                self._elementos[indice_direita].prioridade < self._elementos[indice_menor].prioridade):
-                indice_menor = indice_direita
-
-            # Se trocou, precisamos continuar descendo
-            if indice_menor != indice_pai:
-                self._elementos[indice_pai], self._elementos[indice_menor] = (
-                    self._elementos[indice_menor],
-                    self._elementos[indice_pai]
-                )
-                indice_pai = indice_menor
-            else:
-                break
+        self._elementos = self._criar_motor(aridade)
+
+    def _criar_motor(self, aridade: int) -> HeapDAria:
+        return HeapDAria(aridade)
+
+    def _dado(self, pacote: Pacote):
+        """
+        Valor guardado na coluna de dados do motor para este pacote.
+        """
+        return pacote
+
+    def _pacote(self, prioridade: int, id_pacote: int, dado) -> Pacote:
+        """
+        Reconstrói o Pacote a partir de uma entrada do motor.
+        """
+        return dado
+
+    def _registrar_prioridade(self, indice: int, nova_prioridade: int):
+        """
+        Mantém o objeto guardado na heap com a prioridade atual.
+        """
+        self._elementos.dados[indice].prioridade = nova_prioridade
+
+    def _indice_do_pacote(self, id_pacote: int) -> int:
+        """
+        Retorna a posição do pacote na heap.
+        Lança KeyError se o pacote não estiver na fila.
+        """
+        indice = self._elementos.posicao(id_pacote)
+        if indice is None:
+            raise KeyError(f"Pacote {id_pacote} não está na fila.")
+        return indice
+
+    def _remover_na_posicao(self, indice: int) -> Pacote:
+        return self._pacote(*self._elementos.remover_na_posicao(indice))
+
+    def _validar_id(self, id_pacote: int):
+        """
+        Lança ValueError se o pacote não puder entrar na fila (id repetido).
+        """
+        if id_pacote in self._elementos:
+            raise ValueError(f"Pacote {id_pacote} já está na fila.")
 
     def inserir(self, pacote: Pacote):
         """
         Insere um pacote na heap e ajusta a estrutura.
+        Lança ValueError se já houver um pacote com o mesmo id na fila.
+        """
+        self._validar_id(pacote.id_pacote)
+        self._elementos.inserir(pacote.prioridade, pacote.id_pacote, self._dado(pacote))
+
+    def inserir_lote(self, pacotes):
+        """
+        Insere vários pacotes de uma vez.
+        Quando o lote é pelo menos do tamanho da heap atual, a heap é
+        reconstruída de baixo para cima em O(n + k), em vez de k inserções
+        de O(log n). Lança ValueError se algum id já estiver na fila ou se
+        repetir no lote (nesse caso nada é inserido).
         """
-        self._elementos.append(pacote)
-        self._subir_no_heap(len(self._elementos) - 1)
+        inicio = len(self._elementos)
+        for pacote in pacotes:
+            try:
+                self._validar_id(pacote.id_pacote)
+            except ValueError:
+                self._elementos.desfazer_ate(inicio)
+                raise
+            self._elementos.acrescentar(pacote.prioridade, pacote.id_pacote, self._dado(pacote))
+
+        self._elementos.ajustar_lote(inicio)
+
+    @classmethod
+    def from_iterable(cls, pacotes, aridade: int = 2) -> "HeapMinima":
+        """
+        Cria uma heap já preenchida com os pacotes, em O(n).
+        """
+        heap = cls(aridade)
+        heap.inserir_lote(pacotes)
+        return heap
+
+    def exportar_colunas(self) -> tuple:
+        """
+        Retorna (metadados, colunas) com a heap no layout atual, em arrays
+        tipados (prioridades, ids e tempos), para gravação em snapshot.
+        """
+        heap = self._elementos
+        colunas = {
+            "prioridades": array('q', heap.chaves),
+            "ids": array('q', heap.ids),
+            "tempos": array('d', [pacote.tempo_transmissao for pacote in heap.dados]),
+        }
+        return {"aridade": heap.aridade}, colunas
+
+    @classmethod
+    def importar_colunas(cls, metadados: dict, colunas: dict, aridade: int = None) -> "HeapMinima":
+        """
+        Recria a heap a partir das colunas de um snapshot, mantendo o layout
+        gravado: nenhuma entrada é reposicionada.
+
+        :param aridade: Aridade desejada; None usa a do snapshot. Se for
+                        diferente da gravada, as colunas são reorganizadas
+                        em heap com a nova aridade (Floyd, O(n))
+        """
+        heap = cls(metadados["aridade"])
+        heap._restaurar(colunas)
+        if aridade is not None and aridade != metadados["aridade"]:
+            heap._elementos.aridade = aridade
+            heap._elementos.construir()
+        return heap
+
+    def _restaurar(self, colunas: dict):
+        prioridades, ids, tempos = colunas["prioridades"], colunas["ids"], colunas["tempos"]
+        self._elementos = HeapDAria(self._elementos.aridade, list(prioridades), list(ids),
+                                    list(map(Pacote, ids, prioridades, tempos)),
+                                    dict(zip(ids, range(len(ids)))))
 
     def remover_minimo(self) -> Pacote:
         """
         Remove e retorna o pacote de menor prioridade (maior urgência).
         Retorna None se estiver vazio.
         """
-        if not self._elementos:
+        if not len(self._elementos):
             return None
         
-        # Trocamos topo com o último elemento
-        self._elementos[0], self._elementos[-1] = self._elementos[-1], self._elementos[0]
-        pacote_removido = self._elementos.pop()  # remove do final da lista
+        return self._remover_na_posicao(0)
 
-        # Ajusta o heap
-        if self._elementos:
-            self._descer_no_heap(0)
+    def consultar_minimo(self) -> Pacote:
+        """
+        Retorna, sem remover, o pacote mais urgente. Retorna None se estiver vazio.
+        """
+        if not len(self._elementos):
+            return None
+
+        heap = self._elementos
+        return self._pacote(heap.chaves[0], heap.ids[0], heap.dados[0])
+
+    def remover_lote(self, quantidade: int) -> list:
+        """
+        Remove e retorna, em ordem de urgência, até 'quantidade' pacotes.
+        """
+        quantidade = min(quantidade, len(self._elementos))
+        return [self._remover_na_posicao(0) for _ in range(quantidade)]
 
-        return pacote_removido
+    def remover(self, id_pacote: int) -> Pacote:
+        """
+        Remove da heap o pacote com o id informado, em O(log n).
+        Lança KeyError se o pacote não estiver na fila.
+        """
+        return self._remover_na_posicao(self._indice_do_pacote(id_pacote))
 
     def atualizar_prioridade(self, id_pacote: int, nova_prioridade: int):
         """
         Atualiza a prioridade de um pacote pelo seu ID e reordena o heap.
-        (Implementação simplificada: O(n) para achar o pacote)
+        A posição vem do índice em O(1), e o reajuste custa O(log n).
+        Lança KeyError se o pacote não estiver na fila.
+        """
+        indice = self._indice_do_pacote(id_pacote)
+        self._registrar_prioridade(indice, nova_prioridade)
+        self._elementos.atualizar_chave(indice, nova_prioridade)
+
+    def __contains__(self, id_pacote: int) -> bool:
+        return id_pacote in self._elementos
+
+    def __iter__(self):
+        """
+        Percorre os pacotes na ordem interna da heap (não em ordem de prioridade).
         """
-        for indice, pacote in enumerate(self._elementos):
-            if pacote.id_pacote == id_pacote:
-                pacote.prioridade = nova_prioridade
-                # Após atualizar a prioridade, precisamos subir ou descer conforme necessário.
-                self._subir_no_heap(indice)
-                self._descer_no_heap(indice)
-                break
+        for entrada in zip(self._elementos.chaves, self._elementos.ids, self._elementos.dados):
+            yield self._pacote(*entrada)
 
     def __len__(self):
         return len(self._elementos)
 
     def __str__(self):
-        return str(self._elementos)
+        return str(list(self))
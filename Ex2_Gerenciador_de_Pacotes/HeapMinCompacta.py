@@ -0,0 +1,67 @@
+import os
+import sys
+from array import array
+
+from Pacotes import Pacote
+from HeapMin import HeapMinima
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Comum"))
+from HeapDAria import HeapDAria
+from TabelaPosicoes import TabelaPosicoes, VAZIO
+
+
+class HeapMinimaCompacta(HeapMinima):
+    """
+    Heap Mínima de pacotes em modo compacto (estrutura de arrays).
+    Prioridade e id ficam em colunas de inteiros de 64 bits e o tempo de
+    transmissão numa coluna de floats; o índice id -> posição é uma
+    TabelaPosicoes. O objeto Pacote só é criado quando sai da heap.
+    Mesma interface de HeapMinima.
+    """
+
+    def _criar_motor(self, aridade: int) -> HeapDAria:
+        return HeapDAria(aridade, array('q'), array('q'), array('d'), TabelaPosicoes())
+
+    def _dado(self, pacote: Pacote):
+        return pacote.tempo_transmissao
+
+    def _pacote(self, prioridade: int, id_pacote: int, dado) -> Pacote:
+        return Pacote(id_pacote, prioridade, dado)
+
+    def _validar_id(self, id_pacote: int):
+        # VAZIO marca as posições livres da TabelaPosicoes e não pode ser usado como id
+        if id_pacote == VAZIO:
+            raise ValueError(f"Pacote {id_pacote}: id reservado no modo compacto.")
+        super()._validar_id(id_pacote)
+
+    def exportar_colunas(self) -> tuple:
+        # As colunas já são arrays; a tabela de posições vai junto para não ser reconstruída
+        heap = self._elementos
+        chaves_posicoes, valores_posicoes = heap.posicoes.exportar()
+        colunas = {
+            "prioridades": heap.chaves,
+            "ids": heap.ids,
+            "tempos": heap.dados,
+            "posicoes_chaves": chaves_posicoes,
+            "posicoes_valores": valores_posicoes,
+        }
+        return {"aridade": heap.aridade}, colunas
+
+    def _restaurar(self, colunas: dict):
+        ids = colunas["ids"]
+        if "posicoes_chaves" in colunas:
+            posicoes = TabelaPosicoes.importar(colunas["posicoes_chaves"], colunas["posicoes_valores"],
+                                              len(ids))
+        else:
+            # Snapshot de uma heap não compacta: o índice é montado em O(n)
+            posicoes = TabelaPosicoes(len(ids))
+            for indice, id_pacote in enumerate(ids):
+                if id_pacote == VAZIO:
+                    raise ValueError(f"Pacote {id_pacote}: id reservado no modo compacto.")
+                posicoes[id_pacote] = indice
+        self._elementos = HeapDAria(self._elementos.aridade, colunas["prioridades"], ids,
+                                    colunas["tempos"], posicoes)
+
+    def _registrar_prioridade(self, indice: int, nova_prioridade: int):
+        # A prioridade só existe na coluna de chaves, atualizada pelo motor
+        pass
@@ -1,4 +1,7 @@
 class Pacote:
+    # Sem __dict__ por instância: cada pacote ocupa bem menos memória
+    __slots__ = ("id_pacote", "prioridade", "tempo_transmissao")
+
     def __init__(self, id_pacote: int, prioridade: int, tempo_transmissao: float):
         """
         Representa um pacote de rede.
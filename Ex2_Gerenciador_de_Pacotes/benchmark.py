@@ -0,0 +1,353 @@
+import asyncio
+import os
+import random
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from Pacotes import Pacote
+from HeapMin import HeapMinima
+from HeapMinCompacta import HeapMinimaCompacta
+from FilaConcorrente import FilaRoteadorConcorrente, FilaRoteadorAssincrona
+from EscalonadorWFQ import EscalonadorWFQ
+from GerenciaRoteador import GerenciadorRoteador
+
+
+def gerar_pacotes(quantidade: int):
+    """
+    Gera pacotes com ids únicos e prioridades/tempos de transmissão aleatórios.
+    """
+    for id_pacote in range(1000, 1000 + quantidade):
+        yield Pacote(id_pacote, random.randint(0, 1_000_000), random.uniform(0.01, 2.0))
+
+
+def medir_memoria_por_entrada(classe_heap, quantidade: int) -> float:
+    """
+    Constrói uma heap com 'quantidade' pacotes e retorna quantos bytes
+    (medidos com tracemalloc, incluindo todos os objetos alcançáveis)
+    ela mantém alocados por entrada.
+    """
+    random.seed(0)
+    tracemalloc.start()
+    heap = classe_heap.from_iterable(gerar_pacotes(quantidade))
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(heap) == quantidade
+    return memoria / quantidade
+
+
+def benchmark_memoria(quantidade: int = 200_000):
+    """
+    Compara o uso de memória por pacote enfileirado entre a heap padrão
+    e a heap compacta.
+    """
+    print(f"\n=== Memória por entrada com {quantidade} pacotes ===")
+    resultados = {}
+    for classe_heap in (HeapMinima, HeapMinimaCompacta):
+        t0 = time.time()
+        resultados[classe_heap.__name__] = medir_memoria_por_entrada(classe_heap, quantidade)
+        t1 = time.time()
+        print(f"{classe_heap.__name__:<20} {resultados[classe_heap.__name__]:8.1f} bytes/entrada "
+              f"(construção em {t1 - t0:.2f}s)")
+
+    razao = resultados["HeapMinima"] / resultados["HeapMinimaCompacta"]
+    print(f"Redução: {razao:.1f}x")
+
+
+def gerar_traco(quantidade_operacoes: int, semente: int = 0) -> list:
+    """
+    Gera um traço misto de operações sobre a fila do roteador:
+    ~50% inserções, ~30% atualizações de prioridade e ~20% remoções do topo.
+    Cada item é uma tupla (operacao, id_pacote, prioridade).
+    """
+    gerador = random.Random(semente)
+    traco = []
+    ativos = []
+    proximo_id = 0
+    for _ in range(quantidade_operacoes):
+        sorteio = gerador.random()
+        if sorteio < 0.5 or not ativos:
+            traco.append(("inserir", proximo_id, gerador.randint(0, 1_000_000)))
+            ativos.append(proximo_id)
+            proximo_id += 1
+        elif sorteio < 0.8:
+            traco.append(("atualizar", gerador.choice(ativos), gerador.randint(0, 1_000_000)))
+        else:
+            traco.append(("remover", None, None))
+    return traco
+
+
+def executar_traco(heap, traco: list):
+    """
+    Aplica o traço de operações sobre a heap.
+    Atualizações de pacotes que já saíram da fila são ignoradas.
+    """
+    for operacao, id_pacote, prioridade in traco:
+        if operacao == "inserir":
+            heap.inserir(Pacote(id_pacote, prioridade, 0.1))
+        elif operacao == "atualizar":
+            if id_pacote in heap:
+                heap.atualizar_prioridade(id_pacote, prioridade)
+        else:
+            heap.remover_minimo()
+
+
+def benchmark_aridade(quantidade_operacoes: int = 500_000, aridades=(2, 4, 8)):
+    """
+    Mede a vazão (operações/s) da heap padrão e da compacta para cada aridade
+    no mesmo traço misto de inserções, atualizações e remoções.
+    """
+    traco = gerar_traco(quantidade_operacoes)
+    print(f"\n=== Vazão por aridade ({quantidade_operacoes} operações mistas) ===")
+    for classe_heap in (HeapMinima, HeapMinimaCompacta):
+        for aridade in aridades:
+            heap = classe_heap(aridade)
+            t0 = time.perf_counter()
+            executar_traco(heap, traco)
+            t1 = time.perf_counter()
+            print(f"{classe_heap.__name__:<20} d={aridade}: "
+                  f"{quantidade_operacoes / (t1 - t0):>10,.0f} ops/s (fila final: {len(heap)})")
+
+
+def benchmark_concorrencia(produtores: int = 4, pacotes_por_produtor: int = 50_000,
+                           capacidade: int = 10_000):
+    """
+    Vários produtores (threads) inserem pacotes na FilaRoteadorConcorrente
+    enquanto um único transmissor os consome; informa pacotes/s de ponta a ponta.
+    """
+    fila = FilaRoteadorConcorrente(capacidade)
+    total = produtores * pacotes_por_produtor
+
+    def produzir(indice_produtor: int):
+        gerador = random.Random(indice_produtor)
+        primeiro_id = indice_produtor * pacotes_por_produtor
+        for id_pacote in range(primeiro_id, primeiro_id + pacotes_por_produtor):
+            fila.put(Pacote(id_pacote, gerador.randint(0, 1000), 0.1))
+
+    def transmitir():
+        for _ in range(total):
+            fila.get()
+
+    threads = [threading.Thread(target=produzir, args=(i,)) for i in range(produtores)]
+    threads.append(threading.Thread(target=transmitir))
+    t0 = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    t1 = time.perf_counter()
+
+    print(f"\n=== Fila concorrente: {produtores} produtores, 1 transmissor, capacidade {capacidade} ===")
+    print(f"{total} pacotes em {t1 - t0:.2f}s -> {total / (t1 - t0):,.0f} pacotes/s")
+
+
+def benchmark_assincrono(produtores: int = 4, pacotes_por_produtor: int = 50_000,
+                         capacidade: int = 10_000):
+    """
+    Mesmo cenário de benchmark_concorrencia com corrotinas sobre a FilaRoteadorAssincrona.
+    """
+    total = produtores * pacotes_por_produtor
+
+    async def executar():
+        fila = FilaRoteadorAssincrona(capacidade)
+
+        async def produzir(indice_produtor: int):
+            gerador = random.Random(indice_produtor)
+            primeiro_id = indice_produtor * pacotes_por_produtor
+            for id_pacote in range(primeiro_id, primeiro_id + pacotes_por_produtor):
+                await fila.put(Pacote(id_pacote, gerador.randint(0, 1000), 0.1))
+
+        async def transmitir():
+            for _ in range(total):
+                await fila.get()
+
+        await asyncio.gather(transmitir(), *(produzir(i) for i in range(produtores)))
+
+    t0 = time.perf_counter()
+    asyncio.run(executar())
+    t1 = time.perf_counter()
+
+    print(f"\n=== Fila asyncio: {produtores} produtores, 1 transmissor, capacidade {capacidade} ===")
+    print(f"{total} pacotes em {t1 - t0:.2f}s -> {total / (t1 - t0):,.0f} pacotes/s")
+
+
+def benchmark_wfq(quantidade_classes: int = 8, pacotes_por_classe: int = 50_000):
+    """
+    Enche todas as classes (pesos 1, 2, ..., n; a classe i tem prioridade i) e
+    transmite metade dos pacotes, medindo decisões/s e a justiça da divisão.
+    Para comparação, o mesmo tráfego passa por uma única HeapMinima global.
+    """
+    gerador = random.Random(0)
+    pesos = {classe: classe + 1 for classe in range(quantidade_classes)}
+    trafego = [(classe, Pacote(classe * pacotes_por_classe + i, classe, gerador.uniform(0.1, 1.5)))
+               for classe in range(quantidade_classes) for i in range(pacotes_por_classe)]
+    a_transmitir = len(trafego) // 2
+
+    escalonador = EscalonadorWFQ(pesos)
+    for classe, pacote in trafego:
+        escalonador.inserir(classe, pacote)
+    t0 = time.perf_counter()
+    for _ in range(a_transmitir):
+        escalonador.remover()
+    t1 = time.perf_counter()
+    metricas = escalonador.metricas()
+
+    print(f"\n=== WFQ: {quantidade_classes} classes, {a_transmitir} pacotes transmitidos ===")
+    print(f"{a_transmitir / (t1 - t0):,.0f} decisões/s, índice de Jain = {metricas['indice_jain']:.4f}")
+
+    heap_global = HeapMinima.from_iterable(pacote for _, pacote in trafego)
+    volume_global = {classe: 0.0 for classe in pesos}
+    for pacote in heap_global.remover_lote(a_transmitir):
+        volume_global[pacote.prioridade] += pacote.tempo_transmissao
+    volume_total_global = sum(volume_global.values())
+
+    print("classe  peso  fatia esperada  fatia WFQ  fatia heap global")
+    for classe, dados in metricas["classes"].items():
+        print(f"{classe:>6}  {pesos[classe]:>4}  {dados['fatia_esperada']:>14.3f}  {dados['fatia']:>9.3f}"
+              f"  {volume_global[classe] / volume_total_global:>17.3f}")
+
+
+def benchmark_instrumentacao(quantidade: int = 200_000):
+    """
+    Custo das mensagens e das métricas do GerenciadorRoteador: insere e remove
+    'quantidade' pacotes usando a heap diretamente, o gerenciador silencioso e
+    o gerenciador silencioso com métricas ligadas.
+    """
+    def ciclo_heap():
+        heap = HeapMinima()
+        for id_pacote in range(quantidade):
+            heap.inserir(Pacote(id_pacote, id_pacote % 997, 0.1))
+        for _ in range(quantidade):
+            heap.remover_minimo()
+
+    def ciclo_gerenciador(roteador):
+        for id_pacote in range(quantidade):
+            roteador.inserir_pacote(id_pacote, id_pacote % 997, 0.1)
+        for _ in range(quantidade):
+            roteador.remover_pacote_prioritario()
+
+    print(f"\n=== Custo da instrumentação ({quantidade} inserções + remoções) ===")
+    cenarios = [
+        ("HeapMinima direta", ciclo_heap),
+        ("Gerenciador silencioso", lambda: ciclo_gerenciador(GerenciadorRoteador(silencioso=True))),
+        ("Gerenciador + métricas", lambda: ciclo_gerenciador(
+            GerenciadorRoteador(silencioso=True, coletar_metricas=True))),
+    ]
+    for nome, cenario in cenarios:
+        t0 = time.perf_counter()
+        cenario()
+        t1 = time.perf_counter()
+        print(f"{nome:<24} {2 * quantidade / (t1 - t0):>10,.0f} ops/s")
+
+
+def benchmark_snapshot(quantidade: int = 2_000_000):
+    """
+    Grava e recarrega uma fila de 'quantidade' pacotes em snapshot, no modo
+    compacto (carga por cópia de blocos) e no modo padrão (recria os objetos).
+    """
+    print(f"\n=== Snapshot de {quantidade} pacotes ===")
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = os.path.join(diretorio, "fila.snap")
+        for compacta in (True, False):
+            roteador = GerenciadorRoteador(compacta=compacta, silencioso=True)
+            random.seed(0)
+            roteador.heap_minima.inserir_lote(gerar_pacotes(quantidade))
+
+            t0 = time.perf_counter()
+            roteador.salvar_snapshot(caminho)
+            t1 = time.perf_counter()
+            restaurado = GerenciadorRoteador(compacta=compacta, silencioso=True)
+            restaurado.restaurar(caminho)
+            t2 = time.perf_counter()
+
+            assert len(restaurado.heap_minima) == quantidade
+            modo = "compacta" if compacta else "padrão"
+            print(f"{modo:<9} arquivo={os.path.getsize(caminho) / 2**20:7.1f} MiB  "
+                  f"gravação={t1 - t0:.3f}s  carga={t2 - t1:.3f}s")
+            del roteador, restaurado
+
+
+def verificar_recuperacao():
+    """
+    Reinicia o gerenciador entre snapshot, novas inserções e recuperação, para
+    conferir que nenhuma operação registrada depois do snapshot se perde:
+    snapshot com 5 pacotes, reinício, 2 inserções, reinício e restaurar().
+    O último reinício usa outra aridade, e a fila restaurada deve continuar
+    saindo em ordem de prioridade.
+    """
+    print("\n=== Recuperação após reinícios ===")
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho_snapshot = os.path.join(diretorio, "fila.snap")
+        caminho_registro = os.path.join(diretorio, "fila.log")
+        for compacta in (True, False):
+            for arquivo in (caminho_snapshot, caminho_registro):
+                if os.path.exists(arquivo):
+                    os.remove(arquivo)
+            roteador = GerenciadorRoteador(compacta=compacta, silencioso=True, registro=caminho_registro)
+            for id_pacote in range(5):
+                roteador.inserir_pacote(id_pacote, id_pacote, 1.0)
+            roteador.salvar_snapshot(caminho_snapshot)
+            roteador.registro.fechar()
+
+            roteador = GerenciadorRoteador(compacta=compacta, silencioso=True, registro=caminho_registro)
+            roteador.restaurar(caminho_snapshot)
+            roteador.inserir_pacote(5, 5, 1.0)
+            roteador.inserir_pacote(6, 6, 1.0)
+            roteador.registro.fechar()
+
+            roteador = GerenciadorRoteador(compacta=compacta, aridade=4, silencioso=True,
+                                           registro=caminho_registro)
+            roteador.restaurar(caminho_snapshot)
+            roteador.registro.fechar()
+            assert len(roteador.heap_minima) == 7, len(roteador.heap_minima)
+            assert all(roteador.contem_pacote(id_pacote) for id_pacote in range(7))
+            ordem = [pacote.id_pacote for pacote in roteador.heap_minima.remover_lote(7)]
+            assert ordem == list(range(7)), ordem
+            print(f"{'compacta' if compacta else 'padrão':<9} 7 pacotes recuperados")
+
+
+def verificar_recuperacao_empates(sementes: int = 200):
+    """
+    Recupera a fila só pelo log depois de um lote com muitas prioridades
+    iguais e de várias remoções: a heap refeita desempata de outro jeito,
+    então a recuperação só acerta se as remoções forem reaplicadas pelo id.
+    """
+    print("\n=== Recuperação pelo log com prioridades empatadas ===")
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho_registro = os.path.join(diretorio, "fila.log")
+        for compacta in (True, False):
+            for semente in range(sementes):
+                gerador = random.Random(semente)
+                if os.path.exists(caminho_registro):
+                    os.remove(caminho_registro)
+                roteador = GerenciadorRoteador(compacta=compacta, silencioso=True, registro=caminho_registro)
+                roteador.inserir_lote([(id_pacote, gerador.randint(1, 3), 1.0) for id_pacote in range(19)])
+                for _ in range(5):
+                    roteador.remover_pacote_prioritario()
+                roteador.remover_lote(3)
+                esperados = [id_pacote for id_pacote in range(19) if roteador.contem_pacote(id_pacote)]
+                roteador.registro.fechar()
+
+                roteador = GerenciadorRoteador(compacta=compacta, silencioso=True, registro=caminho_registro)
+                roteador.restaurar()
+                roteador.registro.fechar()
+                recuperados = [id_pacote for id_pacote in range(19) if roteador.contem_pacote(id_pacote)]
+                assert recuperados == esperados, (semente, esperados, recuperados)
+            print(f"{'compacta' if compacta else 'padrão':<9} {sementes} sementes recuperadas")
+
+
+def main():
+    benchmark_memoria()
+    benchmark_aridade()
+    benchmark_concorrencia()
+    benchmark_assincrono()
+    benchmark_wfq()
+    benchmark_instrumentacao()
+    benchmark_snapshot()
+    verificar_recuperacao()
+    verificar_recuperacao_empates()
+
+
+if __name__ == "__main__":
+    main()
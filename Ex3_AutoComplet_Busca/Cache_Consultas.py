@@ -0,0 +1,139 @@
+import time
+from collections import OrderedDict
+
+
+class CacheConsultas:
+    """
+    Cache de resultados com descarte do menos usado recentemente (LRU) e,
+    opcionalmente, validade por tempo (TTL).
+
+    As chaves são tuplas cujo primeiro elemento é o texto consultado
+    (ex.: (prefixo, limite)), o que permite invalidar de uma vez todas as
+    entradas de uma mesma consulta, com qualquer limite.
+    """
+
+    def __init__(self, capacidade: int = 1024, ttl: float = None, relogio=time.monotonic, agrupar=None):
+        """
+        :param capacidade: Número máximo de entradas guardadas
+        :param ttl: Segundos que uma entrada continua válida; None nunca expira
+        :param relogio: Função que retorna o instante atual em segundos
+        :param agrupar: Função (chave, valor) -> grupo; se informada, 'chaves_por_grupo'
+                        reúne as chaves de cada grupo, para que uma invalidação
+                        examine só os grupos que podem ter sido afetados
+        """
+        self.capacidade = capacidade
+        self.ttl = ttl
+        self.relogio = relogio
+        self.agrupar = agrupar
+        # chave -> (valor, instante em que foi guardado), da menos para a mais recente
+        self.entradas = OrderedDict()
+        # texto consultado -> chaves guardadas para ele
+        self.chaves_por_consulta = {}
+        # grupo -> chaves guardadas nele (só com 'agrupar')
+        self.chaves_por_grupo = {}
+        self.acertos = 0
+        self.falhas = 0
+        self.expiradas = 0
+        self.descartadas = 0
+        self.invalidadas = 0
+
+    def obter(self, chave: tuple):
+        """
+        Retorna o valor guardado para a chave (e a marca como usada), ou None
+        se ela não estiver no cache ou tiver expirado.
+        """
+        entrada = self.entradas.get(chave)
+        if entrada is None:
+            self.falhas += 1
+            return None
+        valor, instante = entrada
+        if self.ttl is not None and self.relogio() - instante > self.ttl:
+            self._remover(chave)
+            self.expiradas += 1
+            self.falhas += 1
+            return None
+        self.entradas.move_to_end(chave)
+        self.acertos += 1
+        return valor
+
+    def guardar(self, chave: tuple, valor):
+        """
+        Guarda o valor, descartando a entrada menos usada se o cache estiver cheio.
+        """
+        if self.capacidade <= 0:
+            return
+        if chave in self.entradas:
+            self.entradas.move_to_end(chave)
+            self._desagrupar(chave)
+        else:
+            if len(self.entradas) >= self.capacidade:
+                self._remover(next(iter(self.entradas)))
+                self.descartadas += 1
+            self.chaves_por_consulta.setdefault(chave[0], set()).add(chave)
+        self.entradas[chave] = (valor, self.relogio())
+        if self.agrupar is not None:
+            self.chaves_por_grupo.setdefault(self.agrupar(chave, valor), set()).add(chave)
+
+    def _desagrupar(self, chave: tuple):
+        if self.agrupar is None:
+            return
+        grupo = self.agrupar(chave, self.entradas[chave][0])
+        chaves = self.chaves_por_grupo[grupo]
+        chaves.discard(chave)
+        if not chaves:
+            del self.chaves_por_grupo[grupo]
+
+    def _remover(self, chave: tuple):
+        self._desagrupar(chave)
+        del self.entradas[chave]
+        chaves = self.chaves_por_consulta[chave[0]]
+        chaves.discard(chave)
+        if not chaves:
+            del self.chaves_por_consulta[chave[0]]
+
+    def invalidar(self, chave: tuple):
+        """
+        Remove a chave, se estiver no cache.
+        """
+        if chave in self.entradas:
+            self._remover(chave)
+            self.invalidadas += 1
+
+    def invalidar_consulta(self, consulta: str):
+        """
+        Remove todas as entradas cujo texto consultado é 'consulta'.
+        """
+        for chave in list(self.chaves_por_consulta.get(consulta, ())):
+            self._remover(chave)
+            self.invalidadas += 1
+
+    def itens(self) -> list:
+        """
+        Lista de (chave, valor) de todas as entradas, sem afetar a ordem de uso.
+        """
+        return [(chave, valor) for chave, (valor, _) in self.entradas.items()]
+
+    def limpar(self):
+        self.entradas.clear()
+        self.chaves_por_consulta.clear()
+        self.chaves_por_grupo.clear()
+
+    def estatisticas(self) -> dict:
+        """
+        Contadores para dimensionar o cache: acertos, falhas, taxa de acerto,
+        entradas expiradas, descartadas por falta de espaço e invalidadas.
+        """
+        consultas = self.acertos + self.falhas
+        return {
+            "tamanho": len(self.entradas),
+            "capacidade": self.capacidade,
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "taxa_acerto": self.acertos / consultas if consultas else 0.0,
+            "expiradas": self.expiradas,
+            "descartadas": self.descartadas,
+            "invalidadas": self.invalidadas,
+        }
+
+    def __len__(self) -> int:
+        return len(self.entradas)
@@ -0,0 +1,134 @@
+TAMANHO_PALAVRA_BITS = 64
+
+
+def preparar_padrao(padrao: str) -> dict:
+    """
+    Tabela do algoritmo de Myers: para cada caractere do 'padrao', a máscara de
+    bits das posições em que ele aparece (bit i = padrao[i]).
+    """
+    mascaras = {}
+    bit = 1
+    for caractere in padrao:
+        mascaras[caractere] = mascaras.get(caractere, 0) | bit
+        bit <<= 1
+    return mascaras
+
+
+def _distancia_myers(mascaras: dict, tamanho_padrao: int, texto: str, limite: int) -> int:
+    """
+    Distância de Levenshtein bit-paralela (Myers / Hyyrö): cada coluna da tabela
+    de programação dinâmica é representada pelos vetores de diferenças verticais
+    +1 (positivos) e -1 (negativos), atualizados com poucas operações de bits por
+    caractere do texto. Para padrões de até 64 caracteres, cada vetor cabe numa
+    palavra de máquina.
+
+    Retorna limite + 1 assim que a distância não puder mais ficar <= 'limite'.
+    """
+    todos = (1 << tamanho_padrao) - 1
+    ultimo = 1 << (tamanho_padrao - 1)
+    positivos = todos
+    negativos = 0
+    distancia = tamanho_padrao
+    restantes = len(texto)
+    for caractere in texto:
+        iguais = mascaras.get(caractere, 0)
+        vertical = iguais | negativos
+        horizontal = (((iguais & positivos) + positivos) ^ positivos) | iguais
+        horizontal_positivos = negativos | (~(horizontal | positivos) & todos)
+        horizontal_negativos = positivos & horizontal
+        if horizontal_positivos & ultimo:
+            distancia += 1
+        elif horizontal_negativos & ultimo:
+            distancia -= 1
+        restantes -= 1
+        # Cada caractere restante do texto reduz a distância em no máximo 1
+        if distancia - restantes > limite:
+            return limite + 1
+        horizontal_positivos = ((horizontal_positivos << 1) | 1) & todos
+        horizontal_negativos = (horizontal_negativos << 1) & todos
+        positivos = horizontal_negativos | (~(vertical | horizontal_positivos) & todos)
+        negativos = horizontal_positivos & vertical
+    return distancia
+
+
+def _distancia_faixa(str1: str, str2: str, limite: int) -> int:
+    """
+    Programação dinâmica restrita à faixa diagonal |i - j| <= limite, com duas
+    linhas reaproveitadas. Retorna limite + 1 assim que toda a faixa de uma
+    linha passar do limite.
+    """
+    m = len(str1)
+    n = len(str2)
+    infinito = limite + 1
+    anterior = [j if j <= limite else infinito for j in range(n + 1)]
+    atual = [infinito] * (n + 1)
+    for i in range(1, m + 1):
+        inicio = max(1, i - limite)
+        fim = min(n, i + limite)
+        atual[inicio - 1] = i if inicio == 1 and i <= limite else infinito
+        menor = atual[inicio - 1]
+        caractere = str1[i - 1]
+        for j in range(inicio, fim + 1):
+            custo_substituicao = 0 if str2[j - 1] == caractere else 1
+            valor = min(anterior[j - 1] + custo_substituicao,  # Substituição
+                        anterior[j] + 1,                       # Remoção
+                        atual[j - 1] + 1)                      # Inserção
+            if valor > infinito:
+                valor = infinito
+            atual[j] = valor
+            if valor < menor:
+                menor = valor
+        if fim < n:
+            # Fora da faixa: a próxima linha não pode usar valores antigos
+            atual[fim + 1] = infinito
+        if menor > limite:
+            return infinito
+        anterior, atual = atual, anterior
+    return anterior[n]
+
+
+def distancia_levenshtein_limitada(str1: str, str2: str, limite: int = None) -> int:
+    """
+    Distância de Levenshtein entre 'str1' e 'str2' quando ela é <= 'limite';
+    caso contrário retorna limite + 1 sem terminar o cálculo.
+    Usa o algoritmo bit-paralelo de Myers quando a menor string tem até
+    64 caracteres e a programação dinâmica em faixa nos demais casos.
+
+    :param limite: Maior distância de interesse; None calcula a distância exata
+    """
+    if limite is None:
+        limite = max(len(str1), len(str2))
+    if abs(len(str1) - len(str2)) > limite:
+        return limite + 1
+    if str1 == str2:
+        return 0
+    if len(str1) > len(str2):
+        str1, str2 = str2, str1
+    if not str1:
+        return len(str2)
+    if len(str1) <= TAMANHO_PALAVRA_BITS:
+        return _distancia_myers(preparar_padrao(str1), len(str1), str2, limite)
+    return _distancia_faixa(str1, str2, limite)
+
+
+def distancias_em_lote(consulta: str, candidatas, limite: int = None) -> list:
+    """
+    Distância limitada da 'consulta' para cada uma das 'candidatas', na mesma ordem.
+    A tabela de máscaras da consulta é montada uma única vez para todo o lote.
+    Distâncias acima de 'limite' aparecem como limite + 1.
+    """
+    tamanho = len(consulta)
+    if tamanho == 0 or tamanho > TAMANHO_PALAVRA_BITS:
+        return [distancia_levenshtein_limitada(consulta, candidata, limite) for candidata in candidatas]
+
+    mascaras = preparar_padrao(consulta)
+    distancias = []
+    for candidata in candidatas:
+        limite_atual = max(tamanho, len(candidata)) if limite is None else limite
+        if abs(tamanho - len(candidata)) > limite_atual:
+            distancias.append(limite_atual + 1)
+        elif not candidata:
+            distancias.append(tamanho)
+        else:
+            distancias.append(_distancia_myers(mascaras, tamanho, candidata, limite_atual))
+    return distancias
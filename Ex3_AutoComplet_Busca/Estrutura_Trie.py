@@ -1,25 +1,266 @@
+import gc
+from heapq import heappop, heappush, heapreplace, nlargest
+from itertools import islice
+from operator import itemgetter
+
+from Cache_Consultas import CacheConsultas
+from Distancia_Levenshtein import distancia_levenshtein_limitada
+from Indice_SymSpell import IndiceSymSpell
+
+
+def _grupo_correcao(chave: tuple, valor: tuple) -> tuple:
+    """
+    Grupo de uma entrada do cache de correção: (tamanho da consulta, limiar guardado).
+    """
+    return len(chave[0]), valor[1]
+
+
 class NoTrie:
     def __init__(self):
         self.filhos = {}
         self.fim_de_palavra = False
+        self.peso = 0
+        # Só no modo ranqueado: lista de (peso, palavra) com as melhores conclusões da subárvore
+        self.melhores = None
 class Trie:
-    def __init__(self):
+    def __init__(self, ranqueada: bool = False, tamanho_cache: int = 5,
+                 indice_correcao: IndiceSymSpell = None, capacidade_cache_consultas: int = 0,
+                 ttl_cache_consultas: float = None):
+        """
+        :param ranqueada: Se True, cada nó guarda as 'tamanho_cache' conclusões de maior
+                          peso da sua subárvore, e autocompletar devolve as mais pesadas
+                          em O(tamanho do prefixo + k), sem percorrer a subárvore
+        :param tamanho_cache: Quantas conclusões cada nó guarda no modo ranqueado
+        :param indice_correcao: IndiceSymSpell vazio, alimentado a cada inserção e usado por
+                                corrigir_palavra para buscar candidatas sem percorrer a Trie
+        :param capacidade_cache_consultas: Se > 0, guarda os resultados de autocompletar e de
+                                           corrigir_palavra em caches LRU com essa capacidade
+        :param ttl_cache_consultas: Segundos de validade de cada resultado em cache; None não expira
+        """
         self.raiz = NoTrie()
         self.palavras_inseridas = []
+        self.ranqueada = ranqueada
+        self.tamanho_cache = tamanho_cache
+        self.indice_correcao = indice_correcao
+        self.cache_autocompletar = None
+        self.cache_correcao = None
+        if capacidade_cache_consultas > 0:
+            self.cache_autocompletar = CacheConsultas(capacidade_cache_consultas, ttl_cache_consultas)
+            # Correções agrupadas por (tamanho da consulta, limiar), para que uma inserção
+            # só calcule distâncias nos grupos em que a palavra pode caber
+            self.cache_correcao = CacheConsultas(capacidade_cache_consultas, ttl_cache_consultas,
+                                                 agrupar=_grupo_correcao)
+        if ranqueada:
+            self.raiz.melhores = []
+
+    @classmethod
+    def from_iterable(cls, palavras, ordenadas: bool = False, pesos: dict = None, **parametros) -> "Trie":
+        """
+        Cria uma Trie já preenchida numa única passada sobre as palavras em ordem.
+        Como palavras vizinhas na ordem compartilham o maior prefixo comum, basta
+        manter a pilha de nós da palavra anterior: a parte comum é reaproveitada
+        sem consultar nenhum dicionário de filhos, e só os caracteres novos viram nós.
+        Um nó que sai da pilha não recebe mais filhos, então no modo ranqueado o
+        seu cache é calculado nesse momento, uma única vez.
+        O coletor de lixo cíclico fica pausado durante a carga: os nós não formam
+        ciclos, e sem a pausa ele percorre a Trie inteira repetidas vezes enquanto
+        ela cresce, o que dominava o tempo de construção.
+
+        :param palavras: Iterável de palavras (duplicatas são ignoradas)
+        :param ordenadas: True se 'palavras' já vier em ordem crescente; caso contrário é ordenado aqui
+        :param pesos: Dicionário opcional palavra -> peso
+        :param parametros: Repassados ao construtor (ranqueada, indice_correcao, ...)
+        """
+        trie = cls(**parametros)
+        if not ordenadas:
+            palavras = sorted(palavras)
+
+        coletor_ativo = gc.isenabled()
+        gc.disable()
+        try:
+            trie._carregar_ordenadas(palavras, pesos)
+        finally:
+            if coletor_ativo:
+                gc.enable()
+        return trie
+
+    def _carregar_ordenadas(self, palavras, pesos: dict):
+        """
+        Passada única de from_iterable sobre as palavras já ordenadas (Trie vazia).
+        """
+        caminho = [self.raiz]
+        anterior = None
+        for palavra in palavras:
+            comum = 0
+            if anterior is not None:
+                if palavra <= anterior:
+                    if palavra == anterior:
+                        continue
+                    raise ValueError(f"Palavras fora de ordem: '{anterior}' antes de '{palavra}'.")
+                limite = min(len(palavra), len(anterior))
+                while comum < limite and palavra[comum] == anterior[comum]:
+                    comum += 1
+                # Fecha os nós da palavra anterior que não são prefixo da atual
+                while len(caminho) > comum + 1:
+                    no = caminho.pop()
+                    if self.ranqueada:
+                        self._recalcular_cache(no, anterior[:len(caminho)])
 
-    def inserir_palavra(self, palavra: str):
+            no_atual = caminho[-1]
+            for caractere in palavra[comum:]:
+                novo = NoTrie()
+                no_atual.filhos[caractere] = novo
+                caminho.append(novo)
+                no_atual = novo
+            no_atual.fim_de_palavra = True
+            if pesos:
+                no_atual.peso = pesos.get(palavra, 0)
+            self.palavras_inseridas.append(palavra)
+            if self.indice_correcao is not None:
+                self.indice_correcao.adicionar(palavra)
+            anterior = palavra
+
+        if self.ranqueada:
+            while caminho:
+                no = caminho.pop()
+                self._recalcular_cache(no, anterior[:len(caminho)] if anterior is not None else "")
+
+    def inserir_palavra(self, palavra: str, peso: float = 0):
         """
         Insere uma palavra na Trie.
+        'peso' (ex.: popularidade) ordena as sugestões no modo ranqueado.
+        Palavras já inseridas são ignoradas.
         """
         no_atual = self.raiz
+        caminho = [no_atual]
         for caractere in palavra:
             if caractere not in no_atual.filhos:
                 no_atual.filhos[caractere] = NoTrie()
+                if self.ranqueada:
+                    no_atual.filhos[caractere].melhores = []
             no_atual = no_atual.filhos[caractere]
+            caminho.append(no_atual)
+
+        if no_atual.fim_de_palavra:
+            return
         no_atual.fim_de_palavra = True
+        no_atual.peso = peso
+
+        if self.ranqueada:
+            # A nova palavra pode entrar no cache de cada nó do caminho: O(profundidade * k)
+            for no in caminho:
+                self._incluir_no_cache(no, palavra, peso)
         
         # Se quisermos usar na correção aproximada
         self.palavras_inseridas.append(palavra)
+        if self.indice_correcao is not None:
+            self.indice_correcao.adicionar(palavra)
+        if self.cache_autocompletar is not None:
+            self._invalidar_caches(palavra)
+
+    def _invalidar_caches(self, palavra: str, somente_autocompletar: bool = False):
+        """
+        Remove dos caches só os resultados que a chegada (ou mudança de peso)
+        de 'palavra' pode alterar:
+          - autocompletar: as consultas feitas com algum prefixo da palavra;
+          - correção: as consultas para as quais a palavra está a uma distância
+            que a colocaria entre as sugestões guardadas.
+        """
+        for tamanho in range(len(palavra) + 1):
+            self.cache_autocompletar.invalidar_consulta(palavra[:tamanho])
+
+        if somente_autocompletar:
+            return
+        # A distância é pelo menos a diferença de tamanhos: grupos cujo limiar não
+        # a cobre são pulados sem examinar nenhuma entrada
+        for (tamanho_consulta, limiar), chaves in list(self.cache_correcao.chaves_por_grupo.items()):
+            if limiar is not None and abs(tamanho_consulta - len(palavra)) > limiar:
+                continue
+            for chave in list(chaves):
+                if limiar is None or distancia_levenshtein_limitada(chave[0], palavra, limiar) <= limiar:
+                    self.cache_correcao.invalidar(chave)
+
+    def estatisticas_cache(self) -> dict:
+        """
+        Acertos, falhas e ocupação dos caches de consultas, para dimensioná-los.
+        """
+        if self.cache_autocompletar is None:
+            return {}
+        return {"autocompletar": self.cache_autocompletar.estatisticas(),
+                "correcao": self.cache_correcao.estatisticas()}
+
+    def _incluir_no_cache(self, no: NoTrie, palavra: str, peso: float):
+        """
+        Insere (peso, palavra) na lista de melhores conclusões do nó, mantendo-a
+        ordenada por peso decrescente e com no máximo 'tamanho_cache' itens.
+        Em empate de peso, a palavra mais antiga fica na frente.
+        """
+        melhores = no.melhores
+        if len(melhores) >= self.tamanho_cache and peso <= melhores[-1][0]:
+            return
+        posicao = len(melhores)
+        while posicao > 0 and melhores[posicao - 1][0] < peso:
+            posicao -= 1
+        melhores.insert(posicao, (peso, palavra))
+        del melhores[self.tamanho_cache:]
+
+    def _recalcular_cache(self, no: NoTrie, prefixo: str):
+        """
+        Refaz a lista de melhores conclusões do nó a partir das listas dos filhos.
+        'prefixo' é a palavra que termina neste nó, caso ele seja fim de palavra.
+        """
+        candidatas = [(no.peso, prefixo)] if no.fim_de_palavra else []
+        for filho in no.filhos.values():
+            candidatas.extend(filho.melhores)
+        no.melhores = nlargest(self.tamanho_cache, candidatas, key=itemgetter(0))
+
+    def pontuacao(self, palavra: str) -> float:
+        """
+        Retorna a pontuação (peso) atual da palavra, ou None se ela não estiver na Trie.
+        """
+        no = self.buscar_no_prefixo(palavra)
+        if no is None or not no.fim_de_palavra:
+            return None
+        return no.peso
+
+    def incrementar_pontuacao(self, palavra: str, incremento: float = 1) -> float:
+        """
+        Soma 'incremento' à pontuação da palavra (ex.: um clique do usuário na sugestão)
+        e retorna a nova pontuação.
+        No modo ranqueado, um incremento positivo atualiza só os caches do caminho
+        da palavra, em O(profundidade * k). Um incremento negativo pode tirar a palavra
+        do cache, então cada nó do caminho é recalculado a partir dos filhos.
+        """
+        no_atual = self.raiz
+        caminho = [no_atual]
+        for caractere in palavra:
+            no_atual = no_atual.filhos.get(caractere)
+            if no_atual is None:
+                break
+            caminho.append(no_atual)
+        if no_atual is None or not no_atual.fim_de_palavra:
+            raise KeyError(f"Palavra '{palavra}' não está na Trie.")
+
+        no_atual.peso += incremento
+        nova = no_atual.peso
+        if not self.ranqueada or incremento == 0:
+            return nova
+        if self.cache_autocompletar is not None:
+            self._invalidar_caches(palavra, somente_autocompletar=True)
+
+        if incremento > 0:
+            for no in caminho:
+                melhores = no.melhores
+                for i, (_, existente) in enumerate(melhores):
+                    if existente == palavra:
+                        del melhores[i]
+                        break
+                self._incluir_no_cache(no, palavra, nova)
+        else:
+            # De baixo para cima: cada nó usa os caches já corrigidos dos filhos
+            for profundidade in range(len(palavra), -1, -1):
+                self._recalcular_cache(caminho[profundidade], palavra[:profundidade])
+        return nova
 
     def buscar_no_prefixo(self, prefixo: str) -> NoTrie:
         """
@@ -33,49 +274,203 @@ class Trie:
             no_atual = no_atual.filhos[caractere]
         return no_atual
 
-    def _coletar_palavras(self, no: NoTrie, prefixo: str, resultados: list):
+    def iter_prefixo(self, prefixo: str = "", ordem: str = "lexicografica"):
         """
-        Percorre recursivamente a Trie a partir de 'no', 
-        coletando palavras que começam com 'prefixo' no array 'resultados'.
+        Gera, sob demanda, as palavras que iniciam com o 'prefixo'.
+
+        :param ordem: "lexicografica" (ordem dos caracteres), "insercao" (filhos na
+                      ordem em que foram criados) ou "pontuacao" (maior peso primeiro;
+                      exige o modo ranqueado)
+
+        Nas duas primeiras ordens o percurso usa uma pilha explícita de iteradores
+        (sem recursão, então chaves longas como URLs não esbarram no limite de
+        recursão do Python) e um único buffer de caracteres: memória extra
+        proporcional à profundidade, e cada palavra é montada uma vez, ao ser gerada.
+        Na ordem por pontuação, uma fila de prioridade guarda a fronteira da busca,
+        usando o maior peso de cada subárvore (o primeiro do cache do nó) como chave.
+        A Trie não deve ser alterada enquanto o gerador estiver em uso.
         """
-        # Se este nó representa o final de uma palavra
-        if no.fim_de_palavra:
-            resultados.append(prefixo)
+        if ordem not in ("lexicografica", "insercao", "pontuacao"):
+            raise ValueError(f"Ordem desconhecida: {ordem}.")
+        no_prefixo = self.buscar_no_prefixo(prefixo)
+        if no_prefixo is None:
+            return
+        if ordem == "pontuacao":
+            yield from self._iter_pontuacao(no_prefixo, prefixo)
+            return
 
-        # Para cada caractere filho, continuamos a busca
-        for caractere, proximo_no in no.filhos.items():
-            self._coletar_palavras(proximo_no, prefixo + caractere, resultados)
+        ordenar = ordem == "lexicografica"
+        if no_prefixo.fim_de_palavra:
+            yield prefixo
+        buffer = list(prefixo)
+        pilha = [iter(sorted(no_prefixo.filhos.items()) if ordenar else no_prefixo.filhos.items())]
+        while pilha:
+            for caractere, filho in pilha[-1]:
+                buffer.append(caractere)
+                if filho.fim_de_palavra:
+                    yield "".join(buffer)
+                pilha.append(iter(sorted(filho.filhos.items()) if ordenar else filho.filhos.items()))
+                break
+            else:
+                # Filhos esgotados: sobe um nível e tira do buffer o caractere que levou até aqui
+                pilha.pop()
+                if pilha:
+                    buffer.pop()
+
+    def _iter_pontuacao(self, no_prefixo: NoTrie, prefixo: str):
+        """
+        Busca do melhor primeiro: a fila guarda palavras (com o seu peso) e nós
+        (com o maior peso da subárvore); ao sair da fila, uma palavra é gerada e
+        um nó é expandido. Como a chave de um nó nunca é menor que a de nada
+        abaixo dele, as palavras saem em ordem decrescente de peso.
+        """
+        if not self.ranqueada:
+            raise ValueError("A ordem por pontuação exige Trie(ranqueada=True).")
+        if not no_prefixo.melhores:
+            return
+        desempate = 0
+        # (-peso, desempate, é_palavra, prefixo, nó)
+        fila = [(-no_prefixo.melhores[0][0], desempate, False, prefixo, no_prefixo)]
+        while fila:
+            _, _, eh_palavra, texto, no = heappop(fila)
+            if eh_palavra:
+                yield texto
+                continue
+            if no.fim_de_palavra:
+                desempate += 1
+                heappush(fila, (-no.peso, desempate, True, texto, None))
+            for caractere, filho in no.filhos.items():
+                if filho.melhores:
+                    desempate += 1
+                    heappush(fila, (-filho.melhores[0][0], desempate, False, texto + caractere, filho))
 
     def autocompletar(self, prefixo: str, limite_sugestoes: int = 5) -> list:
         """
         Retorna sugestões de palavras que iniciam com o 'prefixo'.
         O limite_sugestoes restringe quantas sugestões retornar (default=5).
+        No modo ranqueado, as sugestões vêm em ordem decrescente de peso.
         """
-        no_prefixo = self.buscar_no_prefixo(prefixo)
-        if not no_prefixo:
+        cache = self.cache_autocompletar
+        if cache is None:
+            return self._autocompletar(prefixo, limite_sugestoes)
+        chave = (prefixo, limite_sugestoes)
+        sugestoes = cache.obter(chave)
+        if sugestoes is None:
+            sugestoes = tuple(self._autocompletar(prefixo, limite_sugestoes))
+            cache.guardar(chave, sugestoes)
+        return list(sugestoes)
+
+    def _autocompletar(self, prefixo: str, limite_sugestoes: int) -> list:
+        if limite_sugestoes <= 0:
             return []
-        
-        resultados = []
-        self._coletar_palavras(no_prefixo, prefixo, resultados)
-        return resultados[:limite_sugestoes]  # Retorna somente até o limite
 
-    def corrigir_palavra(self, palavra_digitada: str, limite_sugestoes: int = 5) -> list:
+        if self.ranqueada:
+            if limite_sugestoes <= self.tamanho_cache:
+                # Resposta pronta no cache do nó: O(tamanho do prefixo + k)
+                no_prefixo = self.buscar_no_prefixo(prefixo)
+                if not no_prefixo:
+                    return []
+                return [palavra for _, palavra in no_prefixo.melhores[:limite_sugestoes]]
+            return list(islice(self.iter_prefixo(prefixo, "pontuacao"), limite_sugestoes))
+
+        # O gerador para assim que o limite é atingido
+        return list(islice(self.iter_prefixo(prefixo, "insercao"), limite_sugestoes))
+
+    def corrigir_palavra(self, palavra_digitada: str, limite_sugestoes: int = 5, max_distancia: int = None) -> list:
         """
         Retorna sugestões de palavras que tenham a menor distância de edição 
-        (Levenshtein) em relação a 'palavra_digitada'.
+        (Levenshtein) em relação a 'palavra_digitada', da menor para a maior.
+        Em empate, vale a ordem de percurso da Trie.
+
+        Em vez de calcular a distância para cada palavra inserida, percorre a Trie
+        levando uma linha da tabela de programação dinâmica por nó: palavras com
+        prefixo comum compartilham as linhas desse prefixo. Um ramo é podado quando
+        o menor valor da linha (limite inferior da distância de qualquer palavra
+        abaixo dele) passa de 'max_distancia' ou já não pode vencer as
+        'limite_sugestoes' melhores encontradas até agora.
+
+        Com indice_correcao, as candidatas vêm do índice sempre que ele cobre a
+        busca: quando 'max_distancia' está dentro do limite do índice, ou quando é
+        None e o índice já encontra 'limite_sugestoes' palavras (as demais estão
+        mais longe). Nesse caso, empates saem em ordem de inserção.
+
+        :param max_distancia: Distância máxima aceita; None aceita qualquer distância
         """
-        # Opcional: Se o conjunto de palavras for muito grande, métodos mais eficientes seriam utilizados.
-        distancias = []
-        for palavra in self.palavras_inseridas:
-            dist = distancia_levenshtein(palavra_digitada, palavra)
-            distancias.append((palavra, dist))
+        cache = self.cache_correcao
+        if cache is None:
+            return self._corrigir_palavra(palavra_digitada, limite_sugestoes, max_distancia)
+        chave = (palavra_digitada, limite_sugestoes, max_distancia)
+        guardado = cache.obter(chave)
+        if guardado is None:
+            sugestoes = self._corrigir_palavra(palavra_digitada, limite_sugestoes, max_distancia)
+            # Distância a partir da qual uma palavra nova não muda mais este resultado
+            if len(sugestoes) < limite_sugestoes:
+                limiar = max_distancia
+            else:
+                limiar = distancia_levenshtein_limitada(palavra_digitada, sugestoes[-1])
+            guardado = (tuple(sugestoes), limiar)
+            cache.guardar(chave, guardado)
+        return list(guardado[0])
 
-        # Ordena pela distância (menor primeiro) e pega as primeiras
-        distancias.sort(key=lambda x: x[1])
-        
-        # Se quiser só as que têm a menor distância absoluta, poderíamos filtrar, 
-        # mas aqui pegaremos até 'limite_sugestoes'
-        return [tupla[0] for tupla in distancias[:limite_sugestoes]]
+    def _corrigir_palavra(self, palavra_digitada: str, limite_sugestoes: int, max_distancia: int) -> list:
+        if limite_sugestoes <= 0:
+            return []
+
+        indice = self.indice_correcao
+        if indice is not None and (max_distancia is None or max_distancia <= indice.max_distancia):
+            candidatas = indice.candidatos(palavra_digitada, max_distancia)
+            if max_distancia is not None or len(candidatas) >= limite_sugestoes:
+                return [palavra for palavra, _ in candidatas[:limite_sugestoes]]
+
+        tamanho = len(palavra_digitada)
+        # Heap de máximo com as melhores sugestões: (-distância, -ordem, palavra)
+        melhores = []
+        ordem = [0]
+
+        def considerar(caracteres: list, distancia: int):
+            ordem[0] += 1
+            if len(melhores) < limite_sugestoes:
+                if max_distancia is None or distancia <= max_distancia:
+                    heappush(melhores, (-distancia, -ordem[0], "".join(caracteres)))
+            elif distancia < -melhores[0][0]:
+                heapreplace(melhores, (-distancia, -ordem[0], "".join(caracteres)))
+
+        def podar(menor_da_linha: int) -> bool:
+            if len(melhores) == limite_sugestoes:
+                # Só entra quem for estritamente melhor que a pior sugestão atual
+                return menor_da_linha >= -melhores[0][0]
+            return max_distancia is not None and menor_da_linha > max_distancia
+
+        if self.raiz.fim_de_palavra:
+            considerar([], tamanho)
+
+        # Percurso em profundidade com pilha explícita: cada quadro guarda o iterador
+        # dos filhos do nó e a linha da tabela do nó; 'buffer' é a palavra atual.
+        buffer = []
+        pilha = [] if podar(0) else [(iter(self.raiz.filhos.items()), list(range(tamanho + 1)))]
+        while pilha:
+            iterador, linha_anterior = pilha[-1]
+            for caractere, filho in iterador:
+                # Linha da tabela para 'buffer + caractere' contra 'palavra_digitada'
+                linha = [linha_anterior[0] + 1]
+                for j in range(1, tamanho + 1):
+                    custo_substituicao = 0 if palavra_digitada[j - 1] == caractere else 1
+                    linha.append(min(linha[j - 1] + 1,                       # Inserção
+                                     linha_anterior[j] + 1,                  # Remoção
+                                     linha_anterior[j - 1] + custo_substituicao))  # Substituição
+                buffer.append(caractere)
+                if filho.fim_de_palavra:
+                    considerar(buffer, linha[-1])
+                if filho.filhos and not podar(min(linha)):
+                    pilha.append((iter(filho.filhos.items()), linha))
+                    break
+                buffer.pop()
+            else:
+                pilha.pop()
+                if pilha:
+                    buffer.pop()
+
+        return [palavra for _, _, palavra in sorted(melhores, reverse=True)]
 
 def distancia_levenshtein(str1: str, str2: str) -> int:
     """
@@ -150,5 +545,16 @@ def main():
     correcoes = trie_livros.corrigir_palavra(palavra_incorreta, limite_sugestoes=5)
     print(f"Palavra digitada incorretamente: '{palavra_incorreta}' -> Sugestões: {correcoes}")
 
+    print("\n== AUTOCOMPLETAR POR POPULARIDADE ==")
+    trie_ranqueada = Trie(ranqueada=True, tamanho_cache=3)
+    for titulo in lista_livros:
+        trie_ranqueada.inserir_palavra(titulo)
+    # Cliques dos usuários nas sugestões
+    for titulo, cliques in [("hamlet", 5), ("hunger games", 3), ("harry potter", 1)]:
+        trie_ranqueada.incrementar_pontuacao(titulo, cliques)
+    prefixo = "h"
+    sugestoes = trie_ranqueada.autocompletar(prefixo, limite_sugestoes=3)
+    print(f"Prefixo digitado: '{prefixo}' -> Sugestões: {sugestoes}")
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,189 @@
+import gc
+import os
+import sys
+from array import array
+from bisect import bisect_left
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Comum"))
+
+from Snapshot import salvar_colunas, mapear_colunas
+
+
+class TrieCongelada:
+    """
+    Versão imutável da Trie: um autômato acíclico mínimo (DAWG), em que
+    subárvores iguais (mesmos sufixos) são guardadas uma única vez.
+
+    O autômato fica em quatro arrays de inteiros:
+      inicio_arcos[e] .. inicio_arcos[e + 1]  -> arcos que saem do estado e
+      rotulos[a]  -> caractere (code point) do arco a, em ordem crescente por estado
+      destinos[a] -> estado para onde o arco a leva
+      finais[e]   -> 1 se o estado e termina uma palavra
+
+    Os arrays podem ser gravados num arquivo (salvar) e abertos com mmap
+    (carregar): a abertura não lê o arquivo, e vários processos que abrem
+    o mesmo arquivo compartilham a mesma memória.
+    """
+
+    def __init__(self, inicio_arcos, rotulos, destinos, finais, raiz: int, quantidade: int):
+        """
+        :param inicio_arcos, rotulos, destinos, finais: arrays (ou memoryviews) descritos acima
+        :param raiz: Estado inicial
+        :param quantidade: Número de palavras reconhecidas
+        """
+        self.inicio_arcos = inicio_arcos
+        self.rotulos = rotulos
+        self.destinos = destinos
+        self.finais = finais
+        self.raiz = raiz
+        self.quantidade = quantidade
+
+    @classmethod
+    def congelar(cls, trie) -> "TrieCongelada":
+        """
+        Converte uma Trie já construída no autômato mínimo equivalente.
+        Os nós são visitados em pós-ordem (com pilha explícita) e cada um vira
+        o estado identificado pela sua assinatura (fim de palavra, arcos para os
+        estados dos filhos); nós com a mesma assinatura compartilham o estado.
+        Como em Trie.from_iterable, o coletor de lixo cíclico fica pausado enquanto
+        as assinaturas (tuplas, sem ciclos) são criadas.
+        """
+        coletor_ativo = gc.isenabled()
+        gc.disable()
+        try:
+            return cls._congelar(trie)
+        finally:
+            if coletor_ativo:
+                gc.enable()
+
+    @classmethod
+    def _congelar(cls, trie) -> "TrieCongelada":
+        registro = {}
+        assinaturas = []
+        quantidade = 0
+        raiz = 0
+        # Cada quadro: [nó, filhos ordenados, próximo filho a visitar, arcos já resolvidos]
+        pilha = [[trie.raiz, sorted(trie.raiz.filhos.items()), 0, []]]
+        while pilha:
+            quadro = pilha[-1]
+            no, filhos, proximo, arcos = quadro
+            if proximo < len(filhos):
+                quadro[2] += 1
+                filho = filhos[proximo][1]
+                pilha.append([filho, sorted(filho.filhos.items()), 0, []])
+                continue
+
+            pilha.pop()
+            if no.fim_de_palavra:
+                quantidade += 1
+            assinatura = (no.fim_de_palavra, tuple(arcos))
+            estado = registro.get(assinatura)
+            if estado is None:
+                estado = len(assinaturas)
+                registro[assinatura] = estado
+                assinaturas.append(assinatura)
+            if pilha:
+                pai = pilha[-1]
+                pai[3].append((ord(pai[1][pai[2] - 1][0]), estado))
+            else:
+                raiz = estado
+
+        inicio_arcos = array("i", [0])
+        rotulos = array("i")
+        destinos = array("i")
+        finais = array("B")
+        for fim_de_palavra, arcos in assinaturas:
+            for rotulo, destino in arcos:
+                rotulos.append(rotulo)
+                destinos.append(destino)
+            inicio_arcos.append(len(rotulos))
+            finais.append(1 if fim_de_palavra else 0)
+        return cls(inicio_arcos, rotulos, destinos, finais, raiz, quantidade)
+
+    def salvar(self, caminho: str):
+        """
+        Grava o autômato no formato de colunas do Snapshot.
+        """
+        colunas = {"inicio_arcos": self.inicio_arcos, "rotulos": self.rotulos,
+                   "destinos": self.destinos, "finais": self.finais}
+        for nome, coluna in colunas.items():
+            if not isinstance(coluna, array):
+                # Aberto com carregar: copia a memoryview para um array
+                colunas[nome] = array(coluna.format)
+                colunas[nome].frombytes(coluna.cast("B"))
+        salvar_colunas(caminho, {"raiz": self.raiz, "quantidade": self.quantidade}, colunas)
+
+    @classmethod
+    def carregar(cls, caminho: str) -> "TrieCongelada":
+        """
+        Abre um autômato gravado por salvar. Nada é copiado: os arrays são
+        memoryviews somente leitura sobre o arquivo mapeado em memória.
+        """
+        metadados, colunas = mapear_colunas(caminho)
+        return cls(colunas["inicio_arcos"], colunas["rotulos"], colunas["destinos"],
+                   colunas["finais"], metadados["raiz"], metadados["quantidade"])
+
+    def _transicao(self, estado: int, caractere: str) -> int:
+        """
+        Busca binária do arco rotulado com 'caractere'. Retorna o estado destino ou -1.
+        """
+        inicio = self.inicio_arcos[estado]
+        fim = self.inicio_arcos[estado + 1]
+        codigo = ord(caractere)
+        arco = bisect_left(self.rotulos, codigo, inicio, fim)
+        if arco < fim and self.rotulos[arco] == codigo:
+            return self.destinos[arco]
+        return -1
+
+    def buscar_no_prefixo(self, prefixo: str) -> int:
+        """
+        Retorna o estado alcançado lendo o 'prefixo', ou None se não existir.
+        """
+        estado = self.raiz
+        for caractere in prefixo:
+            estado = self._transicao(estado, caractere)
+            if estado < 0:
+                return None
+        return estado
+
+    def autocompletar(self, prefixo: str, limite_sugestoes: int = 5) -> list:
+        """
+        Retorna até 'limite_sugestoes' palavras que iniciam com o 'prefixo',
+        em ordem lexicográfica (por code point).
+        """
+        estado = self.buscar_no_prefixo(prefixo)
+        if estado is None or limite_sugestoes <= 0:
+            return []
+
+        inicio_arcos, rotulos, destinos, finais = self.inicio_arcos, self.rotulos, self.destinos, self.finais
+        resultados = []
+        if finais[estado]:
+            resultados.append(prefixo)
+        # Pilhas paralelas: próximo arco e último arco de cada estado aberto, e o
+        # caractere que levou até ele. A palavra atual é prefixo + caracteres.
+        proximos = [inicio_arcos[estado]]
+        fins = [inicio_arcos[estado + 1]]
+        caracteres = []
+        while proximos and len(resultados) < limite_sugestoes:
+            arco = proximos[-1]
+            if arco == fins[-1]:
+                proximos.pop()
+                fins.pop()
+                if caracteres:
+                    caracteres.pop()
+                continue
+            proximos[-1] = arco + 1
+            destino = destinos[arco]
+            caracteres.append(chr(rotulos[arco]))
+            if finais[destino]:
+                resultados.append(prefixo + "".join(caracteres))
+            proximos.append(inicio_arcos[destino])
+            fins.append(inicio_arcos[destino + 1])
+        return resultados
+
+    def __contains__(self, palavra: str) -> bool:
+        estado = self.buscar_no_prefixo(palavra)
+        return estado is not None and self.finais[estado] == 1
+
+    def __len__(self) -> int:
+        return self.quantidade
@@ -0,0 +1,81 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from Estrutura_Trie import Trie
+from Estrutura_Trie_Congelada import TrieCongelada
+
+
+def _construir_fragmento(palavras_ordenadas: list) -> TrieCongelada:
+    """
+    Executado em cada processo: monta a Trie do fragmento com a carga em lote e
+    devolve a versão congelada, que é só um punhado de arrays e volta ao processo
+    principal sem precisar serializar milhões de nós.
+    """
+    return TrieCongelada.congelar(Trie.from_iterable(palavras_ordenadas, ordenadas=True))
+
+
+class TrieFragmentada:
+    """
+    Roteador de consultas sobre fragmentos congelados, um por primeiro caractere
+    das palavras. Cada consulta por prefixo vai direto ao fragmento do seu primeiro
+    caractere; só o prefixo vazio percorre os fragmentos, em ordem.
+    """
+
+    def __init__(self, fragmentos: dict):
+        """
+        :param fragmentos: Dicionário primeiro caractere -> TrieCongelada
+                           ("" guarda a palavra vazia, se houver)
+        """
+        self.fragmentos = dict(sorted(fragmentos.items()))
+
+    @classmethod
+    def construir(cls, palavras, processos: int = None, ordenadas: bool = False) -> "TrieFragmentada":
+        """
+        Ordena as palavras (se preciso), separa-as pelo primeiro caractere e
+        constrói os fragmentos em paralelo num pool de processos.
+
+        :param processos: Tamanho do pool; None usa os.cpu_count(), 1 constrói tudo no processo atual
+        :param ordenadas: True se 'palavras' já vier em ordem crescente
+        """
+        if not ordenadas:
+            palavras = sorted(palavras)
+        grupos = {}
+        for palavra in palavras:
+            grupos.setdefault(palavra[:1], []).append(palavra)
+
+        processos = processos or os.cpu_count() or 1
+        if processos == 1 or len(grupos) == 1:
+            return cls({inicial: _construir_fragmento(grupo) for inicial, grupo in grupos.items()})
+
+        # Os maiores grupos vão primeiro, para equilibrar a carga entre os processos
+        iniciais = sorted(grupos, key=lambda inicial: len(grupos[inicial]), reverse=True)
+        with ProcessPoolExecutor(max_workers=processos) as pool:
+            fragmentos = pool.map(_construir_fragmento, [grupos[inicial] for inicial in iniciais])
+            return cls(dict(zip(iniciais, fragmentos)))
+
+    def buscar_fragmento(self, prefixo: str) -> TrieCongelada:
+        """
+        Retorna o fragmento responsável pelo 'prefixo' (não vazio), ou None.
+        """
+        return self.fragmentos.get(prefixo[:1])
+
+    def autocompletar(self, prefixo: str, limite_sugestoes: int = 5) -> list:
+        """
+        Retorna até 'limite_sugestoes' palavras que iniciam com o 'prefixo', em ordem lexicográfica.
+        """
+        if prefixo:
+            fragmento = self.buscar_fragmento(prefixo)
+            return fragmento.autocompletar(prefixo, limite_sugestoes) if fragmento is not None else []
+        sugestoes = []
+        for fragmento in self.fragmentos.values():
+            if len(sugestoes) >= limite_sugestoes:
+                break
+            sugestoes.extend(fragmento.autocompletar("", limite_sugestoes - len(sugestoes)))
+        return sugestoes
+
+    def __contains__(self, palavra: str) -> bool:
+        fragmento = self.fragmentos.get(palavra[:1])
+        return fragmento is not None and palavra in fragmento
+
+    def __len__(self) -> int:
+        return sum(len(fragmento) for fragmento in self.fragmentos.values())
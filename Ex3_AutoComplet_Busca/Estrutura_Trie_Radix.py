@@ -0,0 +1,147 @@
+from Distancia_Levenshtein import distancias_em_lote
+
+
+class NoRadix:
+    """
+    Nó da Trie compactada (radix/Patricia): cadeias de nós com um único filho
+    viram um só nó, e o trecho de texto correspondente fica no 'rotulo' da aresta
+    que chega até ele.
+    """
+    __slots__ = ("rotulo", "filhos", "fim_de_palavra")
+
+    def __init__(self, rotulo: str = ""):
+        self.rotulo = rotulo
+        # primeiro caractere do rótulo do filho -> filho. Folhas ficam com None
+        # para não alocar um dicionário vazio por palavra.
+        self.filhos = None
+        self.fim_de_palavra = False
+
+
+class TrieRadix:
+    """
+    Trie compactada com a mesma interface de consulta da Trie
+    (inserir_palavra, buscar_no_prefixo, autocompletar, corrigir_palavra).
+    Não guarda uma lista paralela com as palavras: elas são reconstruídas
+    percorrendo a árvore.
+    """
+
+    def __init__(self):
+        self.raiz = NoRadix()
+        self.quantidade = 0
+
+    def inserir_palavra(self, palavra: str):
+        """
+        Insere uma palavra, dividindo a aresta onde ela diverge de uma palavra já existente.
+        Palavras já inseridas são ignoradas.
+        """
+        no_atual = self.raiz
+        i = 0
+        while i < len(palavra):
+            filhos = no_atual.filhos
+            filho = filhos.get(palavra[i]) if filhos else None
+            if filho is None:
+                # Nenhuma aresta começa com este caractere: o resto da palavra vira uma folha
+                folha = NoRadix(palavra[i:])
+                folha.fim_de_palavra = True
+                if filhos is None:
+                    no_atual.filhos = {}
+                no_atual.filhos[palavra[i]] = folha
+                self.quantidade += 1
+                return
+
+            rotulo = filho.rotulo
+            if palavra.startswith(rotulo, i):
+                no_atual = filho
+                i += len(rotulo)
+                continue
+
+            # A palavra diverge no meio do rótulo: a aresta é dividida em duas
+            comum = 1
+            limite = min(len(rotulo), len(palavra) - i)
+            while comum < limite and rotulo[comum] == palavra[i + comum]:
+                comum += 1
+            meio = NoRadix(rotulo[:comum])
+            filho.rotulo = rotulo[comum:]
+            meio.filhos = {filho.rotulo[0]: filho}
+            no_atual.filhos[palavra[i]] = meio
+            no_atual = meio
+            i += comum
+
+        if not no_atual.fim_de_palavra:
+            no_atual.fim_de_palavra = True
+            self.quantidade += 1
+
+    def _localizar(self, prefixo: str):
+        """
+        Retorna (no, caminho): o primeiro nó cujo caminho a partir da raiz começa
+        com 'prefixo' e o texto completo desse caminho (que pode ir além do prefixo,
+        quando ele termina no meio de um rótulo). Retorna (None, None) se não existir.
+        """
+        no_atual = self.raiz
+        i = 0
+        while i < len(prefixo):
+            filhos = no_atual.filhos
+            filho = filhos.get(prefixo[i]) if filhos else None
+            if filho is None:
+                return None, None
+            rotulo = filho.rotulo
+            restante = len(prefixo) - i
+            if restante <= len(rotulo):
+                if rotulo.startswith(prefixo[i:]):
+                    return filho, prefixo[:i] + rotulo
+                return None, None
+            if not prefixo.startswith(rotulo, i):
+                return None, None
+            no_atual = filho
+            i += len(rotulo)
+        return no_atual, prefixo
+
+    def buscar_no_prefixo(self, prefixo: str) -> NoRadix:
+        """
+        Retorna o nó onde o 'prefixo' termina (ou o nó da aresta que o contém), ou None se não existir.
+        """
+        return self._localizar(prefixo)[0]
+
+    def _coletar_palavras(self, no: NoRadix, caminho: str, resultados: list, limite: int = None) -> bool:
+        """
+        Percorre recursivamente a subárvore de 'no' (cujo texto é 'caminho'),
+        parando quando 'resultados' atinge 'limite' palavras.
+        """
+        if no.fim_de_palavra:
+            resultados.append(caminho)
+            if limite is not None and len(resultados) >= limite:
+                return True
+        if no.filhos:
+            for filho in no.filhos.values():
+                if self._coletar_palavras(filho, caminho + filho.rotulo, resultados, limite):
+                    return True
+        return False
+
+    def autocompletar(self, prefixo: str, limite_sugestoes: int = 5) -> list:
+        """
+        Retorna até 'limite_sugestoes' palavras que iniciam com o 'prefixo',
+        na mesma ordem da Trie não compactada.
+        """
+        no_prefixo, caminho = self._localizar(prefixo)
+        if no_prefixo is None or limite_sugestoes <= 0:
+            return []
+        resultados = []
+        self._coletar_palavras(no_prefixo, caminho, resultados, limite_sugestoes)
+        return resultados
+
+    def corrigir_palavra(self, palavra_digitada: str, limite_sugestoes: int = 5) -> list:
+        """
+        Retorna as palavras com menor distância de Levenshtein em relação a 'palavra_digitada'.
+        """
+        palavras = []
+        self._coletar_palavras(self.raiz, "", palavras)
+        distancias = list(zip(palavras, distancias_em_lote(palavra_digitada, palavras)))
+        distancias.sort(key=lambda x: x[1])
+        return [tupla[0] for tupla in distancias[:limite_sugestoes]]
+
+    def __contains__(self, palavra: str) -> bool:
+        no, caminho = self._localizar(palavra)
+        return no is not None and caminho == palavra and no.fim_de_palavra
+
+    def __len__(self) -> int:
+        return self.quantidade
@@ -0,0 +1,97 @@
+from Distancia_Levenshtein import distancias_em_lote
+
+
+class IndiceSymSpell:
+    """
+    Índice de deleções simétricas (SymSpell) para correção ortográfica.
+
+    Na inserção, cada palavra gera todas as variantes obtidas apagando até
+    'max_distancia' caracteres do seu prefixo de 'tamanho_prefixo' caracteres,
+    e cada variante aponta para a palavra. Na consulta, o mesmo é feito com a
+    palavra digitada: duas palavras a distância <= k sempre compartilham uma
+    variante, então só as palavras ligadas às variantes da consulta precisam
+    ter a distância calculada, em vez do dicionário inteiro.
+
+    Quanto maiores 'max_distancia' e 'tamanho_prefixo', mais variantes por
+    palavra (mais memória e construção mais lenta) e menos candidatas falsas
+    por consulta.
+    """
+
+    def __init__(self, max_distancia: int = 2, tamanho_prefixo: int = 7):
+        """
+        :param max_distancia: Maior distância de edição que o índice consegue responder
+        :param tamanho_prefixo: Quantos caracteres iniciais de cada palavra geram variantes
+        """
+        self.max_distancia = max_distancia
+        self.tamanho_prefixo = tamanho_prefixo
+        self.palavras = []
+        # variante -> id da palavra (int) ou lista de ids, quando mais de uma palavra a gera
+        self.delecoes = {}
+
+    def _variantes(self, palavra: str, max_distancia: int) -> set:
+        """
+        Prefixo da palavra e todas as formas obtidas apagando até 'max_distancia' caracteres dele.
+        """
+        chave = palavra[:self.tamanho_prefixo]
+        variantes = {chave}
+        fronteira = [chave]
+        for _ in range(max_distancia):
+            proxima = []
+            for variante in fronteira:
+                for i in range(len(variante)):
+                    delecao = variante[:i] + variante[i + 1:]
+                    if delecao not in variantes:
+                        variantes.add(delecao)
+                        proxima.append(delecao)
+            fronteira = proxima
+        return variantes
+
+    def adicionar(self, palavra: str):
+        """
+        Indexa uma palavra. Quem chama garante que ela ainda não foi indexada.
+        """
+        identificador = len(self.palavras)
+        self.palavras.append(palavra)
+        delecoes = self.delecoes
+        for variante in self._variantes(palavra, self.max_distancia):
+            existente = delecoes.get(variante)
+            if existente is None:
+                delecoes[variante] = identificador
+            elif type(existente) is int:
+                delecoes[variante] = [existente, identificador]
+            else:
+                existente.append(identificador)
+
+    def candidatos(self, consulta: str, max_distancia: int = None) -> list:
+        """
+        Retorna as tuplas (palavra, distancia) com distância de Levenshtein
+        <= 'max_distancia', da menor para a maior distância e, em empate,
+        na ordem de inserção.
+        Lança ValueError se 'max_distancia' passar do limite do índice.
+        """
+        if max_distancia is None:
+            max_distancia = self.max_distancia
+        if max_distancia > self.max_distancia:
+            raise ValueError(f"O índice responde até distância {self.max_distancia}, não {max_distancia}.")
+
+        identificadores = set()
+        delecoes = self.delecoes
+        for variante in self._variantes(consulta, max_distancia):
+            encontrado = delecoes.get(variante)
+            if encontrado is None:
+                continue
+            if type(encontrado) is int:
+                identificadores.add(encontrado)
+            else:
+                identificadores.update(encontrado)
+
+        identificadores = sorted(identificadores)
+        palavras = [self.palavras[identificador] for identificador in identificadores]
+        distancias = distancias_em_lote(consulta, palavras, max_distancia)
+        resultado = [(palavra, distancia) for palavra, distancia in zip(palavras, distancias)
+                     if distancia <= max_distancia]
+        resultado.sort(key=lambda x: x[1])
+        return resultado
+
+    def __len__(self) -> int:
+        return len(self.palavras)
@@ -0,0 +1,361 @@
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from Estrutura_Trie import Trie, distancia_levenshtein
+from Estrutura_Trie_Radix import TrieRadix
+from Estrutura_Trie_Congelada import TrieCongelada
+from Estrutura_Trie_Fragmentada import TrieFragmentada
+from Distancia_Levenshtein import distancia_levenshtein_limitada, distancias_em_lote
+from Indice_SymSpell import IndiceSymSpell
+
+
+SILABAS = ["ba", "ca", "da", "fe", "ga", "lo", "ma", "ne", "pi", "qu", "ra", "sa",
+           "te", "vi", "xo", "zu", "an", "er", "in", "or", "us", "ch", "lh", "nh"]
+
+
+def gerar_titulos(quantidade: int, semente: int = 0) -> list:
+    """
+    Gera 'quantidade' títulos distintos de 2 a 5 palavras sorteadas de um
+    vocabulário de palavras formadas por sílabas, para que haja prefixos em
+    comum como em um catálogo real.
+    """
+    gerador = random.Random(semente)
+    vocabulario = ["".join(gerador.choice(SILABAS) for _ in range(gerador.randint(2, 5)))
+                   for _ in range(5_000)]
+    titulos = set()
+    while len(titulos) < quantidade:
+        titulos.add(" ".join(gerador.choice(vocabulario) for _ in range(gerador.randint(2, 5))))
+    return list(titulos)
+
+
+def gerar_palavras(quantidade: int, semente: int = 0) -> list:
+    """
+    Gera 'quantidade' palavras distintas de 2 a 6 sílabas, como um dicionário.
+    """
+    gerador = random.Random(semente)
+    palavras = set()
+    while len(palavras) < quantidade:
+        palavras.add("".join(gerador.choice(SILABAS) for _ in range(gerador.randint(2, 6))))
+    return list(palavras)
+
+
+def gerar_erros(palavras: list, quantidade: int, edicoes: int = 2, semente: int = 2) -> list:
+    """
+    Sorteia palavras e aplica até 'edicoes' inserções, remoções ou trocas de letra.
+    """
+    gerador = random.Random(semente)
+    letras = "abcdefghijlmnopqrstuvxz"
+    consultas = []
+    for _ in range(quantidade):
+        palavra = gerador.choice(palavras)
+        for _ in range(gerador.randint(1, edicoes)):
+            posicao = gerador.randrange(len(palavra))
+            operacao = gerador.randrange(3)
+            if operacao == 0:
+                palavra = palavra[:posicao] + gerador.choice(letras) + palavra[posicao:]
+            elif operacao == 1 and len(palavra) > 1:
+                palavra = palavra[:posicao] + palavra[posicao + 1:]
+            else:
+                palavra = palavra[:posicao] + gerador.choice(letras) + palavra[posicao + 1:]
+        consultas.append(palavra)
+    return consultas
+
+
+def gerar_prefixos(titulos: list, quantidade: int, semente: int = 1) -> list:
+    """
+    Sorteia prefixos de 1 a 8 caracteres de títulos existentes.
+    """
+    gerador = random.Random(semente)
+    return [gerador.choice(titulos)[:gerador.randint(1, 8)] for _ in range(quantidade)]
+
+
+def construir(classe_trie, titulos: list):
+    trie = classe_trie()
+    for titulo in titulos:
+        trie.inserir_palavra(titulo)
+    return trie
+
+
+def benchmark_radix(quantidade: int = 200_000, consultas: int = 20_000):
+    """
+    Compara a Trie com um nó por caractere e a TrieRadix compactada:
+    memória por título (tracemalloc), tempo de construção e latência do autocompletar.
+    """
+    print(f"\n=== Trie x TrieRadix com {quantidade} títulos ===")
+    titulos = gerar_titulos(quantidade)
+    prefixos = gerar_prefixos(titulos, consultas)
+    memoria = {}
+    respostas = {}
+    for classe_trie in (Trie, TrieRadix):
+        tracemalloc.start()
+        t0 = time.time()
+        trie = construir(classe_trie, titulos)
+        t1 = time.time()
+        memoria[classe_trie.__name__] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        t2 = time.perf_counter()
+        respostas[classe_trie.__name__] = [trie.autocompletar(prefixo, 5) for prefixo in prefixos]
+        t3 = time.perf_counter()
+        print(f"{classe_trie.__name__:<10} {memoria[classe_trie.__name__] / quantidade:8.1f} bytes/título "
+              f"construção {t1 - t0:6.2f}s  autocompletar {(t3 - t2) / consultas * 1e6:6.1f} µs/consulta")
+        del trie
+
+    assert respostas["Trie"] == respostas["TrieRadix"]
+    print(f"Redução de memória: {memoria['Trie'] / memoria['TrieRadix']:.1f}x")
+
+
+def benchmark_congelada(quantidade: int = 200_000, consultas: int = 20_000):
+    """
+    Compara reconstruir a Trie na partida do processo com abrir a TrieCongelada
+    gravada em arquivo (mmap), e a latência do autocompletar nas duas.
+    """
+    print(f"\n=== Trie x TrieCongelada com {quantidade} títulos ===")
+    titulos = gerar_titulos(quantidade)
+    prefixos = gerar_prefixos(titulos, consultas)
+
+    t0 = time.perf_counter()
+    trie = construir(Trie, titulos)
+    t1 = time.perf_counter()
+    congelada = TrieCongelada.congelar(trie)
+    t2 = time.perf_counter()
+    print(f"Construção da Trie: {t1 - t0:.2f}s   congelamento: {t2 - t1:.2f}s   "
+          f"estados: {len(congelada.finais)}   arcos: {len(congelada.rotulos)}")
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = os.path.join(diretorio, "titulos.dawg")
+        congelada.salvar(caminho)
+        t3 = time.perf_counter()
+        mapeada = TrieCongelada.carregar(caminho)
+        t4 = time.perf_counter()
+        print(f"Arquivo: {os.path.getsize(caminho) / 2**20:.1f} MiB "
+              f"({os.path.getsize(caminho) / quantidade:.1f} bytes/título)   abertura: {(t4 - t3) * 1e3:.2f} ms")
+
+        for nome, estrutura in (("Trie", trie), ("TrieCongelada", mapeada)):
+            t5 = time.perf_counter()
+            for prefixo in prefixos:
+                estrutura.autocompletar(prefixo, 5)
+            t6 = time.perf_counter()
+            print(f"{nome:<14} autocompletar {(t6 - t5) / consultas * 1e6:6.1f} µs/consulta")
+
+        assert all(titulo in mapeada for titulo in titulos[:1000])
+        del mapeada
+
+
+def corrigir_forca_bruta(trie: Trie, palavra_digitada: str, limite_sugestoes: int = 5) -> list:
+    """
+    Correção original: distância de Levenshtein contra cada palavra inserida e ordenação de todas.
+    """
+    distancias = [(palavra, distancia_levenshtein(palavra_digitada, palavra)) for palavra in trie.palavras_inseridas]
+    distancias.sort(key=lambda x: x[1])
+    return [tupla[0] for tupla in distancias[:limite_sugestoes]]
+
+
+def benchmark_correcao(quantidade: int = 20_000, consultas: int = 50):
+    """
+    Compara a correção por força bruta com o percurso da Trie levando a linha
+    da programação dinâmica, sem limite de distância e com max_distancia = 1 e 2.
+    """
+    print(f"\n=== Correção com {quantidade} palavras e {consultas} consultas ===")
+    palavras = gerar_palavras(quantidade)
+    erros = gerar_erros(palavras, consultas)
+    trie = construir(Trie, palavras)
+
+    t0 = time.perf_counter()
+    esperadas = [corrigir_forca_bruta(trie, erro) for erro in erros]
+    t1 = time.perf_counter()
+    base = (t1 - t0) / consultas
+    print(f"{'força bruta':<22} {base * 1e3:8.2f} ms/consulta")
+
+    for max_distancia in (None, 2, 1):
+        t2 = time.perf_counter()
+        obtidas = [trie.corrigir_palavra(erro, 5, max_distancia) for erro in erros]
+        t3 = time.perf_counter()
+        tempo = (t3 - t2) / consultas
+        print(f"{'percurso max=' + str(max_distancia):<22} {tempo * 1e3:8.2f} ms/consulta  ({base / tempo:.0f}x)")
+        for erro, esperada, obtida in zip(erros, esperadas, obtidas):
+            distancias = [distancia_levenshtein(erro, palavra) for palavra in esperada]
+            if max_distancia is not None:
+                distancias = [distancia for distancia in distancias if distancia <= max_distancia]
+            assert [distancia_levenshtein(erro, palavra) for palavra in obtida] == distancias
+
+
+def benchmark_levenshtein(pares: int = 2_000, limite: int = 2):
+    """
+    Compara, em µs por par, a distancia_levenshtein com tabela completa, a versão
+    limitada (Myers até 64 caracteres, faixa diagonal acima disso) e o lote,
+    para strings curtas, médias e longas.
+    """
+    print(f"\n=== Distância de Levenshtein, {pares} pares, limite={limite} ===")
+    gerador = random.Random(3)
+    for tamanho in (8, 40, 200):
+        palavras = ["".join(gerador.choice("abcdefghij") for _ in range(tamanho)) for _ in range(pares)]
+        # Metade dos pares com poucas edições, metade sem relação
+        consulta = palavras[0]
+        candidatas = [consulta[:i] + "x" + consulta[i + 1:] for i in range(0, tamanho, max(1, tamanho // 10))]
+        candidatas = (candidatas * (pares // 2 // len(candidatas) + 1))[:pares // 2] + palavras[:pares // 2]
+
+        medidas = {}
+        t0 = time.perf_counter()
+        completa = [distancia_levenshtein(consulta, candidata) for candidata in candidatas]
+        medidas["completa"] = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        limitada = [distancia_levenshtein_limitada(consulta, candidata, limite) for candidata in candidatas]
+        medidas["limitada"] = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        lote = distancias_em_lote(consulta, candidatas, limite)
+        medidas["lote"] = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        exata = distancias_em_lote(consulta, candidatas)
+        medidas["lote sem limite"] = time.perf_counter() - t0
+
+        assert limitada == lote == [min(distancia, limite + 1) for distancia in completa]
+        assert exata == completa
+        print(f"{tamanho:>4} caracteres: " + "  ".join(
+            f"{nome} {tempo / len(candidatas) * 1e6:8.2f} µs" for nome, tempo in medidas.items()))
+
+
+def memoria_indice(indice: IndiceSymSpell) -> int:
+    """
+    Bytes ocupados pelo índice (dicionário de variantes, chaves, listas de ids,
+    lista de palavras e os próprios ids), somados com sys.getsizeof.
+    """
+    total = sys.getsizeof(indice.delecoes) + sys.getsizeof(indice.palavras)
+    total += sum(sys.getsizeof(palavra) for palavra in indice.palavras)
+    # Cada id é um int criado uma vez por palavra e compartilhado pelas variantes
+    total += sys.getsizeof(len(indice.palavras)) * len(indice.palavras)
+    for variante, identificadores in indice.delecoes.items():
+        total += sys.getsizeof(variante)
+        if type(identificadores) is list:
+            total += sys.getsizeof(identificadores)
+    return total
+
+
+def benchmark_symspell(quantidade: int = 1_000_000, configuracoes=((1, 7), (2, 5), (2, 7)),
+                       consultas: int = 1_000, consultas_forca_bruta: int = 5):
+    """
+    Constrói o IndiceSymSpell sobre um dicionário de 'quantidade' palavras para cada
+    (max_distancia, tamanho_prefixo) e mede construção, memória e latência da
+    consulta, comparando com o cálculo em lote contra todas as palavras.
+    """
+    print(f"\n=== Índice SymSpell com {quantidade} palavras ===")
+    palavras = gerar_palavras(quantidade)
+    erros = gerar_erros(palavras, consultas, edicoes=1)
+
+    t0 = time.perf_counter()
+    for erro in erros[:consultas_forca_bruta]:
+        distancias = distancias_em_lote(erro, palavras, 1)
+        sorted(zip(distancias, palavras))[:5]
+    t1 = time.perf_counter()
+    print(f"força bruta em lote (d<=1): {(t1 - t0) / consultas_forca_bruta * 1e3:.1f} ms/consulta")
+
+    for max_distancia, tamanho_prefixo in configuracoes:
+        indice = IndiceSymSpell(max_distancia, tamanho_prefixo)
+        t0 = time.perf_counter()
+        for palavra in palavras:
+            indice.adicionar(palavra)
+        t1 = time.perf_counter()
+        for erro in erros:
+            indice.candidatos(erro)
+        t2 = time.perf_counter()
+        print(f"d={max_distancia} prefixo={tamanho_prefixo}: construção {t1 - t0:6.1f}s  "
+              f"variantes {len(indice.delecoes):>9}  memória {memoria_indice(indice) / 2**20:7.0f} MiB  "
+              f"consulta {(t2 - t1) / consultas * 1e3:6.3f} ms")
+        del indice
+
+
+def benchmark_cache(quantidade: int = 100_000, consultas: int = 50_000, capacidade: int = 2_000,
+                    proporcao_insercoes: float = 0.01):
+    """
+    Tráfego concentrado (lei de Zipf: poucos prefixos e erros respondem pela
+    maior parte das consultas), com algumas inserções no meio. Compara a Trie
+    sem cache e com o cache de consultas e mostra a taxa de acerto.
+    """
+    print(f"\n=== Cache de consultas: {consultas} consultas, capacidade {capacidade} ===")
+    titulos = gerar_titulos(quantidade)
+    novos = gerar_titulos(quantidade + int(consultas * proporcao_insercoes) + 1, semente=5)
+    prefixos = gerar_prefixos(titulos, 20_000)
+    erros = gerar_erros(titulos, 2_000)
+    gerador = random.Random(6)
+    pesos = [1 / posicao for posicao in range(1, len(prefixos) + 1)]
+    pesos_erros = [1 / posicao for posicao in range(1, len(erros) + 1)]
+    trafego = []
+    for _ in range(consultas):
+        sorteio = gerador.random()
+        if sorteio < proporcao_insercoes:
+            trafego.append(("inserir", novos.pop()))
+        elif sorteio < 0.9:
+            trafego.append(("autocompletar", gerador.choices(prefixos, pesos)[0]))
+        else:
+            trafego.append(("corrigir", gerador.choices(erros, pesos_erros)[0]))
+
+    for capacidade_cache in (0, capacidade):
+        trie = Trie(capacidade_cache_consultas=capacidade_cache)
+        for titulo in titulos:
+            trie.inserir_palavra(titulo)
+        t0 = time.perf_counter()
+        for operacao, texto in trafego:
+            if operacao == "inserir":
+                trie.inserir_palavra(texto)
+            elif operacao == "autocompletar":
+                trie.autocompletar(texto, 5)
+            else:
+                trie.corrigir_palavra(texto, 5, max_distancia=2)
+        t1 = time.perf_counter()
+        print(f"capacidade {capacidade_cache:>5}: {(t1 - t0) / consultas * 1e6:8.1f} µs/operação")
+        for nome, estatisticas in trie.estatisticas_cache().items():
+            print(f"    {nome:<14} acertos {estatisticas['taxa_acerto']:6.1%}  "
+                  f"invalidadas {estatisticas['invalidadas']:>6}  descartadas {estatisticas['descartadas']:>6}")
+
+
+def benchmark_construcao(quantidade: int = 500_000, processos: int = None):
+    """
+    Tempo para montar o índice de 'quantidade' títulos: uma inserção por título,
+    carga em lote (com e sem a ordenação incluída) e construção em fragmentos
+    congelados num pool de processos.
+    """
+    processos = processos or os.cpu_count()
+    print(f"\n=== Construção com {quantidade} títulos ({processos} processo(s)) ===")
+    titulos = gerar_titulos(quantidade)
+    ordenados = sorted(titulos)
+
+    t0 = time.perf_counter()
+    construir(Trie, titulos)
+    t1 = time.perf_counter()
+    print(f"{'inserir_palavra':<28} {t1 - t0:6.2f}s")
+
+    t0 = time.perf_counter()
+    Trie.from_iterable(titulos)
+    t1 = time.perf_counter()
+    print(f"{'from_iterable (ordena)':<28} {t1 - t0:6.2f}s")
+
+    t0 = time.perf_counter()
+    Trie.from_iterable(ordenados, ordenadas=True)
+    t1 = time.perf_counter()
+    print(f"{'from_iterable (já ordenado)':<28} {t1 - t0:6.2f}s")
+
+    for quantidade_processos in sorted({1, processos}):
+        t0 = time.perf_counter()
+        fragmentada = TrieFragmentada.construir(ordenados, processos=quantidade_processos, ordenadas=True)
+        t1 = time.perf_counter()
+        print(f"{'fragmentos, ' + str(quantidade_processos) + ' processo(s)':<28} {t1 - t0:6.2f}s  "
+              f"({len(fragmentada.fragmentos)} fragmentos)")
+    assert len(fragmentada) == quantidade
+
+
+def main():
+    benchmark_radix()
+    benchmark_congelada()
+    benchmark_correcao()
+    benchmark_levenshtein()
+    benchmark_symspell()
+    benchmark_cache()
+    benchmark_construcao()
+
+
+if __name__ == "__main__":
+    main()
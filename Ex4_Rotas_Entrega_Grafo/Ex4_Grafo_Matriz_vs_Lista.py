@@ -1,110 +1,118 @@
 import math
+import os
+import random
 import time
 import sys
+import tracemalloc
+from array import array
+from bisect import bisect_right
+from collections import deque
 
-# Mapeamento dos bairros para índices
-indice = {
-    'A': 0,
-    'B': 1,
-    'C': 2,
-    'D': 3,
-    'E': 4,
-    'F': 5
-}
-rotulo = {v: k for k, v in indice.items()}  # inverso, se precisar exibir
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Comum"))
 
-def construir_matriz_adjacencia_6():
+from GrafoCSR import GrafoCSR
+
+# Tabela de ruas entre os 6 bairros: (origem, destino, km)
+ARESTAS_BAIRROS = [
+    ('A', 'B', 4),
+    ('A', 'C', 2),
+    ('B', 'D', 5),
+    ('C', 'D', 8),
+    ('C', 'E', 3),
+    ('D', 'F', 6),
+    ('E', 'F', 1),
+]
+
+def carregar_grafo_bairros(caminho_arestas: str = None) -> GrafoCSR:
+    """
+    Carrega o grafo não direcionado dos bairros a partir de um CSV
+    (origem,destino,km) ou, sem arquivo, da tabela dos 6 bairros.
+    Os bairros recebem ids 0..n-1 na ordem em que aparecem (A=0, B=1, ...).
+    """
+    if caminho_arestas is not None:
+        return GrafoCSR.carregar_csv(caminho_arestas)
+    return GrafoCSR.from_arestas(ARESTAS_BAIRROS)
+
+def construir_matriz_adjacencia_6(grafo: GrafoCSR = None):
     """
-    Constrói a matriz de adjacência 6x6 de acordo com a tabela:
+    Constrói a matriz de adjacência de acordo com a tabela:
       A-B (4 km), A-C (2 km), B-D (5 km), C-D (8 km), C-E (3 km),
       D-F (6 km), E-F (1 km).
-    Para BFS, só importa 'existência' de aresta, mas vamos marcar
-    com peso=1 e inf para 'sem aresta'.
+    Cada célula guarda a distância em km, 0 na diagonal e inf para 'sem aresta'.
+    Para BFS, só importa 'existência' de aresta (célula != inf).
     """
-    n = 6
-    matriz = [[math.inf]*n for _ in range(n)]
-    
-    # Distância pra si mesmo = 0
-    for i in range(n):
-        matriz[i][i] = 0
-    
-    # Basta marcar que existe aresta quando a tabela diz que há conexão
-    # A->B (4 km) => como BFS não liga para pesos, poderíamos pôr 1. 
-    # Aqui farei peso=1 para "existe aresta".
-    
-    # A (0) - B (1)
-    matriz[0][1] = 1
-    matriz[1][0] = 1
-    
-    # A (0) - C (2)
-    matriz[0][2] = 1
-    matriz[2][0] = 1
-    
-    # B (1) - D (3)
-    matriz[1][3] = 1
-    matriz[3][1] = 1
-    
-    # C (2) - D (3)
-    matriz[2][3] = 1
-    matriz[3][2] = 1
-    
-    # C (2) - E (4)
-    matriz[2][4] = 1
-    matriz[4][2] = 1
-    
-    # D (3) - F (5)
-    matriz[3][5] = 1
-    matriz[5][3] = 1
-    
-    # E (4) - F (5)
-    matriz[4][5] = 1
-    matriz[5][4] = 1
-
-    return matriz
+    if grafo is None:
+        grafo = carregar_grafo_bairros()
+    return grafo.matriz_distancias()
 
-def construir_lista_adjacencia_6():
+def construir_lista_adjacencia_6(grafo: GrafoCSR = None):
     """
     Constrói a lista de adjacência equivalente, baseado na mesma tabela.
+    O GrafoCSR já é a lista de adjacência: grafo[u] devolve os vizinhos de u.
     """
-    n = 6
-    # Inicialmente, cada vértice sem vizinhos
-    lista_adj = [[] for _ in range(n)]
-    
-    # A->B, A->C
-    lista_adj[0].append(1)
-    lista_adj[1].append(0)
-    lista_adj[0].append(2)
-    lista_adj[2].append(0)
-    
-    # B->D
-    lista_adj[1].append(3)
-    lista_adj[3].append(1)
-    
-    # C->D, C->E
-    lista_adj[2].append(3)
-    lista_adj[3].append(2)
-    lista_adj[2].append(4)
-    lista_adj[4].append(2)
-    
-    # D->F
-    lista_adj[3].append(5)
-    lista_adj[5].append(3)
-    
-    # E->F
-    lista_adj[4].append(5)
-    lista_adj[5].append(4)
-    
-    return lista_adj
+    if grafo is None:
+        grafo = carregar_grafo_bairros()
+    return grafo
+
+class MatrizAdjacenciaBits:
+    """
+    Matriz de adjacência com 1 bit por célula: a linha u ocupa 'bytes_por_linha'
+    bytes consecutivos de um único bytearray, e o bit v da linha indica a aresta u-v.
+    Ocupa n²/8 bytes, contra 8 bytes por célula (mais o float) da lista de listas,
+    e uma linha inteira vira um int para a BFS operar sobre conjuntos de vértices.
+    """
+
+    def __init__(self, quantidade_vertices: int):
+        self.quantidade_vertices = quantidade_vertices
+        self.bytes_por_linha = (quantidade_vertices + 7) // 8
+        self.bits = bytearray(self.bytes_por_linha * quantidade_vertices)
+
+    @classmethod
+    def from_grafo(cls, grafo: GrafoCSR) -> "MatrizAdjacenciaBits":
+        """
+        Marca as arestas do grafo (em não direcionados, o CSR já traz os dois sentidos).
+        """
+        matriz = cls(len(grafo))
+        bits = matriz.bits
+        for u in range(len(grafo)):
+            base = u * matriz.bytes_por_linha
+            for v in grafo[u]:
+                bits[base + (v >> 3)] |= 1 << (v & 7)
+        return matriz
+
+    def adicionar_aresta(self, u: int, v: int):
+        self.bits[u * self.bytes_por_linha + (v >> 3)] |= 1 << (v & 7)
+
+    def existe_aresta(self, u: int, v: int) -> bool:
+        return bool(self.bits[u * self.bytes_por_linha + (v >> 3)] >> (v & 7) & 1)
+
+    def linha(self, u: int) -> int:
+        """
+        Linha u como inteiro: o bit v vale 1 se existe a aresta u-v.
+        """
+        inicio = u * self.bytes_por_linha
+        return int.from_bytes(self.bits[inicio:inicio + self.bytes_por_linha], "little")
+
+    def __len__(self) -> int:
+        return self.quantidade_vertices
+
+
+def construir_conjuntos_vizinhos(grafo: GrafoCSR) -> list:
+    """
+    Um set de vizinhos por vértice: consulta de aresta em O(1) esperado,
+    ao custo de uma tabela hash por vértice.
+    """
+    return [set(grafo[u]) for u in range(len(grafo))]
 
 def bfs_matriz_adjacencia(matriz, vertice_inicial):
     n = len(matriz)
     visitados = [False]*n
-    fila = [vertice_inicial]
+    fila = deque([vertice_inicial])
     visitados[vertice_inicial] = True
     resultado = []
 
     while fila:
-        u = fila.pop(0)
+        u = fila.popleft()
         resultado.append(u)
         for v in range(n):
             # Se houver aresta (matriz[u][v] != inf) e não foi visitado
@@ -113,15 +121,36 @@ def bfs_matriz_adjacencia(matriz, vertice_inicial):
                 fila.append(v)
     return resultado
 
+def bfs_matriz_bits(matriz: MatrizAdjacenciaBits, vertice_inicial):
+    """
+    BFS sobre a matriz de bits: os vizinhos ainda não visitados de u saem de uma
+    única operação 'linha(u) & nao_visitados', em vez de testar as n colunas.
+    Visita na mesma ordem de bfs_matriz_adjacencia (vizinhos em ordem crescente).
+    """
+    nao_visitados = ((1 << len(matriz)) - 1) ^ (1 << vertice_inicial)
+    fila = deque([vertice_inicial])
+    resultado = []
+
+    while fila:
+        u = fila.popleft()
+        resultado.append(u)
+        novos = matriz.linha(u) & nao_visitados
+        nao_visitados ^= novos
+        while novos:
+            menor = novos & -novos
+            fila.append(menor.bit_length() - 1)
+            novos ^= menor
+    return resultado
+
 def bfs_lista_adjacencia(lista_adj, vertice_inicial):
     n = len(lista_adj)
     visitados = [False]*n
-    fila = [vertice_inicial]
+    fila = deque([vertice_inicial])
     visitados[vertice_inicial] = True
     resultado = []
     
     while fila:
-        u = fila.pop(0)
+        u = fila.popleft()
         resultado.append(u)
         for v in lista_adj[u]:
             if not visitados[v]:
@@ -135,6 +164,29 @@ def existe_aresta_matriz(matriz, u, v):
 def existe_aresta_lista(lista_adj, u, v):
     return (v in lista_adj[u])
 
+def existe_aresta_conjuntos(conjuntos, u, v):
+    return (v in conjuntos[u])
+
+def medir_memoria(construtor, *args):
+    """
+    Executa construtor(*args) e retorna (objeto, bytes), onde bytes é o total
+    que continua alocado ao final (medido com tracemalloc), ou seja, o objeto
+    com tudo o que ele referencia, e não só o contêiner de topo do sys.getsizeof.
+    Se o tracemalloc já estiver ativo (medição externa), mede só a diferença
+    e deixa o rastreamento ligado; caso contrário, liga e desliga ao final.
+    """
+    ja_rastreando = tracemalloc.is_tracing()
+    if not ja_rastreando:
+        tracemalloc.start()
+    try:
+        antes = tracemalloc.get_traced_memory()[0]
+        objeto = construtor(*args)
+        memoria = tracemalloc.get_traced_memory()[0] - antes
+    finally:
+        if not ja_rastreando:
+            tracemalloc.stop()
+    return objeto, memoria
+
 def comparar_representacoes_tabela():
     """
     Constrói a matriz e a lista de adjacência para as 6 estações (A-F),
@@ -143,9 +195,10 @@ def comparar_representacoes_tabela():
     """
     print("\n=== COMPARANDO COM A TABELA DE 6 BAIRROS ===")
 
-    # Constrói matriz e lista
-    matriz = construir_matriz_adjacencia_6()
-    lista_adj = construir_lista_adjacencia_6()
+    # Constrói matriz e lista a partir do mesmo grafo
+    grafo = carregar_grafo_bairros()
+    matriz = construir_matriz_adjacencia_6(grafo)
+    lista_adj = construir_lista_adjacencia_6(grafo)
 
     # 1) Medir tempo de BFS em cada
     vertice_inicial = 0  # A
@@ -164,30 +217,112 @@ def comparar_representacoes_tabela():
     print(f"BFS na Lista  (inicial=A=0): tempo={tempo_bfs_lista:.6f}s, ordem visita={visita_lista}")
 
     # 2) Verificar aresta em alguns pares
+    conjuntos = construir_conjuntos_vizinhos(grafo)
+    matriz_bits = MatrizAdjacenciaBits.from_grafo(grafo)
     consultas = [(0,1), (0,5), (2,4), (3,5)]
     print("\n--- Teste de existência de aresta ---")
     for (x, y) in consultas:
         em = existe_aresta_matriz(matriz, x, y)
         el = existe_aresta_lista(lista_adj, x, y)
-        print(f"Aresta {rotulo[x]}-{rotulo[y]}? Matriz={em}, Lista={el}")
+        eb = matriz_bits.existe_aresta(x, y)
+        ec = existe_aresta_conjuntos(conjuntos, x, y)
+        print(f"Aresta {grafo.rotulo_de(x)}-{grafo.rotulo_de(y)}? Matriz={em}, Lista={el}, Bits={eb}, Conjuntos={ec}")
+
+    # 3) Comparação de uso de memória (objeto e tudo o que ele referencia)
+    _, memoria_matriz = medir_memoria(construir_matriz_adjacencia_6, grafo)
+    _, memoria_lista = medir_memoria(carregar_grafo_bairros)
+    _, memoria_bits = medir_memoria(MatrizAdjacenciaBits.from_grafo, grafo)
+    _, memoria_conjuntos = medir_memoria(construir_conjuntos_vizinhos, grafo)
+    print(f"\n--- Uso de memória ---")
+    print(f"Matriz:    ~{memoria_matriz} bytes")
+    print(f"Lista:     ~{memoria_lista} bytes")
+    print(f"Bits:      ~{memoria_bits} bytes")
+    print(f"Conjuntos: ~{memoria_conjuntos} bytes")
+
+def gerar_grafo_aleatorio(qtd_vertices: int, qtd_arestas: int, semente: int = 0) -> GrafoCSR:
+    """
+    Grafo não direcionado com 'qtd_arestas' arestas distintas sorteadas entre
+    'qtd_vertices' vértices, sem laços.
+    """
+    maximo = qtd_vertices * (qtd_vertices - 1) // 2
+    if qtd_arestas > maximo:
+        raise ValueError(f"Um grafo com {qtd_vertices} vértices tem no máximo {maximo} arestas.")
+    # Sorteia posições distintas do triângulo superior (u < v) e as converte em pares:
+    # a linha u começa na posição inicio_linha[u] e tem qtd_vertices - 1 - u pares
+    inicio_linha = [0] * qtd_vertices
+    for u in range(1, qtd_vertices):
+        inicio_linha[u] = inicio_linha[u - 1] + qtd_vertices - u
+    origens = array("q")
+    destinos = array("q")
+    for posicao in random.Random(semente).sample(range(maximo), qtd_arestas):
+        u = bisect_right(inicio_linha, posicao) - 1
+        origens.append(u)
+        destinos.append(u + 1 + posicao - inicio_linha[u])
+    return GrafoCSR.from_ids(origens, destinos, array("q", [1]) * qtd_arestas, qtd_vertices)
+
+def comparar_representacoes(qtd_vertices=2000, qtd_arestas=3000, qtd_consultas=10000, semente=0):
+    """
+    Compara matriz (lista de listas), matriz de bits, lista de adjacência (CSR)
+    e conjuntos de vizinhos num grafo aleatório: memória real de cada
+    representação, tempo de construção, BFS a partir do vértice 0 e
+    'qtd_consultas' consultas de existência de aresta.
+    A construção roda sob o tracemalloc, então seu tempo inclui o custo da medição.
+    """
+    print(f"\n=== {qtd_vertices} vértices, {qtd_arestas} arestas, {qtd_consultas} consultas ===")
+    t0 = time.time()
+    grafo = gerar_grafo_aleatorio(qtd_vertices, qtd_arestas, semente)
+    print(f"Geração do grafo: {time.time() - t0:.2f}s")
+
+    # Pares de vértices distintos (na matriz, a diagonal vale 0 e não representa aresta)
+    gerador = random.Random(semente + 1)
+    consultas = []
+    while len(consultas) < qtd_consultas:
+        u = gerador.randrange(qtd_vertices)
+        v = gerador.randrange(qtd_vertices)
+        if u != v:
+            consultas.append((u, v))
+
+    representacoes = [
+        ("Matriz", lambda: grafo.matriz_distancias(), bfs_matriz_adjacencia, existe_aresta_matriz),
+        ("Bits", lambda: MatrizAdjacenciaBits.from_grafo(grafo), bfs_matriz_bits,
+         MatrizAdjacenciaBits.existe_aresta),
+        # O CSR já foi montado na geração; aqui mede-se uma cópia dos seus arrays
+        ("Lista (CSR)", lambda: GrafoCSR(array("q", grafo.inicio), array("q", grafo.vizinhos),
+                                         array("q", grafo.pesos)), bfs_lista_adjacencia, existe_aresta_lista),
+        ("Conjuntos", lambda: construir_conjuntos_vizinhos(grafo), bfs_lista_adjacencia, existe_aresta_conjuntos),
+    ]
+
+    print(f"{'representação':<14} {'memória':>12} {'construção':>11} {'BFS':>9} {'consultas':>10}")
+    referencia = None
+    for nome, construtor, bfs, existe_aresta in representacoes:
+        t0 = time.time()
+        estrutura, memoria = medir_memoria(construtor)
+        tempo_construcao = time.time() - t0
+
+        t0 = time.time()
+        visita = bfs(estrutura, 0)
+        tempo_bfs = time.time() - t0
+
+        t0 = time.time()
+        encontradas = sum(1 for u, v in consultas if existe_aresta(estrutura, u, v))
+        tempo_consultas = time.time() - t0
+
+        # Todas as representações devem concordar entre si
+        if referencia is None:
+            referencia = (sorted(visita), encontradas)
+        assert (sorted(visita), encontradas) == referencia, nome
 
-    # 3) Comparação de uso de memória
-    memoria_matriz = sys.getsizeof(matriz) 
-    memoria_lista = sys.getsizeof(lista_adj)
-    print(f"\n--- Uso de memória (aproximado) ---")
-    print(f"Matriz: ~{memoria_matriz} bytes")
-    print(f"Lista:  ~{memoria_lista} bytes")
+        print(f"{nome:<14} {memoria / 2**20:9.2f} MiB {tempo_construcao:10.3f}s {tempo_bfs:8.3f}s "
+              f"{tempo_consultas:9.4f}s")
+        del estrutura
 
 def main():
     # Comparar representações com a Tabela de 6 bairros (A-F)
     comparar_representacoes_tabela()
 
-    # Se quiser, pode continuar chamando os testes de grafos grandes/esparsos/densos
-    # Aqui só dou exemplo de "como ficaria" se quisesse reutilizar o código original
-    #
-    # from exercicio_original import comparar_representacoes
-    # comparar_representacoes(qtd_vertices=2000, qtd_arestas=3000, qtd_consultas=10000)
-    # comparar_representacoes(qtd_vertices=2000, qtd_arestas=1500000, qtd_consultas=10000)
+    # Grafos grandes: um esparso e um denso, com os mesmos 2000 vértices
+    comparar_representacoes(qtd_vertices=2000, qtd_arestas=3000, qtd_consultas=10000)
+    comparar_representacoes(qtd_vertices=2000, qtd_arestas=1500000, qtd_consultas=10000)
 
 if __name__ == "__main__":
     main()
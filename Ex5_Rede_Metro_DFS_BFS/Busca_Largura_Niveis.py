@@ -0,0 +1,218 @@
+import os
+import sys
+from array import array
+from itertools import compress, filterfalse
+from operator import sub
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Comum"))
+
+from GrafoCSR import GrafoCSR
+
+# Parâmetros da troca de direção (Beamer et al.): passa para "de baixo para cima"
+# quando as arestas da fronteira superam arestas_restantes / ALFA, e volta para
+# "de cima para baixo" quando a fronteira tem menos de n / BETA vértices.
+ALFA = 14
+BETA = 24
+
+
+def bfs_niveis(grafo: GrafoCSR, inicio: int, alfa: float = ALFA, beta: float = BETA) -> tuple:
+    """
+    BFS nível a nível (uma fronteira inteira por vez) sobre um GrafoCSR, com
+    troca de direção:
+
+      - de cima para baixo: cada vértice da fronteira filtra, de uma vez, os
+        vizinhos ainda não visitados (compress sobre o bytearray 'nao_visitado');
+      - de baixo para cima: cada vértice ainda não visitado procura um vizinho
+        na fronteira e para no primeiro, o que compensa quando a fronteira já
+        cobre boa parte do grafo.
+
+    Visitados e fronteira são bytearrays de n posições, e o teste de cada aresta
+    é feito dentro de compress/map: o interpretador trabalha uma vez por vértice
+    examinado, e não uma vez por aresta.
+    Em grafos direcionados só a direção de cima para baixo é usada, pois a outra
+    precisaria das arestas de entrada.
+
+    :param grafo: Grafo com vértices 0..n-1
+    :param inicio: Vértice de origem
+    :param alfa: Quanto maior, mais cedo a busca passa para de baixo para cima
+    :param beta: Quanto maior, mais tarde a busca volta para de cima para baixo
+    :return: (distancias, pais), arrays com o número de saltos desde 'inicio' e
+             o vértice pelo qual cada um foi alcançado; -1 nos não alcançados e
+             pais[inicio] == inicio
+    """
+    distancias, pais, _ = _bfs_niveis(grafo, [inicio], alfa, beta)
+    return distancias, pais
+
+
+def _bfs_niveis(grafo: GrafoCSR, origens: list, alfa: float, beta: float) -> tuple:
+    """
+    Núcleo de bfs_niveis para uma ou mais origens (todas no nível 0).
+    Retorna (distancias, pais, ordem), com 'ordem' listando os vértices
+    alcançados nível a nível.
+    """
+    n = len(grafo)
+    deslocamentos = grafo.inicio
+    vizinhos = grafo.vizinhos
+    distancias = array("q", [-1]) * n
+    pais = array("q", [-1]) * n
+    graus = array("q", map(sub, deslocamentos[1:], deslocamentos[:-1]))
+    nao_visitado = bytearray(b"\x01") * n
+    fronteira = []
+    for origem in origens:
+        if nao_visitado[origem]:
+            nao_visitado[origem] = 0
+            distancias[origem] = 0
+            pais[origem] = origem
+            fronteira.append(origem)
+
+    ordem = list(fronteira)
+    arestas_fronteira = sum(map(graus.__getitem__, fronteira))
+    arestas_restantes = len(vizinhos) - arestas_fronteira
+    restantes = None
+    de_baixo_para_cima = False
+    nivel = 0
+
+    while fronteira:
+        nivel += 1
+        if grafo.direcionado:
+            de_baixo_para_cima = False
+        elif not de_baixo_para_cima:
+            de_baixo_para_cima = arestas_fronteira > arestas_restantes / alfa
+        else:
+            de_baixo_para_cima = len(fronteira) >= n / beta
+
+        proxima = []
+        if de_baixo_para_cima:
+            na_fronteira = bytearray(n)
+            for u in fronteira:
+                na_fronteira[u] = 1
+            esta_na_fronteira = na_fronteira.__getitem__
+            # Vértices ainda não visitados, refiltrados a cada nível
+            if restantes is None:
+                restantes = list(compress(range(n), nao_visitado))
+            else:
+                restantes = list(compress(restantes, map(nao_visitado.__getitem__, restantes)))
+            for v in restantes:
+                candidatos = vizinhos[deslocamentos[v]:deslocamentos[v + 1]]
+                # compress é preguiçoso: next para no primeiro vizinho na fronteira
+                u = next(compress(candidatos, map(esta_na_fronteira, candidatos)), -1)
+                if u >= 0:
+                    pais[v] = u
+                    distancias[v] = nivel
+                    proxima.append(v)
+            for v in proxima:
+                nao_visitado[v] = 0
+        else:
+            ainda_nao_visitado = nao_visitado.__getitem__
+            for u in fronteira:
+                candidatos = vizinhos[deslocamentos[u]:deslocamentos[u + 1]]
+                # Como compress é preguiçoso, um vizinho marcado aqui já é
+                # filtrado se aparecer de novo (arestas repetidas)
+                for v in compress(candidatos, map(ainda_nao_visitado, candidatos)):
+                    nao_visitado[v] = 0
+                    pais[v] = u
+                    distancias[v] = nivel
+                    proxima.append(v)
+
+        arestas_fronteira = sum(map(graus.__getitem__, proxima))
+        arestas_restantes -= arestas_fronteira
+        ordem += proxima
+        fronteira = proxima
+
+    return distancias, pais, ordem
+
+
+def bfs_multiplas_origens(grafo: GrafoCSR, origens, alfa: float = ALFA, beta: float = BETA) -> tuple:
+    """
+    BFS a partir de várias origens ao mesmo tempo (ex.: todos os depósitos), com
+    a mesma troca de direção de bfs_niveis: numa única travessia, cada vértice
+    fica com a distância até a origem mais próxima e com qual origem é essa.
+
+    :param origens: Vértices de origem
+    :return: (distancias, pais, mais_proxima): saltos até a origem mais próxima,
+             pai no caminho vindo dela (caminho_ate reconstrói o caminho) e a
+             própria origem; -1 nos vértices não alcançados. Em empates, vale a
+             origem cujo caminho foi encontrado primeiro.
+    """
+    distancias, pais, ordem = _bfs_niveis(grafo, list(origens), alfa, beta)
+    mais_proxima = array("q", [-1]) * len(grafo)
+    # Em 'ordem' o pai sempre vem antes do filho
+    for v in ordem:
+        pai = pais[v]
+        mais_proxima[v] = v if pai == v else mais_proxima[pai]
+    return distancias, pais, mais_proxima
+
+
+def bfs_bidirecional(grafo: GrafoCSR, origem: int, destino: int) -> tuple:
+    """
+    Menor número de saltos entre dois vértices de um grafo não direcionado,
+    com buscas simultâneas a partir da origem e do destino. A cada passo
+    expande-se um nível inteiro do lado com a fronteira menor, e a busca para
+    na primeira aresta que liga as duas: como cada lado já cobriu todos os
+    vértices até a profundidade da sua fronteira, esse encontro é o caminho
+    mínimo. Só os vértices visitados são tocados (dicionários de pais, em vez
+    de arrays de n posições), então a consulta custa algo próximo de duas
+    buscas até a metade da distância, e não uma travessia do grafo inteiro.
+
+    :return: (saltos, caminho), com o caminho da origem ao destino;
+             (-1, []) se não houver caminho
+    Lança ValueError se o grafo for direcionado.
+    """
+    if grafo.direcionado:
+        raise ValueError("bfs_bidirecional exige um grafo não direcionado.")
+    if origem == destino:
+        return 0, [origem]
+
+    deslocamentos = grafo.inicio
+    vizinhos = grafo.vizinhos
+    pais = [{origem: origem}, {destino: destino}]
+    fronteiras = [[origem], [destino]]
+
+    while fronteiras[0] and fronteiras[1]:
+        lado = 0 if len(fronteiras[0]) <= len(fronteiras[1]) else 1
+        pais_lado = pais[lado]
+        ja_no_outro_lado = pais[1 - lado].__contains__
+        ja_visitado = pais_lado.__contains__
+        proxima = []
+        for u in fronteiras[lado]:
+            candidatos = vizinhos[deslocamentos[u]:deslocamentos[u + 1]]
+            encontro = next(filter(ja_no_outro_lado, candidatos), None)
+            if encontro is not None:
+                caminho = _subir(pais_lado, u)
+                caminho.reverse()
+                caminho += _subir(pais[1 - lado], encontro)
+                if lado == 1:
+                    caminho.reverse()
+                return len(caminho) - 1, caminho
+            # filterfalse é preguiçoso: um vizinho repetido já aparece como visitado
+            for v in filterfalse(ja_visitado, candidatos):
+                pais_lado[v] = u
+                proxima.append(v)
+        fronteiras[lado] = proxima
+
+    return -1, []
+
+
+def _subir(pais: dict, vertice: int) -> list:
+    """
+    Caminho de 'vertice' até a raiz da busca que preencheu 'pais'.
+    """
+    caminho = [vertice]
+    while pais[caminho[-1]] != caminho[-1]:
+        caminho.append(pais[caminho[-1]])
+    return caminho
+
+
+def caminho_ate(pais, destino: int) -> list:
+    """
+    Reconstrói o caminho da origem até 'destino' a partir do array de pais
+    devolvido por bfs_niveis (ou bfs_multiplas_origens, a partir da origem
+    mais próxima), ou [] se 'destino' não foi alcançado.
+    """
+    if pais[destino] < 0:
+        return []
+    caminho = [destino]
+    while pais[caminho[-1]] != caminho[-1]:
+        caminho.append(pais[caminho[-1]])
+    caminho.reverse()
+    return caminho
@@ -0,0 +1,192 @@
+import os
+import sys
+from array import array
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Comum"))
+
+from GrafoCSR import GrafoCSR
+
+
+def busca_profundidade(grafo: GrafoCSR, raizes=None) -> tuple:
+    """
+    DFS iterativa sobre um GrafoCSR, com uma pilha explícita de vértices e a
+    posição do próximo vizinho de cada um (sem recursão, então não há limite
+    de profundidade). Cada raiz ainda não visitada inicia uma nova árvore, e
+    os vizinhos são explorados na ordem do CSR, como na dfs_recursivo.
+
+    :param grafo: Grafo com vértices 0..n-1
+    :param raizes: Vértices de onde começar, em ordem; None usa 0..n-1 (floresta completa)
+    :return: (ordem, pais, entrada, pos_ordem): vértices em pré-ordem; o pai
+             de cada vértice na árvore (a raiz é pai de si mesma, -1 se não
+             visitado); a posição de cada vértice na pré-ordem (-1 se não
+             visitado); e os vértices na ordem em que terminaram (pós-ordem)
+    """
+    n = len(grafo)
+    deslocamentos = grafo.inicio
+    vizinhos = grafo.vizinhos
+    pais = array("q", [-1]) * n
+    entrada = array("q", [-1]) * n
+    ordem = array("q")
+    pos_ordem = array("q")
+
+    for raiz in range(n) if raizes is None else raizes:
+        if entrada[raiz] >= 0:
+            continue
+        pais[raiz] = raiz
+        entrada[raiz] = len(ordem)
+        ordem.append(raiz)
+        pilha = [raiz]
+        # proximo[i] = posição, em 'vizinhos', do próximo vizinho de pilha[i] a examinar
+        proximo = [deslocamentos[raiz]]
+        while pilha:
+            u = pilha[-1]
+            posicao = proximo[-1]
+            fim = deslocamentos[u + 1]
+            while posicao < fim and entrada[vizinhos[posicao]] >= 0:
+                posicao += 1
+            if posicao < fim:
+                v = vizinhos[posicao]
+                proximo[-1] = posicao + 1
+                pais[v] = u
+                entrada[v] = len(ordem)
+                ordem.append(v)
+                pilha.append(v)
+                proximo.append(deslocamentos[v])
+            else:
+                pilha.pop()
+                proximo.pop()
+                pos_ordem.append(u)
+
+    return ordem, pais, entrada, pos_ordem
+
+
+def _exigir_nao_direcionado(grafo: GrafoCSR, analise: str):
+    if grafo.direcionado:
+        raise ValueError(f"{analise} exige um grafo não direcionado.")
+
+
+def componentes_conexas(grafo: GrafoCSR) -> tuple:
+    """
+    Separa o grafo não direcionado em componentes conexas.
+
+    :return: (componente, quantidade), onde componente[v] é o número (0..quantidade-1)
+             da componente de v, na ordem em que as raízes aparecem
+    """
+    _exigir_nao_direcionado(grafo, "componentes_conexas")
+    ordem, pais, _, _ = busca_profundidade(grafo)
+    componente = array("q", [-1]) * len(grafo)
+    quantidade = 0
+    # Na pré-ordem o pai sempre vem antes do filho
+    for v in ordem:
+        pai = pais[v]
+        if pai == v:
+            componente[v] = quantidade
+            quantidade += 1
+        else:
+            componente[v] = componente[pai]
+    return componente, quantidade
+
+
+def possui_ciclo(grafo: GrafoCSR) -> bool:
+    """
+    Indica se o grafo tem ciclo (laços e arestas repetidas contam).
+
+    Não direcionado: uma floresta com c componentes tem exatamente n - c arestas,
+    então qualquer aresta a mais fecha um ciclo.
+    Direcionado: há ciclo se alguma aresta u->v não avança na ordem inversa de
+    término da DFS (v terminou depois de u, ou v == u), o que só acontece com
+    arestas de retorno.
+    """
+    if not grafo.direcionado:
+        _, quantidade = componentes_conexas(grafo)
+        return grafo.quantidade_arestas() > len(grafo) - quantidade
+    return _aresta_de_retorno(grafo, busca_profundidade(grafo)[3]) is not None
+
+
+def _aresta_de_retorno(grafo: GrafoCSR, pos_ordem) -> tuple:
+    """
+    Retorna uma aresta (u, v) de um grafo direcionado que volta na ordem
+    topológica candidata (inverso da pós-ordem), ou None se não houver.
+    """
+    termino = array("q", bytes(8 * len(grafo)))
+    for posicao, v in enumerate(pos_ordem):
+        termino[v] = posicao
+    deslocamentos = grafo.inicio
+    vizinhos = grafo.vizinhos
+    for u in range(len(grafo)):
+        termino_u = termino[u]
+        for posicao in range(deslocamentos[u], deslocamentos[u + 1]):
+            v = vizinhos[posicao]
+            if termino[v] >= termino_u:
+                return u, v
+    return None
+
+
+def ordem_topologica(grafo: GrafoCSR) -> list:
+    """
+    Ordem topológica de um grafo direcionado acíclico: toda aresta u->v tem
+    u antes de v. É o inverso da pós-ordem da DFS.
+    Lança ValueError se o grafo não for direcionado ou tiver ciclo.
+    """
+    if not grafo.direcionado:
+        raise ValueError("ordem_topologica exige um grafo direcionado.")
+    pos_ordem = busca_profundidade(grafo)[3]
+    aresta = _aresta_de_retorno(grafo, pos_ordem)
+    if aresta is not None:
+        raise ValueError(f"O grafo tem ciclo (aresta {aresta[0]}->{aresta[1]}); não há ordem topológica.")
+    ordem = list(pos_ordem)
+    ordem.reverse()
+    return ordem
+
+
+def pontes_e_articulacoes(grafo: GrafoCSR) -> tuple:
+    """
+    Pontes (arestas cuja remoção desconecta o grafo) e pontos de articulação
+    (vértices cuja remoção desconecta o grafo) de um grafo não direcionado, pelo
+    método de Tarjan: low[v] é a menor pré-ordem alcançável a partir da
+    subárvore de v usando uma única aresta que não seja da árvore. Os valores
+    são calculados em pré-ordem inversa, de modo que os filhos vêm antes dos pais.
+
+    :return: (pontes, articulacoes): lista de (pai, filho) e lista de vértices, ambas
+             na ordem em que aparecem na DFS
+    """
+    _exigir_nao_direcionado(grafo, "pontes_e_articulacoes")
+    ordem, pais, entrada, _ = busca_profundidade(grafo)
+    deslocamentos = grafo.inicio
+    vizinhos = grafo.vizinhos
+    low = array("q", entrada)
+    filhos = array("q", bytes(8 * len(grafo)))
+    articulacao = bytearray(len(grafo))
+    pontes = []
+
+    for v in reversed(ordem):
+        pai = pais[v]
+        low_v = low[v]
+        aresta_do_pai_vista = False
+        for posicao in range(deslocamentos[v], deslocamentos[v + 1]):
+            w = vizinhos[posicao]
+            if pais[w] == v and w != v:
+                # Filho na árvore (uma aresta repetida cai aqui também, sem alterar o mínimo)
+                if low[w] < low_v:
+                    low_v = low[w]
+            elif w == pai and not aresta_do_pai_vista:
+                # A aresta da árvore até o pai é ignorada uma vez; cópias dela contam
+                aresta_do_pai_vista = True
+            elif entrada[w] < low_v:
+                low_v = entrada[w]
+        low[v] = low_v
+
+        if pai != v:
+            filhos[pai] += 1
+            if low_v > entrada[pai]:
+                pontes.append((pai, v))
+            if low_v >= entrada[pai] and pais[pai] != pai:
+                articulacao[pai] = 1
+
+    # Uma raiz é articulação se tiver mais de um filho na árvore
+    for v in ordem:
+        if pais[v] == v and filhos[v] > 1:
+            articulacao[v] = 1
+
+    pontes.reverse()
+    return pontes, [v for v in ordem if articulacao[v]]
@@ -1,9 +1,29 @@
+import os
+import sys
 from collections import deque
 
-def criar_grafo_metro():
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Comum"))
+
+from GrafoCSR import GrafoCSR
+from Busca_Largura_Niveis import bfs_niveis, bfs_multiplas_origens, bfs_bidirecional, caminho_ate
+from Busca_Profundidade import componentes_conexas, possui_ciclo, pontes_e_articulacoes
+
+# Linhas do metrô: cada par é uma ligação entre duas estações vizinhas
+ARESTAS_METRO = [
+    ('A', 'B'),
+    ('A', 'C'),
+    ('B', 'D'),
+    ('B', 'E'),
+    ('C', 'F'),
+    ('D', 'E'),
+    ('E', 'F'),
+]
+
+def criar_grafo_metro(caminho_arestas: str = None) -> GrafoCSR:
     """
     Define as conexões (arestas) da rede de metrô (grafo não direcionado)
-    usando lista de adjacência.
+    usando lista de adjacência em formato CSR. As estações viram ids 0..n-1
+    (A=0, B=1, ...); grafo.id_de / grafo.rotulo_de convertem entre os dois.
     
     Mapa simplificado:
     - A <-> B, A <-> C
@@ -12,16 +32,12 @@ def criar_grafo_metro():
     - D <-> B, D <-> E
     - E <-> B, E <-> D, E <-> F
     - F <-> C, F <-> E
+
+    :param caminho_arestas: CSV opcional (origem,destino) com outra rede
     """
-    grafo = {
-        'A': ['B', 'C'],
-        'B': ['A', 'D', 'E'],
-        'C': ['A', 'F'],
-        'D': ['B', 'E'],
-        'E': ['B', 'D', 'F'],
-        'F': ['C', 'E']
-    }
-    return grafo
+    if caminho_arestas is not None:
+        return GrafoCSR.carregar_csv(caminho_arestas)
+    return GrafoCSR.from_arestas(ARESTAS_METRO)
 
 def bfs(grafo, inicio):
     """
@@ -57,26 +73,75 @@ def dfs_recursivo(grafo, vertice, visitados, ordem_visita):
         if vizinho not in visitados:
             dfs_recursivo(grafo, vizinho, visitados, ordem_visita)
 
-def dfs(grafo, inicio):
+def dfs_iterativo(grafo, inicio):
     """
-    Implementação da Busca em Profundidade (DFS) chamando a função recursiva.
+    DFS com pilha explícita: cada entrada guarda um vértice e o iterador dos
+    seus vizinhos, retomado de onde parou quando a busca volta a ele. Visita
+    na mesma ordem que dfs_recursivo, mas sem limite de profundidade
+    (a versão recursiva lança RecursionError em caminhos com ~1000 estações).
     """
-    visitados = set()
-    ordem_visita = []
-    dfs_recursivo(grafo, inicio, visitados, ordem_visita)
+    visitados = {inicio}
+    ordem_visita = [inicio]
+    pilha = [iter(grafo[inicio])]
+
+    while pilha:
+        for vizinho in pilha[-1]:
+            if vizinho not in visitados:
+                visitados.add(vizinho)
+                ordem_visita.append(vizinho)
+                pilha.append(iter(grafo[vizinho]))
+                break
+        else:
+            # Todos os vizinhos do topo foram examinados: volta um nível
+            pilha.pop()
     return ordem_visita
 
+def dfs(grafo, inicio):
+    """
+    Implementação da Busca em Profundidade (DFS) com pilha explícita (dfs_iterativo).
+    """
+    return dfs_iterativo(grafo, inicio)
+
 def main():
     # 1) Criar o grafo (lista de adjacência)
     grafo_metro = criar_grafo_metro()
     
+    inicio = grafo_metro.id_de('A')
+
     # 2) Executar BFS a partir da Estação A
-    ordem_bfs = bfs(grafo_metro, 'A')
+    ordem_bfs = [grafo_metro.rotulo_de(v) for v in bfs(grafo_metro, inicio)]
     print("Ordem de visita (BFS) a partir de A:", ordem_bfs)
     
     # 3) Executar DFS a partir da Estação A
-    ordem_dfs = dfs(grafo_metro, 'A')
+    ordem_dfs = [grafo_metro.rotulo_de(v) for v in dfs(grafo_metro, inicio)]
     print("Ordem de visita (DFS) a partir de A:", ordem_dfs)
+
+    # 3b) BFS nível a nível: número de saltos e estação anterior de cada uma
+    distancias, pais = bfs_niveis(grafo_metro, inicio)
+    print("Saltos a partir de A:", {grafo_metro.rotulo_de(v): distancias[v] for v in grafo_metro})
+    caminho = [grafo_metro.rotulo_de(v) for v in caminho_ate(pais, grafo_metro.id_de('F'))]
+    print("Caminho com menos saltos de A até F:", " -> ".join(caminho))
+
+    # 3c) Consulta ponto a ponto: para assim que as buscas de D e de C se encontram
+    saltos, caminho = bfs_bidirecional(grafo_metro, grafo_metro.id_de('D'), grafo_metro.id_de('C'))
+    print(f"Menos saltos de D até C: {' -> '.join(grafo_metro.rotulo_de(v) for v in caminho)} ({saltos} saltos)")
+
+    # 3d) Várias origens: depósito mais próximo de cada estação (depósitos em A e F)
+    distancias, pais, deposito = bfs_multiplas_origens(grafo_metro, [grafo_metro.id_de('A'), grafo_metro.id_de('F')])
+    for v in grafo_metro:
+        rota = " -> ".join(grafo_metro.rotulo_de(w) for w in caminho_ate(pais, v))
+        print(f"  Estação {grafo_metro.rotulo_de(v)}: depósito {grafo_metro.rotulo_de(deposito[v])}, "
+              f"{distancias[v]} saltos ({rota})")
+
+    # 3e) Análises da rede baseadas na DFS
+    _, quantidade = componentes_conexas(grafo_metro)
+    pontes, articulacoes = pontes_e_articulacoes(grafo_metro)
+    print("Componentes conexas:", quantidade)
+    print("A rede tem ciclo (rota alternativa)?", "Sim" if possui_ciclo(grafo_metro) else "Não")
+    print("Estações críticas (articulações):",
+          [grafo_metro.rotulo_de(v) for v in articulacoes] or "nenhuma")
+    print("Trechos críticos (pontes):",
+          [f"{grafo_metro.rotulo_de(u)}-{grafo_metro.rotulo_de(v)}" for u, v in pontes] or "nenhum")
     
     # 4) Discussão sobre as diferenças:
     print("\n--- Comparação BFS vs DFS ---")
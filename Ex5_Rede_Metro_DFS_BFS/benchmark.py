@@ -0,0 +1,178 @@
+import random
+import time
+from array import array
+
+from Ex5_Rede_Metro import bfs, dfs, dfs_recursivo
+from Busca_Largura_Niveis import bfs_niveis, bfs_multiplas_origens, bfs_bidirecional, caminho_ate
+from Busca_Profundidade import (busca_profundidade, componentes_conexas, possui_ciclo, ordem_topologica,
+                                pontes_e_articulacoes)
+from GrafoCSR import GrafoCSR
+
+
+def gerar_rede_aleatoria(qtd_vertices: int, qtd_arestas: int, semente: int = 0) -> GrafoCSR:
+    """
+    Grafo não direcionado com arestas sorteadas entre vértices quaisquer:
+    poucos níveis (diâmetro pequeno) e fronteiras enormes no meio da busca.
+    """
+    gerador = random.Random(semente)
+    origens = array("q", (gerador.randrange(qtd_vertices) for _ in range(qtd_arestas)))
+    destinos = array("q", (gerador.randrange(qtd_vertices) for _ in range(qtd_arestas)))
+    return GrafoCSR.from_ids(origens, destinos, array("q", [1]) * qtd_arestas, qtd_vertices)
+
+
+def gerar_malha(lado: int) -> GrafoCSR:
+    """
+    Malha lado x lado, como uma rede viária: cada vértice liga-se ao da direita
+    e ao de baixo, então há muitos níveis e fronteiras pequenas.
+    """
+    origens = array("q")
+    destinos = array("q")
+    for linha in range(lado):
+        for coluna in range(lado):
+            vertice = linha * lado + coluna
+            if coluna + 1 < lado:
+                origens.append(vertice)
+                destinos.append(vertice + 1)
+            if linha + 1 < lado:
+                origens.append(vertice)
+                destinos.append(vertice + lado)
+    return GrafoCSR.from_ids(origens, destinos, array("q", [1]) * len(origens), lado * lado)
+
+
+def benchmark_bfs_niveis(qtd_vertices: int = 1_000_000, qtd_arestas: int = 4_000_000, lado: int = 700):
+    """
+    Compara a bfs vértice a vértice (deque + set) com a bfs_niveis só de cima
+    para baixo e com troca de direção, numa rede aleatória e numa malha.
+    """
+    grafos = [
+        (f"aleatória ({qtd_vertices} vértices, {qtd_arestas} arestas)",
+         lambda: gerar_rede_aleatoria(qtd_vertices, qtd_arestas)),
+        (f"malha {lado}x{lado}", lambda: gerar_malha(lado)),
+    ]
+    for nome, gerar in grafos:
+        print(f"\n=== BFS em rede {nome} ===")
+        t0 = time.perf_counter()
+        grafo = gerar()
+        print(f"Construção do CSR: {time.perf_counter() - t0:.2f}s")
+
+        t0 = time.perf_counter()
+        ordem = bfs(grafo, 0)
+        print(f"bfs (deque + set)              {time.perf_counter() - t0:7.2f}s")
+
+        t0 = time.perf_counter()
+        # alfa minúsculo: a troca para de baixo para cima nunca acontece
+        distancias, _ = bfs_niveis(grafo, 0, alfa=1e-12)
+        print(f"bfs_niveis (de cima para baixo) {time.perf_counter() - t0:6.2f}s")
+
+        t0 = time.perf_counter()
+        distancias_troca, pais = bfs_niveis(grafo, 0)
+        print(f"bfs_niveis (troca de direção)   {time.perf_counter() - t0:6.2f}s")
+
+        alcancados = len(grafo) - distancias.count(-1)
+        assert alcancados == len(ordem)
+        assert distancias == distancias_troca
+        print(f"{alcancados} vértices alcançados, {max(distancias)} níveis")
+
+
+def benchmark_dfs(qtd_vertices: int = 1_000_000, qtd_arestas: int = 2_000_000):
+    """
+    DFS e análises sobre ela em grafos de 'qtd_vertices' vértices: uma linha
+    (profundidade máxima, onde a dfs_recursivo estoura a pilha), uma rede
+    aleatória e um grafo direcionado acíclico aleatório.
+    """
+    print(f"\n=== DFS em linha com {qtd_vertices} estações ===")
+    linha = GrafoCSR.from_ids(array("q", range(qtd_vertices - 1)), array("q", range(1, qtd_vertices)),
+                              array("q", [1]) * (qtd_vertices - 1), qtd_vertices)
+    try:
+        dfs_recursivo(linha, 0, set(), [])
+        print("dfs_recursivo: concluída")
+    except RecursionError:
+        print("dfs_recursivo: RecursionError")
+    t0 = time.perf_counter()
+    ordem = dfs(linha, 0)
+    print(f"dfs (pilha explícita)   {time.perf_counter() - t0:6.2f}s")
+    t0 = time.perf_counter()
+    ordem_csr = busca_profundidade(linha, [0])[0]
+    print(f"busca_profundidade      {time.perf_counter() - t0:6.2f}s")
+    assert ordem == list(ordem_csr) == list(range(qtd_vertices))
+
+    print(f"\n=== Análises em rede aleatória ({qtd_vertices} vértices, {qtd_arestas} arestas) ===")
+    rede = gerar_rede_aleatoria(qtd_vertices, qtd_arestas)
+    t0 = time.perf_counter()
+    _, quantidade = componentes_conexas(rede)
+    print(f"componentes_conexas     {time.perf_counter() - t0:6.2f}s  ({quantidade} componentes)")
+    t0 = time.perf_counter()
+    ciclo = possui_ciclo(rede)
+    print(f"possui_ciclo            {time.perf_counter() - t0:6.2f}s  ({ciclo})")
+    t0 = time.perf_counter()
+    pontes, articulacoes = pontes_e_articulacoes(rede)
+    print(f"pontes_e_articulacoes   {time.perf_counter() - t0:6.2f}s  "
+          f"({len(pontes)} pontes, {len(articulacoes)} articulações)")
+
+    print(f"\n=== Ordem topológica em DAG aleatório ({qtd_vertices} vértices, {qtd_arestas} arestas) ===")
+    gerador = random.Random(1)
+    origens = array("q")
+    destinos = array("q")
+    for _ in range(qtd_arestas):
+        u = gerador.randrange(qtd_vertices - 1)
+        origens.append(u)
+        destinos.append(gerador.randrange(u + 1, qtd_vertices))
+    dag = GrafoCSR.from_ids(origens, destinos, array("q", [1]) * qtd_arestas, qtd_vertices, direcionado=True)
+    t0 = time.perf_counter()
+    ordem = ordem_topologica(dag)
+    print(f"ordem_topologica        {time.perf_counter() - t0:6.2f}s")
+    assert len(ordem) == qtd_vertices
+
+
+def benchmark_consultas(qtd_vertices: int = 1_000_000, qtd_arestas: int = 4_000_000, lado: int = 700,
+                        consultas: int = 200, travessias: int = 3, depositos: int = 100):
+    """
+    Latência de 'menos saltos de X até Y': bfs_bidirecional em 'consultas' pares
+    sorteados contra uma travessia completa (bfs_niveis + caminho_ate) em
+    'travessias' deles; e o depósito mais próximo de todas as estações com
+    bfs_multiplas_origens contra uma bfs_niveis por depósito.
+    """
+    grafos = [
+        (f"aleatória ({qtd_vertices} vértices, {qtd_arestas} arestas)",
+         lambda: gerar_rede_aleatoria(qtd_vertices, qtd_arestas)),
+        (f"malha {lado}x{lado}", lambda: gerar_malha(lado)),
+    ]
+    for nome, gerar in grafos:
+        print(f"\n=== Consultas de menor número de saltos em rede {nome} ===")
+        grafo = gerar()
+        gerador = random.Random(2)
+        pares = [(gerador.randrange(len(grafo)), gerador.randrange(len(grafo))) for _ in range(consultas)]
+
+        t0 = time.perf_counter()
+        respostas = [bfs_bidirecional(grafo, origem, destino) for origem, destino in pares]
+        tempo_bidirecional = (time.perf_counter() - t0) / consultas
+        print(f"bfs_bidirecional            {tempo_bidirecional * 1e3:9.2f} ms/consulta")
+
+        t0 = time.perf_counter()
+        for (origem, destino), (saltos, caminho) in zip(pares[:travessias], respostas):
+            distancias, pais = bfs_niveis(grafo, origem)
+            assert distancias[destino] == saltos and len(caminho_ate(pais, destino)) == len(caminho)
+        tempo_completo = (time.perf_counter() - t0) / travessias
+        print(f"travessia completa          {tempo_completo * 1e3:9.2f} ms/consulta "
+              f"({tempo_completo / tempo_bidirecional:.0f}x)")
+
+        origens = gerador.sample(range(len(grafo)), depositos)
+        t0 = time.perf_counter()
+        distancias, _, _ = bfs_multiplas_origens(grafo, origens)
+        tempo_multiplas = time.perf_counter() - t0
+        print(f"bfs_multiplas_origens ({depositos} depósitos) {tempo_multiplas:6.2f}s")
+        t0 = time.perf_counter()
+        distancias_uma, _ = bfs_niveis(grafo, origens[0])
+        tempo_uma = time.perf_counter() - t0
+        assert all(distancia <= distancia_uma for distancia, distancia_uma in zip(distancias, distancias_uma))
+        print(f"uma bfs_niveis por depósito {tempo_uma * depositos:6.2f}s (estimado: {depositos} x {tempo_uma:.2f}s)")
+
+
+def main():
+    benchmark_bfs_niveis()
+    benchmark_dfs()
+    benchmark_consultas()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,35 @@
 import math
+import os
+import sys
 from heapq import heappush, heappop
 
-def criar_grafo_bairros():
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Comum"))
+
+from GrafoCSR import GrafoCSR
+
+# Tabela 'De -> Para' das ruas entre o CD e os bairros: (origem, destino, km)
+ARESTAS_BAIRROS = [
+    ('CD', 'A', 4), ('CD', 'B', 2),
+    ('A', 'C', 5), ('A', 'D', 10),
+    ('B', 'A', 3), ('B', 'D', 8),
+    ('C', 'D', 2), ('C', 'E', 4),
+    ('D', 'E', 6), ('D', 'F', 5),
+    ('E', 'F', 3),
+    # F não tem saída listada
+]
+
+def criar_grafo_bairros(caminho_arestas: str = None) -> GrafoCSR:
     """
-    Retorna um grafo (dicionário) onde cada chave é um bairro
-    e cada valor é uma lista de tuplas (vizinho, distancia).
+    Retorna um grafo em formato CSR onde cada bairro é um id (CD=0, A=1, ...)
+    e grafo.ponderado()[u] é a lista de tuplas (vizinho, distancia).
     
     Aqui, interpretamos a tabela como 'De -> Para' em um grafo DIRECIONADO.
+
+    :param caminho_arestas: CSV opcional (origem,destino,km) com outra malha de ruas
     """
-    grafo = {
-        'CD': [('A', 4), ('B', 2)],  # CD->A=4, CD->B=2
-        'A':  [('C', 5), ('D', 10)], # A->C=5, A->D=10
-        'B':  [('A', 3), ('D', 8)],  # B->A=3, B->D=8
-        'C':  [('D', 2), ('E', 4)],  # C->D=2, C->E=4
-        'D':  [('E', 6), ('F', 5)],  # D->E=6, D->F=5
-        'E':  [('F', 3)],           # E->F=3
-        'F':  []                    # F não tem saída listada
-    }
-    return grafo
+    if caminho_arestas is not None:
+        return GrafoCSR.carregar_csv(caminho_arestas, direcionado=True)
+    return GrafoCSR.from_arestas(ARESTAS_BAIRROS, direcionado=True)
 
 def dijkstra(grafo, origem, destino):
     """
@@ -79,8 +91,9 @@ def main():
     origem = 'CD'
     destino = 'F'
 
-    # 3) Executa Dijkstra
-    distancia_minima, caminho_otimo = dijkstra(grafo, origem, destino)
+    # 3) Executa Dijkstra sobre os ids e converte o caminho de volta para bairros
+    distancia_minima, caminho_ids = dijkstra(grafo.ponderado(), grafo.id_de(origem), grafo.id_de(destino))
+    caminho_otimo = [grafo.rotulo_de(v) for v in caminho_ids]
 
     # 4) Exibe resultado
     print(f"Menor rota de {origem} até {destino} encontrada pelo Dijkstra:")
@@ -1,6 +1,30 @@
 import math
+import os
+import sys
 
-def criar_matriz_de_adjacencia():
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Comum"))
+
+from GrafoCSR import GrafoCSR
+
+# Tabela direcionada entre os bairros: (origem, destino, distância)
+ARESTAS_BAIRROS = [
+    ('A', 'B', 5), ('A', 'C', 10),
+    ('B', 'C', 3), ('B', 'D', 8),
+    ('C', 'D', 2), ('C', 'E', 7),
+    ('D', 'E', 4), ('D', 'F', 6),
+    ('E', 'F', 5),
+]
+
+def criar_grafo_bairros(caminho_arestas: str = None) -> GrafoCSR:
+    """
+    Cria o grafo DIRECIONADO dos bairros em formato CSR, a partir de um CSV
+    (origem,destino,distância) ou, sem arquivo, da tabela acima.
+    """
+    if caminho_arestas is not None:
+        return GrafoCSR.carregar_csv(caminho_arestas, direcionado=True)
+    return GrafoCSR.from_arestas(ARESTAS_BAIRROS, direcionado=True)
+
+def criar_matriz_de_adjacencia(grafo: GrafoCSR = None):
     """
     Cria e retorna uma matriz de adjacência 6x6 para os bairros A-F,
     de forma DIRECIONADA, baseado na tabela:
@@ -10,40 +34,14 @@ def criar_matriz_de_adjacencia():
       D->E=4, D->F=6,
       E->F=5
     Para fazer um grafo não-direcionado, duplicaríamos cada aresta no sentido inverso.
+    Células sem aresta valem ∞ e a diagonal vale 0.
     
     Índices:
       A -> 0, B -> 1, C -> 2, D -> 3, E -> 4, F -> 5
     """
-    INF = math.inf
-    n = 6
-    # Inicializa tudo com ∞
-    matriz = [[INF] * n for _ in range(n)]
-
-    # Distância de um bairro para ele mesmo = 0
-    for i in range(n):
-        matriz[i][i] = 0
-
-    # Preenche de acordo com a tabela (direcionada):
-    # A(0)->B(1)=5
-    matriz[0][1] = 5
-    # A(0)->C(2)=10
-    matriz[0][2] = 10
-    # B(1)->C(2)=3
-    matriz[1][2] = 3
-    # B(1)->D(3)=8
-    matriz[1][3] = 8
-    # C(2)->D(3)=2
-    matriz[2][3] = 2
-    # C(2)->E(4)=7
-    matriz[2][4] = 7
-    # D(3)->E(4)=4
-    matriz[3][4] = 4
-    # D(3)->F(5)=6
-    matriz[3][5] = 6
-    # E(4)->F(5)=5
-    matriz[4][5] = 5
-
-    return matriz
+    if grafo is None:
+        grafo = criar_grafo_bairros()
+    return grafo.matriz_distancias()
 
 def floyd_warshall(distancias):
     """
@@ -60,12 +58,11 @@ def floyd_warshall(distancias):
                     distancias[i][j] = distancias[i][k] + distancias[k][j]
     return distancias
 
-def imprimir_matriz(distancias):
+def imprimir_matriz(distancias, rotulo=('A', 'B', 'C', 'D', 'E', 'F')):
     """
     Imprime a matriz de distâncias de forma organizada.
     """
     n = len(distancias)
-    rotulo = ['A','B','C','D','E','F']
     print("Matriz de Menores Distâncias (Floyd-Warshall):\n")
 
     # Cabeçalho
@@ -87,18 +84,19 @@ def imprimir_matriz(distancias):
 
 def main():
     # 1) Criar a matriz de adjacência conforme a tabela
-    matriz = criar_matriz_de_adjacencia()
+    grafo = criar_grafo_bairros()
+    matriz = criar_matriz_de_adjacencia(grafo)
 
     # 2) Aplicar Floyd-Warshall
     floyd_warshall(matriz)
 
     # 3) Imprimir a matriz resultante
-    imprimir_matriz(matriz)
+    imprimir_matriz(matriz, grafo.rotulos)
 
     # 4) Questões
     #    a) Tempo mínimo de A até F?
     #       A=0, F=5
-    distancia_A_F = matriz[0][5]
+    distancia_A_F = matriz[grafo.id_de('A')][grafo.id_de('F')]
     print(f"\n1) Distância mínima de A até F: {distancia_A_F if distancia_A_F < math.inf else 'Sem rota'}")
 
     print("\n2) Se uma rua fosse fechada, poderíamos definir a aresta como inf. "